@@ -0,0 +1,76 @@
+"""Add stored tsvector columns to documents and chunks
+
+Revision ID: 34
+Revises: 33
+
+Changes:
+1. Add search_vector column (stored generated tsvector of content) to documents and chunks
+2. Replace the to_tsvector expression GIN indexes with GIN indexes on search_vector
+"""
+
+from collections.abc import Sequence
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "34"
+down_revision: str | None = "33"
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+# (table, new index, old expression index)
+SEARCH_VECTOR_TABLES = [
+    ("documents", "document_search_vector_index", "document_search_index"),
+    ("chunks", "chucks_search_vector_index", "chucks_search_index"),
+]
+
+
+def upgrade() -> None:
+    """Add stored tsvector columns and their GIN indexes."""
+
+    from sqlalchemy import inspect
+
+    conn = op.get_bind()
+    inspector = inspect(conn)
+
+    for table, index_name, old_index_name in SEARCH_VECTOR_TABLES:
+        # Get existing columns
+        columns = [col["name"] for col in inspector.get_columns(table)]
+
+        # Adding a stored generated column computes it for every existing row
+        if "search_vector" not in columns:
+            op.execute(
+                f"ALTER TABLE {table} ADD COLUMN search_vector tsvector "
+                "GENERATED ALWAYS AS (to_tsvector('english', content)) STORED"
+            )
+
+        op.execute(
+            f"CREATE INDEX IF NOT EXISTS {index_name} ON {table} USING gin (search_vector)"
+        )
+
+        # The expression index is no longer used by the retrievers
+        op.execute(f"DROP INDEX IF EXISTS {old_index_name}")
+
+
+def downgrade() -> None:
+    """Remove stored tsvector columns and restore the expression GIN indexes."""
+
+    from sqlalchemy import inspect
+
+    conn = op.get_bind()
+    inspector = inspect(conn)
+
+    for table, index_name, old_index_name in SEARCH_VECTOR_TABLES:
+        op.execute(f"DROP INDEX IF EXISTS {index_name}")
+
+        # Get existing columns
+        columns = [col["name"] for col in inspector.get_columns(table)]
+
+        # Drop column if it exists
+        if "search_vector" in columns:
+            op.drop_column(table, "search_vector")
+
+        op.execute(
+            f"CREATE INDEX IF NOT EXISTS {old_index_name} ON {table} "
+            "USING gin (to_tsvector('english', content))"
+        )
@@ -0,0 +1,114 @@
+"""Add search_space_id and document_type to chunks
+
+Revision ID: 35
+Revises: 34
+
+Changes:
+1. Add search_space_id column (Integer, FK to searchspaces) to chunks
+2. Add document_type column (documenttype enum) to chunks
+3. Backfill both columns from the parent document
+4. Add a composite index on (search_space_id, document_type)
+"""
+
+from collections.abc import Sequence
+
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "35"
+down_revision: str | None = "34"
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+INDEX_NAME = "ix_chunks_search_space_id_document_type"
+FOREIGN_KEY_NAME = "chunks_search_space_id_fkey"
+
+
+def upgrade() -> None:
+    """Add denormalized search_space_id and document_type columns to chunks."""
+
+    from sqlalchemy import inspect
+
+    conn = op.get_bind()
+    inspector = inspect(conn)
+
+    # Get existing columns
+    chunk_columns = [col["name"] for col in inspector.get_columns("chunks")]
+
+    # Add search_space_id column if it doesn't exist
+    if "search_space_id" not in chunk_columns:
+        op.add_column(
+            "chunks",
+            sa.Column("search_space_id", sa.Integer(), nullable=True),
+        )
+
+    # Add document_type column if it doesn't exist (reuses the documents enum)
+    if "document_type" not in chunk_columns:
+        op.add_column(
+            "chunks",
+            sa.Column(
+                "document_type",
+                postgresql.ENUM(name="documenttype", create_type=False),
+                nullable=True,
+            ),
+        )
+
+    # Backfill from the parent document
+    op.execute(
+        """
+        UPDATE chunks
+        SET search_space_id = documents.search_space_id,
+            document_type = documents.document_type
+        FROM documents
+        WHERE chunks.document_id = documents.id
+          AND (chunks.search_space_id IS NULL OR chunks.document_type IS NULL)
+        """
+    )
+
+    op.alter_column("chunks", "search_space_id", nullable=False)
+    op.alter_column("chunks", "document_type", nullable=False)
+
+    # Add foreign key if it doesn't exist
+    foreign_keys = [fk["name"] for fk in inspector.get_foreign_keys("chunks")]
+    if FOREIGN_KEY_NAME not in foreign_keys:
+        op.create_foreign_key(
+            FOREIGN_KEY_NAME,
+            "chunks",
+            "searchspaces",
+            ["search_space_id"],
+            ["id"],
+            ondelete="CASCADE",
+        )
+
+    op.execute(
+        f"CREATE INDEX IF NOT EXISTS {INDEX_NAME} "
+        "ON chunks (search_space_id, document_type)"
+    )
+
+
+def downgrade() -> None:
+    """Remove denormalized search_space_id and document_type columns from chunks."""
+
+    from sqlalchemy import inspect
+
+    conn = op.get_bind()
+    inspector = inspect(conn)
+
+    op.execute(f"DROP INDEX IF EXISTS {INDEX_NAME}")
+
+    foreign_keys = [fk["name"] for fk in inspector.get_foreign_keys("chunks")]
+    if FOREIGN_KEY_NAME in foreign_keys:
+        op.drop_constraint(FOREIGN_KEY_NAME, "chunks", type_="foreignkey")
+
+    # Get existing columns
+    chunk_columns = [col["name"] for col in inspector.get_columns("chunks")]
+
+    # Drop columns if they exist
+    if "document_type" in chunk_columns:
+        op.drop_column("chunks", "document_type")
+
+    if "search_space_id" in chunk_columns:
+        op.drop_column("chunks", "search_space_id")
@@ -0,0 +1,65 @@
+"""Add index_version to searchspaces
+
+Revision ID: 36
+Revises: 35
+
+Changes:
+1. Add index_version column (Integer, default 0) to searchspaces, incremented
+   whenever a document of the search space is added, changed or deleted
+"""
+
+from collections.abc import Sequence
+
+import sqlalchemy as sa
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "36"
+down_revision: str | None = "35"
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+
+def upgrade() -> None:
+    """Add index_version column to searchspaces."""
+
+    from sqlalchemy import inspect
+
+    conn = op.get_bind()
+    inspector = inspect(conn)
+
+    # Get existing columns
+    search_space_columns = [
+        col["name"] for col in inspector.get_columns("searchspaces")
+    ]
+
+    # Add index_version column if it doesn't exist
+    if "index_version" not in search_space_columns:
+        op.add_column(
+            "searchspaces",
+            sa.Column(
+                "index_version",
+                sa.Integer(),
+                nullable=False,
+                server_default="0",
+            ),
+        )
+
+
+def downgrade() -> None:
+    """Remove index_version column from searchspaces."""
+
+    from sqlalchemy import inspect
+
+    conn = op.get_bind()
+    inspector = inspect(conn)
+
+    # Get existing columns
+    search_space_columns = [
+        col["name"] for col in inspector.get_columns("searchspaces")
+    ]
+
+    # Drop column if it exists
+    if "index_version" in search_space_columns:
+        op.drop_column("searchspaces", "index_version")
@@ -0,0 +1,77 @@
+"""Add content_hash and position to chunks
+
+Revision ID: 37
+Revises: 36
+
+Changes:
+1. Add content_hash column (String) to chunks, the SHA-256 of the chunk content
+2. Add position column (Integer) to chunks, the order of the chunk in its document
+3. Backfill both columns for existing chunks (position follows the chunk id)
+"""
+
+from collections.abc import Sequence
+
+import sqlalchemy as sa
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "37"
+down_revision: str | None = "36"
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+
+def upgrade() -> None:
+    """Add content_hash and position columns to chunks."""
+
+    from sqlalchemy import inspect
+
+    conn = op.get_bind()
+    inspector = inspect(conn)
+
+    # Get existing columns
+    chunk_columns = [col["name"] for col in inspector.get_columns("chunks")]
+
+    # Add content_hash column if it doesn't exist
+    if "content_hash" not in chunk_columns:
+        op.add_column("chunks", sa.Column("content_hash", sa.String(), nullable=True))
+
+    # Add position column if it doesn't exist
+    if "position" not in chunk_columns:
+        op.add_column("chunks", sa.Column("position", sa.Integer(), nullable=True))
+
+    # Backfill existing chunks, chunks were created in document order
+    op.execute(
+        """
+        UPDATE chunks
+        SET content_hash = encode(sha256(convert_to(chunks.content, 'UTF8')), 'hex'),
+            position = ordered.position
+        FROM (
+            SELECT id,
+                   ROW_NUMBER() OVER (PARTITION BY document_id ORDER BY id) - 1
+                       AS position
+            FROM chunks
+        ) AS ordered
+        WHERE chunks.id = ordered.id
+          AND (chunks.content_hash IS NULL OR chunks.position IS NULL)
+        """
+    )
+
+
+def downgrade() -> None:
+    """Remove content_hash and position columns from chunks."""
+
+    from sqlalchemy import inspect
+
+    conn = op.get_bind()
+    inspector = inspect(conn)
+
+    # Get existing columns
+    chunk_columns = [col["name"] for col in inspector.get_columns("chunks")]
+
+    # Drop columns if they exist
+    if "position" in chunk_columns:
+        op.drop_column("chunks", "position")
+    if "content_hash" in chunk_columns:
+        op.drop_column("chunks", "content_hash")
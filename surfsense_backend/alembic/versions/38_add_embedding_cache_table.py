@@ -0,0 +1,69 @@
+"""Add embedding_cache table
+
+Revision ID: 38
+Revises: 37
+
+Changes:
+1. Add embedding_cache table storing document embeddings keyed by
+   (embedding model, SHA-256 of the text), shared across documents and users
+2. Add an index on last_used_at used to evict the least recently used entries
+"""
+
+from collections.abc import Sequence
+
+import sqlalchemy as sa
+from pgvector.sqlalchemy import Vector
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "38"
+down_revision: str | None = "37"
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+TABLE_NAME = "embedding_cache"
+INDEX_NAME = "ix_embedding_cache_last_used_at"
+
+
+def upgrade() -> None:
+    """Create the embedding_cache table."""
+
+    from sqlalchemy import inspect
+
+    conn = op.get_bind()
+    inspector = inspect(conn)
+
+    # Create table if it doesn't exist
+    if TABLE_NAME not in inspector.get_table_names():
+        op.create_table(
+            TABLE_NAME,
+            sa.Column("model", sa.String(), nullable=False),
+            sa.Column("text_hash", sa.String(length=64), nullable=False),
+            sa.Column("embedding", Vector(), nullable=False),
+            sa.Column(
+                "last_used_at",
+                sa.TIMESTAMP(timezone=True),
+                nullable=False,
+                server_default=sa.text("now()"),
+            ),
+            sa.PrimaryKeyConstraint("model", "text_hash"),
+        )
+
+    # Create index if it doesn't exist
+    indexes = [index["name"] for index in inspector.get_indexes(TABLE_NAME)]
+    if INDEX_NAME not in indexes:
+        op.create_index(INDEX_NAME, TABLE_NAME, ["last_used_at"])
+
+
+def downgrade() -> None:
+    """Drop the embedding_cache table."""
+
+    from sqlalchemy import inspect
+
+    conn = op.get_bind()
+    inspector = inspect(conn)
+
+    if TABLE_NAME in inspector.get_table_names():
+        op.drop_index(INDEX_NAME, table_name=TABLE_NAME)
+        op.drop_table(TABLE_NAME)
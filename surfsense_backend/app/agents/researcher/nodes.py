@@ -1,3 +1,4 @@
+import asyncio
 import json
 import logging
 import traceback
@@ -11,9 +12,16 @@ from sqlalchemy.ext.asyncio import AsyncSession
 # Additional imports for document fetching
 from sqlalchemy.future import select
 
-from app.db import Document, SearchSpace
+from app.config import config as app_config
+from app.db import Document, DocumentType, SearchSpace, async_session_maker
+from app.services.answer_cache_service import (
+    answer_cache,
+    get_search_space_index_version,
+)
 from app.services.connector_service import ConnectorService
+from app.services.embedding_service import embed_queries, get_query_embedding
 from app.services.query_service import QueryService
+from app.utils.search_sessions import search_session
 
 from .configuration import Configuration, SearchMode
 from .prompts import get_further_questions_system_prompt
@@ -131,7 +139,9 @@ async def fetch_documents_by_ids(
             from app.db import Chunk
 
             chunks_query = (
-                select(Chunk).where(Chunk.document_id == doc.id).order_by(Chunk.id)
+                select(Chunk)
+                .where(Chunk.document_id == doc.id)
+                .order_by(Chunk.position, Chunk.id)
             )
             chunks_result = await db_session.execute(chunks_query)
             chunks = chunks_result.scalars().all()
@@ -513,44 +523,179 @@ async def fetch_documents_by_ids(
         return [], []
 
 
-async def fetch_relevant_documents(
-    research_questions: list[str],
+# Search method and "found" progress message of every supported connector
+CONNECTOR_SEARCHES: dict[str, tuple[str, str]] = {
+    "YOUTUBE_VIDEO": (
+        "search_youtube",
+        "📹 Found {count} YouTube chunks related to your query",
+    ),
+    "EXTENSION": (
+        "search_extension",
+        "🧩 Found {count} Browser Extension chunks related to your query",
+    ),
+    "CRAWLED_URL": (
+        "search_crawled_urls",
+        "🌐 Found {count} Web Pages chunks related to your query",
+    ),
+    "FILE": (
+        "search_files",
+        "📄 Found {count} Files chunks related to your query",
+    ),
+    "SLACK_CONNECTOR": (
+        "search_slack",
+        "💬 Found {count} Slack messages related to your query",
+    ),
+    "NOTION_CONNECTOR": (
+        "search_notion",
+        "📘 Found {count} Notion pages/blocks related to your query",
+    ),
+    "GITHUB_CONNECTOR": (
+        "search_github",
+        "🐙 Found {count} GitHub files/issues related to your query",
+    ),
+    "LINEAR_CONNECTOR": (
+        "search_linear",
+        "📊 Found {count} Linear issues related to your query",
+    ),
+    "TAVILY_API": (
+        "search_tavily",
+        "🔍 Found {count} Web Search results related to your query",
+    ),
+    "SEARXNG_API": (
+        "search_searxng",
+        "🌐 Found {count} SearxNG results related to your query",
+    ),
+    "LINKUP_API": (
+        "search_linkup",
+        "🔗 Found {count} Linkup results related to your query",
+    ),
+    "BAIDU_SEARCH_API": (
+        "search_baidu",
+        "🇨🇳 Found {count} Baidu Search results related to your query",
+    ),
+    "DISCORD_CONNECTOR": (
+        "search_discord",
+        "🗨️ Found {count} Discord messages related to your query",
+    ),
+    "JIRA_CONNECTOR": (
+        "search_jira",
+        "🎫 Found {count} Jira issues related to your query",
+    ),
+    "GOOGLE_CALENDAR_CONNECTOR": (
+        "search_google_calendar",
+        "📅 Found {count} calendar events related to your query",
+    ),
+    "AIRTABLE_CONNECTOR": (
+        "search_airtable",
+        "🗃️ Found {count} Airtable records related to your query",
+    ),
+    "GOOGLE_GMAIL_CONNECTOR": (
+        "search_google_gmail",
+        "📧 Found {count} Gmail messages related to your query",
+    ),
+    "CONFLUENCE_CONNECTOR": (
+        "search_confluence",
+        "📚 Found {count} Confluence pages related to your query",
+    ),
+    "CLICKUP_CONNECTOR": (
+        "search_clickup",
+        "📋 Found {count} ClickUp tasks related to your query",
+    ),
+    "LUMA_CONNECTOR": (
+        "search_luma",
+        "🎯 Found {count} Luma events related to your query",
+    ),
+    "ELASTICSEARCH_CONNECTOR": (
+        "search_elasticsearch",
+        "🔎 Found {count} Elasticsearch chunks related to your query",
+    ),
+}
+
+# Web search connectors take no search mode
+WEB_SEARCH_CONNECTORS = {"TAVILY_API", "SEARXNG_API", "LINKUP_API", "BAIDU_SEARCH_API"}
+
+# Number of streamed answer words between two terminal progress updates
+ANSWER_PROGRESS_WORDS = 50
+
+
+async def _search_connector_with_timeout(
+    connector_service: ConnectorService,
+    connector: str,
+    user_query: str,
     user_id: str,
     search_space_id: int,
-    db_session: AsyncSession,
+    top_k: int,
+    search_mode: SearchMode,
+) -> tuple[str, tuple | None, str | None]:
+    """
+    Search a single connector on its own database session.
+
+    Web search connectors only read their configuration from the database, on a
+    short-lived session, and hold no session while the provider responds. The
+    timeout includes the wait for a free search session.
+
+    Returns:
+        tuple: (connector, (source_object, chunks) or None, error message or None)
+    """
+    method_name, _ = CONNECTOR_SEARCHES[connector]
+    search_kwargs = {
+        "user_query": user_query,
+        "user_id": user_id,
+        "search_space_id": search_space_id,
+    }
+    if connector == "LINKUP_API":
+        search_kwargs["mode"] = "standard"
+    elif connector in WEB_SEARCH_CONNECTORS:
+        search_kwargs["top_k"] = top_k
+    else:
+        search_kwargs["top_k"] = top_k
+        search_kwargs["search_mode"] = search_mode
+
+    async def _search() -> tuple:
+        if connector in WEB_SEARCH_CONNECTORS:
+            search = getattr(connector_service.fork(None), method_name)
+            return await search(**search_kwargs)
+
+        async with search_session() as session:
+            search = getattr(connector_service.fork(session), method_name)
+            return await search(**search_kwargs)
+
+    try:
+        result = await asyncio.wait_for(
+            _search(), timeout=app_config.CONNECTOR_SEARCH_TIMEOUT
+        )
+        return connector, result, None
+    except TimeoutError:
+        return (
+            connector,
+            None,
+            f"timed out after {app_config.CONNECTOR_SEARCH_TIMEOUT:g} seconds",
+        )
+    except Exception as e:
+        logging.error(
+            "Error searching connector %s: %s", connector, traceback.format_exc()
+        )
+        return connector, None, f"{e!s}"
+
+
+def announce_connector_search(
     connectors_to_search: list[str],
+    question_count: int,
     writer: StreamWriter = None,
     state: State = None,
-    top_k: int = 10,
-    connector_service: ConnectorService = None,
-    search_mode: SearchMode = SearchMode.CHUNKS,
-    user_selected_sources: list[dict[str, Any]] | None = None,
-) -> list[dict[str, Any]]:
+) -> bool:
     """
-    Fetch relevant documents for research questions using the provided connectors.
-
-    This function searches across multiple data sources for information related to the
-    research questions. It provides user-friendly feedback during the search process by
-    displaying connector names (like "Web Search" instead of "TAVILY_API") and adding
-    relevant emojis to indicate the type of source being searched.
+    Stream the start of a connector search, or that no connector is selected.
 
     Args:
-        research_questions: List of research questions to find documents for
-        user_id: The user ID
-        search_space_id: The search space ID
-        db_session: The database session
         connectors_to_search: List of connectors to search
+        question_count: Number of research questions searched
         writer: StreamWriter for sending progress updates
         state: The current state containing the streaming service
-        top_k: Number of top results to retrieve per connector per question
-        connector_service: An initialized connector service to use for searching
 
     Returns:
-        List of relevant documents
+        bool: False if there is no connector to search
     """
-    # Initialize services
-    # connector_service = ConnectorService(db_session)
-
     # Only use streaming if both writer and state are provided
     streaming_service = state.streaming_service if state is not None else None
 
@@ -565,7 +710,7 @@ async def fetch_relevant_documents(
                 }
             )
         print("No connectors selected for research. Returning empty document list.")
-        return []  # Return empty list gracefully
+        return False
 
     # Stream initial status update
     if streaming_service and writer:
@@ -576,14 +721,54 @@ async def fetch_relevant_documents(
         writer(
             {
                 "yield_value": streaming_service.format_terminal_info_delta(
-                    f"🔎 Starting research on {len(research_questions)} questions using {connector_names_str} data sources"
+                    f"🔎 Starting research on {question_count} questions using {connector_names_str} data sources"
                 )
             }
         )
+    return True
+
+
+async def search_research_questions(
+    research_questions: list[str],
+    user_id: str,
+    search_space_id: int,
+    connectors_to_search: list[str],
+    writer: StreamWriter = None,
+    state: State = None,
+    top_k: int = 10,
+    connector_service: ConnectorService = None,
+    search_mode: SearchMode = SearchMode.CHUNKS,
+) -> tuple[list[dict[str, Any]], list[dict[str, Any]]]:
+    """
+    Search every connector for each research question, streaming the progress.
+
+    Args:
+        research_questions: List of research questions to find documents for
+        user_id: The user ID
+        search_space_id: The search space ID
+        connectors_to_search: List of connectors to search
+        writer: StreamWriter for sending progress updates
+        state: The current state containing the streaming service
+        top_k: Number of top results to retrieve per connector per question
+        connector_service: An initialized connector service to use for searching
+        search_mode: The search mode of the local connectors
+
+    Returns:
+        tuple: (raw documents, source objects) in connector order, not deduplicated
+    """
+    # Only use streaming if both writer and state are provided
+    streaming_service = state.streaming_service if state is not None else None
 
     all_raw_documents = []  # Store all raw documents
     all_sources = []  # Store all sources
 
+    # Embed every research question once, in a single batch, before any connector
+    # search runs. The retrievers read these vectors from the query embedding cache.
+    try:
+        await embed_queries(research_questions)
+    except Exception as e:
+        print(f"Error pre-computing query embeddings: {e!s}")
+
     for i, user_query in enumerate(research_questions):
         # Stream question being researched
         if streaming_service and writer:
@@ -598,10 +783,48 @@ async def fetch_relevant_documents(
         # Use original research question as the query
         reformulated_query = user_query
 
-        # Process each selected connector
-        for connector in connectors_to_search:
-            # Stream connector being searched
-            if streaming_service and writer:
+        # Fetch the chunks of every selected local connector in one query (on its
+        # own session); the connector searches below split them into per-connector
+        # sources.
+        if search_mode == SearchMode.CHUNKS:
+            local_document_types = [
+                connector
+                for connector in connectors_to_search
+                if connector in DocumentType.__members__
+            ]
+            if local_document_types:
+                try:
+                    async with search_session() as session:
+                        await connector_service.fork(session).prefetch_chunk_searches(
+                            user_query=reformulated_query,
+                            user_id=user_id,
+                            search_space_id=search_space_id,
+                            document_types=local_document_types,
+                            top_k=top_k,
+                        )
+                except Exception as e:
+                    print(f"Error prefetching chunk searches: {e!s}")
+
+        # Search every selected connector concurrently, each on its own session
+        search_tasks = {
+            asyncio.create_task(
+                _search_connector_with_timeout(
+                    connector_service=connector_service,
+                    connector=connector,
+                    user_query=reformulated_query,
+                    user_id=user_id,
+                    search_space_id=search_space_id,
+                    top_k=top_k,
+                    search_mode=search_mode,
+                )
+            ): connector
+            for connector in connectors_to_search
+            if connector in CONNECTOR_SEARCHES
+        }
+
+        # Stream connectors being searched
+        if streaming_service and writer:
+            for connector in search_tasks.values():
                 connector_emoji = get_connector_emoji(connector)
                 friendly_name = get_connector_friendly_name(connector)
                 writer(
@@ -612,572 +835,80 @@ async def fetch_relevant_documents(
                     }
                 )
 
-            try:
-                if connector == "YOUTUBE_VIDEO":
-                    (
-                        source_object,
-                        youtube_chunks,
-                    ) = await connector_service.search_youtube(
-                        user_query=reformulated_query,
-                        user_id=user_id,
-                        search_space_id=search_space_id,
-                        top_k=top_k,
-                        search_mode=search_mode,
-                    )
-
-                    # Add to sources and raw documents
-                    if source_object:
-                        all_sources.append(source_object)
-                    all_raw_documents.extend(youtube_chunks)
-
-                    # Stream found document count
-                    if streaming_service and writer:
-                        writer(
-                            {
-                                "yield_value": streaming_service.format_terminal_info_delta(
-                                    f"📹 Found {len(youtube_chunks)} YouTube chunks related to your query"
-                                )
-                            }
-                        )
-
-                elif connector == "EXTENSION":
-                    (
-                        source_object,
-                        extension_chunks,
-                    ) = await connector_service.search_extension(
-                        user_query=reformulated_query,
-                        user_id=user_id,
-                        search_space_id=search_space_id,
-                        top_k=top_k,
-                        search_mode=search_mode,
-                    )
-
-                    # Add to sources and raw documents
-                    if source_object:
-                        all_sources.append(source_object)
-                    all_raw_documents.extend(extension_chunks)
-
-                    # Stream found document count
-                    if streaming_service and writer:
-                        writer(
-                            {
-                                "yield_value": streaming_service.format_terminal_info_delta(
-                                    f"🧩 Found {len(extension_chunks)} Browser Extension chunks related to your query"
-                                )
-                            }
-                        )
-
-                elif connector == "CRAWLED_URL":
-                    (
-                        source_object,
-                        crawled_urls_chunks,
-                    ) = await connector_service.search_crawled_urls(
-                        user_query=reformulated_query,
-                        user_id=user_id,
-                        search_space_id=search_space_id,
-                        top_k=top_k,
-                        search_mode=search_mode,
-                    )
-
-                    # Add to sources and raw documents
-                    if source_object:
-                        all_sources.append(source_object)
-                    all_raw_documents.extend(crawled_urls_chunks)
-
-                    # Stream found document count
-                    if streaming_service and writer:
-                        writer(
-                            {
-                                "yield_value": streaming_service.format_terminal_info_delta(
-                                    f"🌐 Found {len(crawled_urls_chunks)} Web Pages chunks related to your query"
-                                )
-                            }
-                        )
-
-                elif connector == "FILE":
-                    source_object, files_chunks = await connector_service.search_files(
-                        user_query=reformulated_query,
-                        user_id=user_id,
-                        search_space_id=search_space_id,
-                        top_k=top_k,
-                        search_mode=search_mode,
-                    )
-
-                    # Add to sources and raw documents
-                    if source_object:
-                        all_sources.append(source_object)
-                    all_raw_documents.extend(files_chunks)
-
-                    # Stream found document count
-                    if streaming_service and writer:
-                        writer(
-                            {
-                                "yield_value": streaming_service.format_terminal_info_delta(
-                                    f"📄 Found {len(files_chunks)} Files chunks related to your query"
-                                )
-                            }
-                        )
-
-                elif connector == "SLACK_CONNECTOR":
-                    source_object, slack_chunks = await connector_service.search_slack(
-                        user_query=reformulated_query,
-                        user_id=user_id,
-                        search_space_id=search_space_id,
-                        top_k=top_k,
-                        search_mode=search_mode,
-                    )
-
-                    # Add to sources and raw documents
-                    if source_object:
-                        all_sources.append(source_object)
-                    all_raw_documents.extend(slack_chunks)
-
-                    # Stream found document count
-                    if streaming_service and writer:
-                        writer(
-                            {
-                                "yield_value": streaming_service.format_terminal_info_delta(
-                                    f"💬 Found {len(slack_chunks)} Slack messages related to your query"
-                                )
-                            }
-                        )
-
-                elif connector == "NOTION_CONNECTOR":
-                    (
-                        source_object,
-                        notion_chunks,
-                    ) = await connector_service.search_notion(
-                        user_query=reformulated_query,
-                        user_id=user_id,
-                        search_space_id=search_space_id,
-                        top_k=top_k,
-                        search_mode=search_mode,
-                    )
-
-                    # Add to sources and raw documents
-                    if source_object:
-                        all_sources.append(source_object)
-                    all_raw_documents.extend(notion_chunks)
-
-                    # Stream found document count
-                    if streaming_service and writer:
-                        writer(
-                            {
-                                "yield_value": streaming_service.format_terminal_info_delta(
-                                    f"📘 Found {len(notion_chunks)} Notion pages/blocks related to your query"
-                                )
-                            }
-                        )
-
-                elif connector == "GITHUB_CONNECTOR":
-                    (
-                        source_object,
-                        github_chunks,
-                    ) = await connector_service.search_github(
-                        user_query=reformulated_query,
-                        user_id=user_id,
-                        search_space_id=search_space_id,
-                        top_k=top_k,
-                        search_mode=search_mode,
-                    )
-
-                    # Add to sources and raw documents
-                    if source_object:
-                        all_sources.append(source_object)
-                    all_raw_documents.extend(github_chunks)
-
-                    # Stream found document count
-                    if streaming_service and writer:
-                        writer(
-                            {
-                                "yield_value": streaming_service.format_terminal_info_delta(
-                                    f"🐙 Found {len(github_chunks)} GitHub files/issues related to your query"
-                                )
-                            }
-                        )
-
-                elif connector == "LINEAR_CONNECTOR":
-                    (
-                        source_object,
-                        linear_chunks,
-                    ) = await connector_service.search_linear(
-                        user_query=reformulated_query,
-                        user_id=user_id,
-                        search_space_id=search_space_id,
-                        top_k=top_k,
-                        search_mode=search_mode,
-                    )
-
-                    # Add to sources and raw documents
-                    if source_object:
-                        all_sources.append(source_object)
-                    all_raw_documents.extend(linear_chunks)
-
-                    # Stream found document count
-                    if streaming_service and writer:
-                        writer(
-                            {
-                                "yield_value": streaming_service.format_terminal_info_delta(
-                                    f"📊 Found {len(linear_chunks)} Linear issues related to your query"
-                                )
-                            }
-                        )
-
-                elif connector == "TAVILY_API":
-                    (
-                        source_object,
-                        tavily_chunks,
-                    ) = await connector_service.search_tavily(
-                        user_query=reformulated_query,
-                        user_id=user_id,
-                        search_space_id=search_space_id,
-                        top_k=top_k,
-                    )
-
-                    # Add to sources and raw documents
-                    if source_object:
-                        all_sources.append(source_object)
-                    all_raw_documents.extend(tavily_chunks)
-
-                    # Stream found document count
-                    if streaming_service and writer:
-                        writer(
-                            {
-                                "yield_value": streaming_service.format_terminal_info_delta(
-                                    f"🔍 Found {len(tavily_chunks)} Web Search results related to your query"
-                                )
-                            }
-                        )
-
-                elif connector == "SEARXNG_API":
-                    (
-                        source_object,
-                        searx_chunks,
-                    ) = await connector_service.search_searxng(
-                        user_query=reformulated_query,
-                        user_id=user_id,
-                        search_space_id=search_space_id,
-                        top_k=top_k,
-                    )
-
-                    if source_object:
-                        all_sources.append(source_object)
-                    all_raw_documents.extend(searx_chunks)
-
-                    if streaming_service and writer:
-                        writer(
-                            {
-                                "yield_value": streaming_service.format_terminal_info_delta(
-                                    f"🌐 Found {len(searx_chunks)} SearxNG results related to your query"
-                                )
-                            }
-                        )
-
-                elif connector == "LINKUP_API":
-                    linkup_mode = "standard"
-
-                    (
-                        source_object,
-                        linkup_chunks,
-                    ) = await connector_service.search_linkup(
-                        user_query=reformulated_query,
-                        user_id=user_id,
-                        search_space_id=search_space_id,
-                        mode=linkup_mode,
-                    )
-
-                    # Add to sources and raw documents
-                    if source_object:
-                        all_sources.append(source_object)
-                    all_raw_documents.extend(linkup_chunks)
-
-                    # Stream found document count
-                    if streaming_service and writer:
-                        writer(
-                            {
-                                "yield_value": streaming_service.format_terminal_info_delta(
-                                    f"🔗 Found {len(linkup_chunks)} Linkup results related to your query"
-                                )
-                            }
-                        )
-
-                elif connector == "BAIDU_SEARCH_API":
-                    (
-                        source_object,
-                        baidu_chunks,
-                    ) = await connector_service.search_baidu(
-                        user_query=reformulated_query,
-                        user_id=user_id,
-                        search_space_id=search_space_id,
-                        top_k=top_k,
-                    )
-
-                    # Add to sources and raw documents
-                    if source_object:
-                        all_sources.append(source_object)
-                    all_raw_documents.extend(baidu_chunks)
-
-                    # Stream found document count
-                    if streaming_service and writer:
-                        writer(
-                            {
-                                "yield_value": streaming_service.format_terminal_info_delta(
-                                    f"🇨🇳 Found {len(baidu_chunks)} Baidu Search results related to your query"
-                                )
-                            }
-                        )
-
-                elif connector == "DISCORD_CONNECTOR":
-                    (
-                        source_object,
-                        discord_chunks,
-                    ) = await connector_service.search_discord(
-                        user_query=reformulated_query,
-                        user_id=user_id,
-                        search_space_id=search_space_id,
-                        top_k=top_k,
-                        search_mode=search_mode,
-                    )
-                    # Add to sources and raw documents
-                    if source_object:
-                        all_sources.append(source_object)
-                    all_raw_documents.extend(discord_chunks)
-                    # Stream found document count
-                    if streaming_service and writer:
-                        writer(
-                            {
-                                "yield_value": streaming_service.format_terminal_info_delta(
-                                    f"🗨️ Found {len(discord_chunks)} Discord messages related to your query"
-                                )
-                            }
-                        )
-
-                elif connector == "JIRA_CONNECTOR":
-                    source_object, jira_chunks = await connector_service.search_jira(
-                        user_query=reformulated_query,
-                        user_id=user_id,
-                        search_space_id=search_space_id,
-                        top_k=top_k,
-                        search_mode=search_mode,
-                    )
-
-                    # Add to sources and raw documents
-                    if source_object:
-                        all_sources.append(source_object)
-                    all_raw_documents.extend(jira_chunks)
-
-                    # Stream found document count
-                    if streaming_service and writer:
-                        writer(
-                            {
-                                "yield_value": streaming_service.format_terminal_info_delta(
-                                    f"🎫 Found {len(jira_chunks)} Jira issues related to your query"
-                                )
-                            }
-                        )
-                elif connector == "GOOGLE_CALENDAR_CONNECTOR":
-                    (
-                        source_object,
-                        calendar_chunks,
-                    ) = await connector_service.search_google_calendar(
-                        user_query=reformulated_query,
-                        user_id=user_id,
-                        search_space_id=search_space_id,
-                        top_k=top_k,
-                        search_mode=search_mode,
-                    )
-
-                    # Add to sources and raw documents
-                    if source_object:
-                        all_sources.append(source_object)
-                    all_raw_documents.extend(calendar_chunks)
-
-                    # Stream found document count
-                    if streaming_service and writer:
-                        writer(
-                            {
-                                "yield_value": streaming_service.format_terminal_info_delta(
-                                    f"📅 Found {len(calendar_chunks)} calendar events related to your query"
-                                )
-                            }
-                        )
-                elif connector == "AIRTABLE_CONNECTOR":
-                    (
-                        source_object,
-                        airtable_chunks,
-                    ) = await connector_service.search_airtable(
-                        user_query=reformulated_query,
-                        user_id=user_id,
-                        search_space_id=search_space_id,
-                        top_k=top_k,
-                        search_mode=search_mode,
-                    )
-
-                    # Add to sources and raw documents
-                    if source_object:
-                        all_sources.append(source_object)
-                    all_raw_documents.extend(airtable_chunks)
-
-                    # Stream found document count
-                    if streaming_service and writer:
-                        writer(
-                            {
-                                "yield_value": streaming_service.format_terminal_info_delta(
-                                    f"🗃️ Found {len(airtable_chunks)} Airtable records related to your query"
-                                )
-                            }
-                        )
-                elif connector == "GOOGLE_GMAIL_CONNECTOR":
-                    (
-                        source_object,
-                        gmail_chunks,
-                    ) = await connector_service.search_google_gmail(
-                        user_query=reformulated_query,
-                        user_id=user_id,
-                        search_space_id=search_space_id,
-                        top_k=top_k,
-                        search_mode=search_mode,
-                    )
-
-                    # Add to sources and raw documents
-                    if source_object:
-                        all_sources.append(source_object)
-                    all_raw_documents.extend(gmail_chunks)
-
-                    # Stream found document count
-                    if streaming_service and writer:
-                        writer(
-                            {
-                                "yield_value": streaming_service.format_terminal_info_delta(
-                                    f"📧 Found {len(gmail_chunks)} Gmail messages related to your query"
-                                )
-                            }
-                        )
-                elif connector == "CONFLUENCE_CONNECTOR":
-                    (
-                        source_object,
-                        confluence_chunks,
-                    ) = await connector_service.search_confluence(
-                        user_query=reformulated_query,
-                        user_id=user_id,
-                        search_space_id=search_space_id,
-                        top_k=top_k,
-                        search_mode=search_mode,
-                    )
-
-                    # Add to sources and raw documents
-                    if source_object:
-                        all_sources.append(source_object)
-                    all_raw_documents.extend(confluence_chunks)
-
-                    # Stream found document count
-                    if streaming_service and writer:
-                        writer(
-                            {
-                                "yield_value": streaming_service.format_terminal_info_delta(
-                                    f"📚 Found {len(confluence_chunks)} Confluence pages related to your query"
-                                )
-                            }
-                        )
-                elif connector == "CLICKUP_CONNECTOR":
-                    (
-                        source_object,
-                        clickup_chunks,
-                    ) = await connector_service.search_clickup(
-                        user_query=reformulated_query,
-                        user_id=user_id,
-                        search_space_id=search_space_id,
-                        top_k=top_k,
-                        search_mode=search_mode,
-                    )
-
-                    # Add to sources and raw documents
-                    if source_object:
-                        all_sources.append(source_object)
-                    all_raw_documents.extend(clickup_chunks)
-
-                    # Stream found document count
-                    if streaming_service and writer:
-                        writer(
-                            {
-                                "yield_value": streaming_service.format_terminal_info_delta(
-                                    f"📋 Found {len(clickup_chunks)} ClickUp tasks related to your query"
-                                )
-                            }
-                        )
-
-                elif connector == "LUMA_CONNECTOR":
-                    (
-                        source_object,
-                        luma_chunks,
-                    ) = await connector_service.search_luma(
-                        user_query=reformulated_query,
-                        user_id=user_id,
-                        search_space_id=search_space_id,
-                        top_k=top_k,
-                        search_mode=search_mode,
-                    )
-
-                    # Add to sources and raw documents
-                    if source_object:
-                        all_sources.append(source_object)
-                    all_raw_documents.extend(luma_chunks)
-
-                    # Stream found document count
-                    if streaming_service and writer:
-                        writer(
-                            {
-                                "yield_value": streaming_service.format_terminal_info_delta(
-                                    f"🎯 Found {len(luma_chunks)} Luma events related to your query"
-                                )
-                            }
-                        )
-
-                elif connector == "ELASTICSEARCH_CONNECTOR":
-                    (
-                        source_object,
-                        elasticsearch_chunks,
-                    ) = await connector_service.search_elasticsearch(
-                        user_query=reformulated_query,
-                        user_id=user_id,
-                        search_space_id=search_space_id,
-                        top_k=top_k,
-                        search_mode=search_mode,
-                    )
-
-                    # Add to sources and raw documents
-                    if source_object:
-                        all_sources.append(source_object)
-                    all_raw_documents.extend(elasticsearch_chunks)
+        # Stream progress as each connector finishes
+        connector_results = {}
+        try:
+            for finished_task in asyncio.as_completed(search_tasks):
+                connector, result, error = await finished_task
+                friendly_name = get_connector_friendly_name(connector)
 
-                    # Stream found document count
+                if error is not None:
+                    # Skip this connector, keep the results of the others
+                    error_message = f"Error searching connector {connector}: {error}"
+                    print(error_message)
                     if streaming_service and writer:
                         writer(
                             {
-                                "yield_value": streaming_service.format_terminal_info_delta(
-                                    f"🔎 Found {len(elasticsearch_chunks)} Elasticsearch chunks related to your query"
+                                "yield_value": streaming_service.format_error(
+                                    f"Error searching {friendly_name}: {error}"
                                 )
                             }
                         )
+                    continue
 
-            except Exception as e:
-                logging.error("Error in search_airtable: %s", traceback.format_exc())
-                error_message = f"Error searching connector {connector}: {e!s}"
-                print(error_message)
+                source_object, chunks = result
+                connector_results[connector] = (source_object, chunks)
 
-                # Stream error message
+                # Stream found document count
                 if streaming_service and writer:
-                    friendly_name = get_connector_friendly_name(connector)
+                    _, found_message = CONNECTOR_SEARCHES[connector]
                     writer(
                         {
-                            "yield_value": streaming_service.format_error(
-                                f"Error searching {friendly_name}: {e!s}"
+                            "yield_value": streaming_service.format_terminal_info_delta(
+                                found_message.format(count=len(chunks))
                             )
                         }
                     )
+        finally:
+            for task in search_tasks:
+                task.cancel()
 
-                # Continue with other connectors on error
+        # Add to sources and raw documents in connector order
+        for connector in connectors_to_search:
+            if connector not in connector_results:
                 continue
+            source_object, chunks = connector_results[connector]
+            if source_object:
+                all_sources.append(source_object)
+            all_raw_documents.extend(chunks)
+
+    return all_raw_documents, all_sources
+
+
+def deduplicate_search_results(
+    raw_documents: list[dict[str, Any]],
+    sources: list[dict[str, Any]],
+    user_selected_sources: list[dict[str, Any]] | None = None,
+    writer: StreamWriter = None,
+    state: State = None,
+) -> list[dict[str, Any]]:
+    """
+    Deduplicate the results of connector searches and stream their totals.
+
+    Earlier documents win, so results of the preferred query should come first.
+
+    Args:
+        raw_documents: Documents returned by search_research_questions
+        sources: Source objects returned by search_research_questions
+        user_selected_sources: Sources of the user-selected documents
+        writer: StreamWriter for sending progress updates
+        state: The current state containing the streaming service
+
+    Returns:
+        List of unique documents
+    """
+    # Only use streaming if both writer and state are provided
+    streaming_service = state.streaming_service if state is not None else None
 
     # Deduplicate source objects by ID before streaming
     deduplicated_sources = []
@@ -1198,7 +929,7 @@ async def fetch_relevant_documents(
                 deduplicated_sources.append(source_obj)
 
     # Then add connector sources
-    for source_obj in all_sources:
+    for source_obj in sources:
         # Use combination of source ID and type as a unique identifier
         # This ensures we don't accidentally deduplicate sources from different connectors
         source_id = source_obj.get("id")
@@ -1266,7 +997,7 @@ async def fetch_relevant_documents(
     seen_content_hashes = set()
     deduplicated_docs = []
 
-    for doc in all_raw_documents:
+    for doc in raw_documents:
         chunk_id = doc.get("chunk_id")
         content = doc.get("content", "")
         content_hash = hash(content)
@@ -1293,34 +1024,89 @@ async def fetch_relevant_documents(
             }
         )
 
-    # Return deduplicated documents
-    return deduplicated_docs
+    # Return deduplicated documents
+    return deduplicated_docs
+
+
+async def fetch_relevant_documents(
+    research_questions: list[str],
+    user_id: str,
+    search_space_id: int,
+    connectors_to_search: list[str],
+    writer: StreamWriter = None,
+    state: State = None,
+    top_k: int = 10,
+    connector_service: ConnectorService = None,
+    search_mode: SearchMode = SearchMode.CHUNKS,
+    user_selected_sources: list[dict[str, Any]] | None = None,
+) -> list[dict[str, Any]]:
+    """
+    Fetch relevant documents for research questions using the provided connectors.
+
+    This function searches across multiple data sources for information related to the
+    research questions. It provides user-friendly feedback during the search process by
+    displaying connector names (like "Web Search" instead of "TAVILY_API") and adding
+    relevant emojis to indicate the type of source being searched.
+
+    Args:
+        research_questions: List of research questions to find documents for
+        user_id: The user ID
+        search_space_id: The search space ID
+        connectors_to_search: List of connectors to search
+        writer: StreamWriter for sending progress updates
+        state: The current state containing the streaming service
+        top_k: Number of top results to retrieve per connector per question
+        connector_service: An initialized connector service to use for searching
+        search_mode: The search mode of the local connectors
+        user_selected_sources: Sources of the user-selected documents
+
+    Returns:
+        List of relevant documents
+    """
+    if not announce_connector_search(
+        connectors_to_search, len(research_questions), writer, state
+    ):
+        return []
+
+    raw_documents, sources = await search_research_questions(
+        research_questions=research_questions,
+        user_id=user_id,
+        search_space_id=search_space_id,
+        connectors_to_search=connectors_to_search,
+        writer=writer,
+        state=state,
+        top_k=top_k,
+        connector_service=connector_service,
+        search_mode=search_mode,
+    )
+    return deduplicate_search_results(
+        raw_documents, sources, user_selected_sources, writer, state
+    )
 
 
 async def reformulate_user_query(
-    state: State, config: RunnableConfig, writer: StreamWriter
-) -> dict[str, Any]:
+    user_query: str,
+    chat_history: list[Any],
+    configuration: Configuration,
+    db_session: AsyncSession,
+) -> str:
     """
     Reforms the user query based on the chat history.
-    """
 
-    configuration = Configuration.from_runnable_config(config)
-    user_query = configuration.user_query
-    chat_history_str = await QueryService.langchain_chat_history_to_str(
-        state.chat_history
+    First questions and short, self-contained follow-ups are searched as is,
+    which saves an LLM round trip before the answer can start.
+    """
+    if not chat_history or QueryService.is_self_contained_query(user_query):
+        return user_query
+
+    chat_history_str = await QueryService.langchain_chat_history_to_str(chat_history)
+    return await QueryService.reformulate_query_with_chat_history(
+        user_query=user_query,
+        session=db_session,
+        user_id=configuration.user_id,
+        search_space_id=configuration.search_space_id,
+        chat_history_str=chat_history_str,
     )
-    if len(state.chat_history) == 0:
-        reformulated_query = user_query
-    else:
-        reformulated_query = await QueryService.reformulate_query_with_chat_history(
-            user_query=user_query,
-            session=state.db_session,
-            user_id=configuration.user_id,
-            search_space_id=configuration.search_space_id,
-            chat_history_str=chat_history_str,
-        )
-
-    return {"reformulated_query": reformulated_query}
 
 
 async def handle_qna_workflow(
@@ -1332,13 +1118,17 @@ async def handle_qna_workflow(
     This node fetches relevant documents for the user query and then uses the QNA agent
     to generate a comprehensive answer with proper citations.
 
+    Retrieval for the original query starts right away, while the query is
+    reformulated based on the chat history. The results of the reformulated
+    query are ranked first once they are ready, and the combined results are
+    deduplicated and reported once.
+
     Returns:
         Dict containing the final answer in the "final_written_report" key for consistency.
     """
     streaming_service = state.streaming_service
     configuration = Configuration.from_runnable_config(config)
 
-    reformulated_query = state.reformulated_query
     user_query = configuration.user_query
 
     writer(
@@ -1357,21 +1147,132 @@ async def handle_qna_workflow(
         }
     )
 
-    # Fetch relevant documents for the QNA query
-    writer(
-        {
-            "yield_value": streaming_service.format_terminal_info_delta(
-                "🔍 Searching for relevant information across all connectors..."
-            )
-        }
-    )
-
     # Use the top_k value from configuration
     top_k = configuration.top_k
 
     relevant_documents = []
     user_selected_documents = []
     user_selected_sources = []
+    search_tasks = []
+    connector_service = None
+
+    search_kwargs = {
+        "user_id": configuration.user_id,
+        "search_space_id": configuration.search_space_id,
+        "connectors_to_search": configuration.connectors_to_search,
+        "writer": writer,
+        "state": state,
+        "top_k": top_k,
+        "search_mode": configuration.search_mode,
+    }
+
+    # Connector searches run on their own sessions, so the original query can be
+    # searched while state.db_session is used for the reformulation below
+    try:
+        # Create connector service using state db_session
+        connector_service = ConnectorService(
+            state.db_session, user_id=configuration.user_id
+        )
+        await connector_service.initialize_counter()
+
+        writer(
+            {
+                "yield_value": streaming_service.format_terminal_info_delta(
+                    "🔍 Searching for relevant information across all connectors..."
+                )
+            }
+        )
+        if announce_connector_search(
+            configuration.connectors_to_search, 1, writer, state
+        ):
+            search_tasks.append(
+                asyncio.create_task(
+                    search_research_questions(
+                        research_questions=[user_query],
+                        connector_service=connector_service,
+                        **search_kwargs,
+                    )
+                )
+            )
+    except Exception as e:
+        error_message = f"Error fetching relevant documents for QNA: {e!s}"
+        print(error_message)
+        writer({"yield_value": streaming_service.format_error(error_message)})
+
+    reformulated_query = await reformulate_user_query(
+        user_query, state.chat_history, configuration, state.db_session
+    )
+
+    # Replay a cached answer to a similar question on an unchanged search space
+    index_version = None
+    query_embedding = None
+    answer_context_key = None
+    if app_config.ANSWER_CACHE_ENABLED:
+        try:
+            index_version = await get_search_space_index_version(
+                state.db_session, configuration.search_space_id
+            )
+            query_embedding = await get_query_embedding(reformulated_query)
+            answer_context_key = (
+                tuple(sorted(configuration.connectors_to_search or [])),
+                configuration.search_mode.value,
+                configuration.language,
+                configuration.top_k,
+                tuple(sorted(configuration.document_ids_to_add_in_context or [])),
+            )
+            cached_answer = (
+                answer_cache.get(
+                    configuration.search_space_id,
+                    index_version,
+                    answer_context_key,
+                    query_embedding,
+                )
+                if index_version is not None
+                else None
+            )
+        except Exception as e:
+            print(f"Error looking up the answer cache: {e!s}")
+            index_version = None
+            cached_answer = None
+
+        if cached_answer:
+            for task in search_tasks:
+                task.cancel()
+
+            writer(
+                {
+                    "yield_value": streaming_service.format_terminal_info_delta(
+                        "⚡ Found an answer to a similar question, reusing it..."
+                    )
+                }
+            )
+            if cached_answer.sources:
+                writer(
+                    {
+                        "yield_value": streaming_service.format_sources_delta(
+                            cached_answer.sources
+                        )
+                    }
+                )
+            writer(
+                {
+                    "yield_value": streaming_service.format_text_chunk(
+                        cached_answer.answer
+                    )
+                }
+            )
+            writer(
+                {
+                    "yield_value": streaming_service.format_terminal_info_delta(
+                        "🎉 Q&A answer generated successfully!"
+                    )
+                }
+            )
+            return {
+                "reformulated_query": reformulated_query,
+                "final_written_report": cached_answer.answer,
+                "reranked_documents": cached_answer.reranked_documents,
+            }
 
     try:
         # First, fetch user-selected documents if any
@@ -1402,34 +1303,47 @@ async def handle_qna_workflow(
                     }
                 )
 
-        # Create connector service using state db_session
-        connector_service = ConnectorService(
-            state.db_session, user_id=configuration.user_id
-        )
-        await connector_service.initialize_counter()
-
-        # Use the reformulated query as a single research question
-        research_questions = [reformulated_query, user_query]
+        # Search the reformulated query too; its results are ranked first
+        if search_tasks and reformulated_query != user_query:
+            search_tasks.insert(
+                0,
+                asyncio.create_task(
+                    search_research_questions(
+                        research_questions=[reformulated_query],
+                        connector_service=connector_service,
+                        **search_kwargs,
+                    )
+                ),
+            )
 
-        relevant_documents = await fetch_relevant_documents(
-            research_questions=research_questions,
-            user_id=configuration.user_id,
-            search_space_id=configuration.search_space_id,
-            db_session=state.db_session,
-            connectors_to_search=configuration.connectors_to_search,
-            writer=writer,
-            state=state,
-            top_k=top_k,
-            connector_service=connector_service,
-            search_mode=configuration.search_mode,
-            user_selected_sources=user_selected_sources,
-        )
+        raw_documents = []
+        sources = []
+        for result in await asyncio.gather(*search_tasks, return_exceptions=True):
+            if isinstance(result, Exception):
+                error_message = f"Error fetching relevant documents for QNA: {result!s}"
+                print(error_message)
+                writer({"yield_value": streaming_service.format_error(error_message)})
+                continue
+            raw_documents.extend(result[0])
+            sources.extend(result[1])
+
+        if search_tasks:
+            relevant_documents = deduplicate_search_results(
+                raw_documents,
+                sources,
+                user_selected_sources=user_selected_sources,
+                writer=writer,
+                state=state,
+            )
     except Exception as e:
         error_message = f"Error fetching relevant documents for QNA: {e!s}"
         print(error_message)
         writer({"yield_value": streaming_service.format_error(error_message)})
         # Continue with empty documents - the QNA agent will handle this gracefully
         relevant_documents = []
+    finally:
+        for task in search_tasks:
+            task.cancel()
 
     # Combine user-selected documents with connector-fetched documents
     all_documents = user_selected_documents + relevant_documents
@@ -1439,6 +1353,7 @@ async def handle_qna_workflow(
     print(f"Total documents for QNA: {len(all_documents)}")
 
     # Extract and stream sources from all_documents
+    sources_to_stream = []
     if all_documents:
         sources_to_stream = extract_sources_from_documents(all_documents)
         writer(
@@ -1467,6 +1382,7 @@ async def handle_qna_workflow(
 
     # Create the state for the QNA agent (it has a different state structure)
     qna_state = {"db_session": state.db_session, "chat_history": state.chat_history}
+    further_questions_task = None
 
     try:
         writer(
@@ -1480,41 +1396,77 @@ async def handle_qna_workflow(
         # Track streaming content for real-time updates
         complete_content = ""
         captured_reranked_documents = []
+        next_progress_word_count = 0
 
-        # Call the QNA agent with streaming
-        async for _chunk_type, chunk in qna_agent_graph.astream(
-            qna_state, qna_config, stream_mode=["values"]
-        ):
-            if "final_answer" in chunk:
-                new_content = chunk["final_answer"]
-                if new_content and new_content != complete_content:
-                    # Extract only the new content (delta)
-                    delta = new_content[len(complete_content) :]
-                    complete_content = new_content
-
-                    # Stream the real-time answer if there's new content
-                    if delta:
-                        # Update terminal with progress
-                        word_count = len(complete_content.split())
-                        writer(
-                            {
-                                "yield_value": streaming_service.format_terminal_info_delta(
-                                    f"✍️ Writing answer... ({word_count} words)"
-                                )
-                            }
-                        )
+        def stream_answer_delta(delta: str) -> None:
+            nonlocal complete_content, next_progress_word_count
+            complete_content += delta
 
-                        writer(
-                            {"yield_value": streaming_service.format_text_chunk(delta)}
+            # Update terminal with progress every ANSWER_PROGRESS_WORDS words
+            word_count = len(complete_content.split())
+            if word_count >= next_progress_word_count:
+                writer(
+                    {
+                        "yield_value": streaming_service.format_terminal_info_delta(
+                            f"✍️ Writing answer... ({word_count} words)"
                         )
+                    }
+                )
+                next_progress_word_count = word_count + ANSWER_PROGRESS_WORDS
+
+            writer({"yield_value": streaming_service.format_text_chunk(delta)})
 
-            # Capture reranked documents from QNA agent for further question generation
-            if "reranked_documents" in chunk:
+        # Call the QNA agent, streaming the answer tokens as the LLM produces them
+        async for chunk_type, chunk in qna_agent_graph.astream(
+            qna_state, qna_config, stream_mode=["messages", "values"]
+        ):
+            if chunk_type == "messages":
+                message_chunk, metadata = chunk
+                if (
+                    metadata.get("langgraph_node") == "answer_question"
+                    and isinstance(message_chunk.content, str)
+                    and message_chunk.content
+                ):
+                    stream_answer_delta(message_chunk.content)
+                continue
+
+            # Stream whatever the token stream missed (e.g. a model without streaming)
+            final_answer = chunk.get("final_answer")
+            if final_answer and final_answer.startswith(complete_content):
+                delta = final_answer[len(complete_content) :]
+                if delta:
+                    stream_answer_delta(delta)
+
+            # Capture reranked documents from QNA agent and start generating the
+            # further questions while the answer is streamed
+            if chunk.get("reranked_documents") is not None:
                 captured_reranked_documents = chunk["reranked_documents"]
+                if further_questions_task is None:
+                    writer(
+                        {
+                            "yield_value": streaming_service.format_terminal_info_delta(
+                                "🤔 Generating follow-up questions..."
+                            )
+                        }
+                    )
+                    further_questions_task = start_further_questions_task(
+                        state, configuration, captured_reranked_documents
+                    )
 
         # Set default if no content was received
         if not complete_content:
             complete_content = "I couldn't find relevant information in your knowledge base to answer this question."
+        elif index_version is not None:
+            answer_cache.put(
+                configuration.search_space_id,
+                index_version,
+                answer_context_key,
+                reformulated_query,
+                query_embedding,
+                complete_content,
+                sources_to_stream,
+                captured_reranked_documents,
+            )
 
         writer(
             {
@@ -1526,8 +1478,10 @@ async def handle_qna_workflow(
 
         # Return the final answer and captured reranked documents for further question generation
         return {
+            "reformulated_query": reformulated_query,
             "final_written_report": complete_content,
             "reranked_documents": captured_reranked_documents,
+            "further_questions_task": further_questions_task,
         }
 
     except Exception as e:
@@ -1535,85 +1489,60 @@ async def handle_qna_workflow(
         print(error_message)
         writer({"yield_value": streaming_service.format_error(error_message)})
 
-        return {"final_written_report": f"Error generating answer: {e!s}"}
+        return {
+            "final_written_report": f"Error generating answer: {e!s}",
+            "further_questions_task": further_questions_task,
+        }
 
 
-async def generate_further_questions(
-    state: State, config: RunnableConfig, writer: StreamWriter
-) -> dict[str, Any]:
+def format_further_questions_prompt(
+    chat_history: list[Any], reranked_documents: list[dict[str, Any]]
+) -> str:
     """
-    Generate contextually relevant follow-up questions based on chat history and available documents.
+    Build the human message asking for follow-up questions.
 
-    This node takes the chat history and reranked documents from the QNA agent
-    and uses an LLM to generate follow-up questions that would naturally extend the conversation
-    and provide additional value to the user.
+    Args:
+        chat_history: The chat history messages
+        reranked_documents: The documents the answer was generated from
 
     Returns:
-        Dict containing the further questions in the "further_questions" key for state update.
+        str: The prompt with the chat history and documents as XML
     """
-    from app.services.llm_service import get_user_fast_llm
-
-    # Get configuration and state data
-    configuration = Configuration.from_runnable_config(config)
-    chat_history = state.chat_history
-    user_id = configuration.user_id
-    search_space_id = configuration.search_space_id
-    streaming_service = state.streaming_service
-
-    # Get reranked documents from the state (will be populated by sub-agents)
-    reranked_documents = getattr(state, "reranked_documents", None) or []
-
-    writer(
-        {
-            "yield_value": streaming_service.format_terminal_info_delta(
-                "🤔 Generating follow-up questions..."
-            )
-        }
-    )
-
-    # Get user's fast LLM
-    llm = await get_user_fast_llm(state.db_session, user_id, search_space_id)
-    if not llm:
-        error_message = f"No fast LLM configured for user {user_id} in search space {search_space_id}"
-        print(error_message)
-        writer({"yield_value": streaming_service.format_error(error_message)})
-
-        # Stream empty further questions to UI
-        writer({"yield_value": streaming_service.format_further_questions_delta([])})
-        return {"further_questions": []}
-
     # Format chat history for the prompt
-    chat_history_xml = "<chat_history>\n"
+    chat_history_lines = []
     for message in chat_history:
         if hasattr(message, "type"):
             if message.type == "human":
-                chat_history_xml += f"<user>{message.content}</user>\n"
+                chat_history_lines.append(f"<user>{message.content}</user>")
             elif message.type == "ai":
-                chat_history_xml += f"<assistant>{message.content}</assistant>\n"
+                chat_history_lines.append(f"<assistant>{message.content}</assistant>")
         else:
             # Handle other message types if needed
-            chat_history_xml += f"<message>{message!s}</message>\n"
-    chat_history_xml += "</chat_history>"
+            chat_history_lines.append(f"<message>{message!s}</message>")
+    chat_history_xml = "\n".join(
+        ["<chat_history>", *chat_history_lines, "</chat_history>"]
+    )
 
     # Format available documents for the prompt
-    documents_xml = "<documents>\n"
+    document_parts = []
     for i, doc in enumerate(reranked_documents):
         document_info = doc.get("document", {})
         source_id = document_info.get("id", f"doc_{i}")
         source_type = document_info.get("document_type", "UNKNOWN")
         content = doc.get("content", "")
 
-        documents_xml += "<document>\n"
-        documents_xml += "<metadata>\n"
-        documents_xml += f"<source_id>{source_id}</source_id>\n"
-        documents_xml += f"<source_type>{source_type}</source_type>\n"
-        documents_xml += "</metadata>\n"
-        documents_xml += f"<content>\n{content}</content>\n"
-        documents_xml += "</document>\n"
-    documents_xml += "</documents>"
-
-    # Create the human message content
-    human_message_content = f"""
+        document_parts.append(
+            "<document>\n"
+            "<metadata>\n"
+            f"<source_id>{source_id}</source_id>\n"
+            f"<source_type>{source_type}</source_type>\n"
+            "</metadata>\n"
+            f"<content>\n{content}</content>\n"
+            "</document>\n"
+        )
+    documents_xml = "".join(["<documents>\n", *document_parts, "</documents>"])
+
+    return f"""
     {chat_history_xml}
 
     {documents_xml}
@@ -1637,18 +1566,38 @@ async def generate_further_questions(
     Do not include any other text or explanation. Only return the JSON.
     """
 
-    writer(
-        {
-            "yield_value": streaming_service.format_terminal_info_delta(
-                "🧠 Analyzing conversation context to suggest relevant questions..."
-            )
-        }
-    )
+
+async def fetch_further_questions(
+    chat_history: list[Any],
+    reranked_documents: list[dict[str, Any]],
+    user_id: str,
+    search_space_id: int,
+) -> tuple[list[dict[str, Any]], str | None]:
+    """
+    Ask the user's fast LLM for follow-up questions.
+
+    Runs on its own database session, so it can be started as a background task
+    while the answer is still being generated.
+
+    Returns:
+        tuple: (further questions, error message or None)
+    """
+    from app.services.llm_service import get_user_fast_llm
+
+    # Get user's fast LLM
+    async with async_session_maker() as session:
+        llm = await get_user_fast_llm(session, user_id, search_space_id)
+    if not llm:
+        return [], (
+            f"No fast LLM configured for user {user_id} in search space {search_space_id}"
+        )
 
     # Create messages for the LLM
     messages = [
         SystemMessage(content=get_further_questions_system_prompt()),
-        HumanMessage(content=human_message_content),
+        HumanMessage(
+            content=format_further_questions_prompt(chat_history, reranked_documents)
+        ),
     ]
 
     try:
@@ -1661,75 +1610,112 @@ async def generate_further_questions(
         # Find the JSON in the content
         json_start = content.find("{")
         json_end = content.rfind("}") + 1
-        if json_start >= 0 and json_end > json_start:
-            json_str = content[json_start:json_end]
+        if json_start < 0 or json_end <= json_start:
+            return [], (
+                "Warning: Could not find valid JSON in LLM response for further questions"
+            )
 
-            # Parse the JSON string
-            parsed_data = json.loads(json_str)
+        # Parse the JSON string and extract the further_questions array
+        parsed_data = json.loads(content[json_start:json_end])
+        return parsed_data.get("further_questions", []), None
 
-            # Extract the further_questions array
-            further_questions = parsed_data.get("further_questions", [])
+    except (json.JSONDecodeError, ValueError) as e:
+        return [], f"Warning: Error parsing further questions response: {e!s}"
 
-            writer(
-                {
-                    "yield_value": streaming_service.format_terminal_info_delta(
-                        f"✅ Generated {len(further_questions)} contextual follow-up questions!"
-                    )
-                }
-            )
+    except Exception as e:
+        return [], f"Warning: Error generating further questions: {e!s}"
 
-            # Stream the further questions to the UI
-            writer(
-                {
-                    "yield_value": streaming_service.format_further_questions_delta(
-                        further_questions
-                    )
-                }
-            )
 
-            print(f"Successfully generated {len(further_questions)} further questions")
+def start_further_questions_task(
+    state: State,
+    configuration: Configuration,
+    reranked_documents: list[dict[str, Any]],
+) -> asyncio.Task:
+    """
+    Start generating follow-up questions in the background.
 
-            return {"further_questions": further_questions}
-        else:
-            # If JSON structure not found, return empty list
-            error_message = (
-                "Could not find valid JSON in LLM response for further questions"
-            )
-            print(error_message)
-            writer(
-                {
-                    "yield_value": streaming_service.format_error(
-                        f"Warning: {error_message}"
-                    )
-                }
-            )
+    The task is registered in state.background_tasks so it is cancelled if the
+    client disconnects.
+    """
+    task = asyncio.create_task(
+        fetch_further_questions(
+            chat_history=state.chat_history or [],
+            reranked_documents=reranked_documents,
+            user_id=configuration.user_id,
+            search_space_id=configuration.search_space_id,
+        )
+    )
+    if state.background_tasks is not None:
+        state.background_tasks.append(task)
+    return task
 
-            # Stream empty further questions to UI
-            writer(
-                {"yield_value": streaming_service.format_further_questions_delta([])}
-            )
-            return {"further_questions": []}
 
-    except (json.JSONDecodeError, ValueError) as e:
-        # Log the error and return empty list
-        error_message = f"Error parsing further questions response: {e!s}"
-        print(error_message)
+async def generate_further_questions(
+    state: State, config: RunnableConfig, writer: StreamWriter
+) -> dict[str, Any]:
+    """
+    Generate contextually relevant follow-up questions based on chat history and available documents.
+
+    This node takes the chat history and reranked documents from the QNA agent
+    and uses an LLM to generate follow-up questions that would naturally extend the conversation
+    and provide additional value to the user. The generation is usually started
+    by handle_qna_workflow while the answer is streamed, in which case this node
+    only waits for its result.
+
+    Returns:
+        Dict containing the further questions in the "further_questions" key for state update.
+    """
+    configuration = Configuration.from_runnable_config(config)
+    streaming_service = state.streaming_service
+
+    further_questions_task = state.further_questions_task
+    if further_questions_task is None:
         writer(
-            {"yield_value": streaming_service.format_error(f"Warning: {error_message}")}
+            {
+                "yield_value": streaming_service.format_terminal_info_delta(
+                    "🤔 Generating follow-up questions..."
+                )
+            }
         )
+        # Get reranked documents from the state (will be populated by sub-agents)
+        reranked_documents = getattr(state, "reranked_documents", None) or []
+        further_questions_task = start_further_questions_task(
+            state, configuration, reranked_documents
+        )
+
+    writer(
+        {
+            "yield_value": streaming_service.format_terminal_info_delta(
+                "🧠 Analyzing conversation context to suggest relevant questions..."
+            )
+        }
+    )
 
-        # Stream empty further questions to UI
-        writer({"yield_value": streaming_service.format_further_questions_delta([])})
-        return {"further_questions": []}
+    try:
+        further_questions, error_message = await further_questions_task
+    except asyncio.CancelledError:
+        further_questions_task.cancel()
+        raise
 
-    except Exception as e:
-        # Handle any other errors
-        error_message = f"Error generating further questions: {e!s}"
+    if error_message:
         print(error_message)
+        writer({"yield_value": streaming_service.format_error(error_message)})
+    else:
         writer(
-            {"yield_value": streaming_service.format_error(f"Warning: {error_message}")}
+            {
+                "yield_value": streaming_service.format_terminal_info_delta(
+                    f"✅ Generated {len(further_questions)} contextual follow-up questions!"
+                )
+            }
         )
+        print(f"Successfully generated {len(further_questions)} further questions")
 
-        # Stream empty further questions to UI
-        writer({"yield_value": streaming_service.format_further_questions_delta([])})
-        return {"further_questions": []}
+    # Stream the further questions to the UI
+    writer(
+        {
+            "yield_value": streaming_service.format_further_questions_delta(
+                further_questions
+            )
+        }
+    )
+    return {"further_questions": further_questions}
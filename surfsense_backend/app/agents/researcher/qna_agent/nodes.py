@@ -65,22 +65,23 @@ async def rerank_documents(state: State, config: RunnableConfig) -> dict[str, An
             for i, doc in enumerate(documents)
         ]
 
-        # Rerank documents using the user's query
-        reranked_docs = reranker_service.rerank_documents(
+        # Rerank documents using the user's query (best first)
+        reranked_docs = await reranker_service.arerank_documents(
             user_query + "\n" + reformulated_query, reranker_input_docs
         )
 
-        # Sort by score in descending order
-        reranked_docs.sort(key=lambda x: x.get("score", 0), reverse=True)
-
         print(f"Reranked {len(reranked_docs)} documents for Q&A query: {user_query}")
 
         return {"reranked_documents": reranked_docs}
 
     except Exception as e:
         print(f"Error during reranking: {e!s}")
-        # Fall back to original documents if reranking fails
-        return {"reranked_documents": documents}
+        # Fall back to the documents sorted by fused score if reranking fails
+        return {
+            "reranked_documents": sorted(
+                documents, key=lambda doc: doc.get("score", 0), reverse=True
+            )
+        }
 
 
 async def answer_question(state: State, config: RunnableConfig) -> dict[str, Any]:
@@ -192,8 +193,11 @@ async def answer_question(state: State, config: RunnableConfig) -> dict[str, Any
     total_tokens = calculate_token_count(messages_with_chat_history, llm.model)
     print(f"Final token count: {total_tokens}")
 
-    # Call the LLM and get the response
-    response = await llm.ainvoke(messages_with_chat_history)
-    final_answer = response.content
+    # Stream the response so handle_qna_workflow can forward every token as it
+    # arrives (stream_mode="messages") instead of waiting for the full answer
+    final_answer = ""
+    async for chunk in llm.astream(messages_with_chat_history):
+        if isinstance(chunk.content, str):
+            final_answer += chunk.content
 
     return {"final_answer": final_answer}
@@ -33,6 +33,12 @@ class State:
     # Temporary field to hold reranked documents from sub-agents for further question generation
     reranked_documents: list[Any] | None = field(default=None)
 
+    # Further question generation started while the answer is streamed
+    further_questions_task: Any | None = field(default=None)
+
+    # Background tasks of the request, cancelled when the client disconnects
+    background_tasks: list[Any] | None = field(default_factory=list)
+
     # OUTPUT: Populated by agent nodes
     # Using field to explicitly mark as part of state
     final_written_report: str | None = field(default=None)
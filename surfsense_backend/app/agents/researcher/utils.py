@@ -1,9 +1,13 @@
+from bisect import bisect_right
+from itertools import accumulate
 from typing import Any, NamedTuple
 
 from langchain.schema import AIMessage, HumanMessage, SystemMessage
 from langchain_core.messages import BaseMessage
 from litellm import get_model_info, token_counter
 
+from app.utils.tokenization import count_message_tokens_cached
+
 
 class DocumentTokenInfo(NamedTuple):
     """Information about a document and its token cost."""
@@ -113,51 +117,42 @@ def format_documents_section(
 def calculate_document_token_costs(
     documents: list[dict[str, Any]], model: str
 ) -> list[DocumentTokenInfo]:
-    """Pre-calculate token costs for each document."""
-    document_token_info = []
+    """
+    Pre-calculate token costs for each document.
 
-    for i, doc in enumerate(documents):
-        formatted_doc = format_document_for_citation(doc)
+    All documents are tokenized in one batch with a cached tokenizer, and counts
+    are memoized per chunk_id so follow-up turns reuse them.
+    """
+    formatted_docs = [format_document_for_citation(doc) for doc in documents]
+    token_counts = count_message_tokens_cached(
+        formatted_docs, [doc.get("chunk_id") for doc in documents], model
+    )
 
-        # Calculate token count for this document
-        token_count = token_counter(
-            messages=[{"role": "user", "content": formatted_doc}], model=model
+    return [
+        DocumentTokenInfo(
+            index=i,
+            document=doc,
+            formatted_content=formatted_doc,
+            token_count=token_count,
         )
-
-        document_token_info.append(
-            DocumentTokenInfo(
-                index=i,
-                document=doc,
-                formatted_content=formatted_doc,
-                token_count=token_count,
-            )
+        for i, (doc, formatted_doc, token_count) in enumerate(
+            zip(documents, formatted_docs, token_counts, strict=True)
         )
-
-    return document_token_info
+    ]
 
 
 def find_optimal_documents_with_binary_search(
     document_tokens: list[DocumentTokenInfo], available_tokens: int
 ) -> list[DocumentTokenInfo]:
-    """Use binary search to find the maximum number of documents that fit within token limit."""
+    """Find the maximum number of leading documents that fit within the token limit."""
     if not document_tokens or available_tokens <= 0:
         return []
 
-    left, right = 0, len(document_tokens)
-    optimal_docs = []
-
-    while left <= right:
-        mid = (left + right) // 2
-        current_docs = document_tokens[:mid]
-        current_token_sum = sum(doc_info.token_count for doc_info in current_docs)
-
-        if current_token_sum <= available_tokens:
-            optimal_docs = current_docs
-            left = mid + 1
-        else:
-            right = mid - 1
+    # Binary search over the prefix sums of the token counts
+    prefix_sums = list(accumulate(doc_info.token_count for doc_info in document_tokens))
+    document_count = bisect_right(prefix_sums, available_tokens)
 
-    return optimal_docs
+    return document_tokens[:document_count]
 
 
 def get_model_context_window(model_name: str) -> int:
@@ -11,6 +11,7 @@ from app.routes import router as crud_router
 from app.routes.users_routes import router as custom_users_router
 from app.schemas import UserCreate, UserRead, UserUpdate
 from app.users import SECRET, auth_backend, current_active_user, fastapi_users
+from app.utils.per_loop import close_loop_objects
 
 
 @asynccontextmanager
@@ -31,6 +32,9 @@ async def lifespan(app: FastAPI):
         raise
     yield
 
+    # Close the pooled HTTP clients, cache engines and Redis clients
+    await close_loop_objects()
+
 
 def registration_allowed():
     if not config.REGISTRATION_ENABLED:
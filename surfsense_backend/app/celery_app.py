@@ -63,6 +63,7 @@ celery_app = Celery(
         "app.tasks.celery_tasks.podcast_tasks",
         "app.tasks.celery_tasks.connector_tasks",
         "app.tasks.celery_tasks.schedule_checker_task",
+        "app.tasks.celery_tasks.embedding_cache_tasks",
     ],
 )
 
@@ -105,4 +106,12 @@ celery_app.conf.beat_schedule = {
             "expires": 30,  # Task expires after 30 seconds if not picked up
         },
     },
+    # Trim the shared embedding cache table to EMBEDDING_CACHE_MAX_ROWS
+    "prune-embedding-cache": {
+        "task": "prune_embedding_cache",
+        "schedule": crontab(minute=0),
+        "options": {
+            "expires": 3600,
+        },
+    },
 }
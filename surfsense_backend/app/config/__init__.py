@@ -153,6 +153,118 @@ class Config:
         chunk_size=getattr(embedding_model_instance, "max_seq_length", 512)
     )
 
+    # Number of query embeddings kept in memory so a chat turn embeds each
+    # research question once and shares it across every connector search
+    QUERY_EMBEDDING_CACHE_SIZE = int(os.getenv("QUERY_EMBEDDING_CACHE_SIZE", "1024"))
+
+    # Number of document token counts memoized for context window packing
+    TOKEN_COUNT_CACHE_SIZE = int(os.getenv("TOKEN_COUNT_CACHE_SIZE", "10000"))
+
+    # Embedding inference runs on a bounded thread pool. Concurrent embed calls
+    # are coalesced into micro-batches so the event loop is never blocked.
+    EMBEDDING_WORKERS = int(os.getenv("EMBEDDING_WORKERS", "2"))
+    EMBEDDING_MICRO_BATCH_SIZE = int(os.getenv("EMBEDDING_MICRO_BATCH_SIZE", "64"))
+    EMBEDDING_MICRO_BATCH_WAIT_MS = float(
+        os.getenv("EMBEDDING_MICRO_BATCH_WAIT_MS", "5")
+    )
+    EMBEDDING_QUEUE_SIZE = int(os.getenv("EMBEDDING_QUEUE_SIZE", "4096"))
+
+    # Document chunks are embedded in batches of EMBEDDING_BATCH_SIZE with at most
+    # EMBEDDING_MAX_CONCURRENCY batches in flight (useful for remote providers)
+    EMBEDDING_BATCH_SIZE = int(os.getenv("EMBEDDING_BATCH_SIZE", "64"))
+    EMBEDDING_MAX_CONCURRENCY = int(os.getenv("EMBEDDING_MAX_CONCURRENCY", "2"))
+
+    # Content-addressed cache of document embeddings keyed by (model, SHA-256 of
+    # the text): an in-memory LRU of EMBEDDING_CACHE_MEMORY_SIZE vectors in front
+    # of the embedding_cache table shared by every process (when
+    # EMBEDDING_CACHE_PERSISTENT), trimmed hourly by Celery beat to the
+    # EMBEDDING_CACHE_MAX_ROWS most recently used rows (0 = unlimited).
+    EMBEDDING_CACHE_MEMORY_SIZE = int(os.getenv("EMBEDDING_CACHE_MEMORY_SIZE", "5000"))
+    EMBEDDING_CACHE_PERSISTENT = (
+        os.getenv("EMBEDDING_CACHE_PERSISTENT", "TRUE").upper() == "TRUE"
+    )
+    EMBEDDING_CACHE_MAX_ROWS = int(os.getenv("EMBEDDING_CACHE_MAX_ROWS", "1000000"))
+
+    # Vector index parameters ("hnsw" or "ivfflat"), used when indexes are created.
+    # Rebuild existing indexes online with `python -m app.utils.vector_indexes reindex`.
+    # IVFFlat indexes should only be built once the tables contain data.
+    VECTOR_INDEX_TYPE = os.getenv("VECTOR_INDEX_TYPE", "hnsw").lower()
+    HNSW_M = int(os.getenv("HNSW_M", "16"))
+    HNSW_EF_CONSTRUCTION = int(os.getenv("HNSW_EF_CONSTRUCTION", "64"))
+    IVFFLAT_LISTS = int(os.getenv("IVFFLAT_LISTS", "100"))
+
+    # Opt-in quantized ANN index: "full" (default), "halfvec" (2x smaller) or
+    # "binary" (32x smaller). The index is built on a halfvec / binary_quantize
+    # expression of the embedding column and the retrievers re-rank
+    # EMBEDDING_RESCORE_FACTOR x the requested candidates at full precision.
+    # Run `python -m app.utils.vector_indexes reindex` after changing the mode.
+    EMBEDDING_STORAGE_MODE = os.getenv("EMBEDDING_STORAGE_MODE", "full").lower()
+    EMBEDDING_RESCORE_FACTOR = int(os.getenv("EMBEDDING_RESCORE_FACTOR", "4"))
+
+    # Query-time search parameters (0 keeps the pgvector defaults). The HNSW
+    # ef_search can also be overridden per query through hybrid_search.
+    HNSW_EF_SEARCH = int(os.getenv("HNSW_EF_SEARCH", "0"))
+    IVFFLAT_PROBES = int(os.getenv("IVFFLAT_PROBES", "0"))
+
+    # pgvector >= 0.8 iterative index scans ("off", "relaxed_order" or
+    # "strict_order"). When enabled, filtered HNSW searches keep scanning the
+    # index until top_k rows pass the search space / document type filters.
+    HNSW_ITERATIVE_SCAN = os.getenv("HNSW_ITERATIVE_SCAN", "off").lower()
+
+    # Research connector searches run concurrently, each with its own DB session.
+    # A connector that exceeds the timeout (seconds) is skipped so the answer is
+    # generated from the connectors that did respond. CONNECTOR_SEARCH_CONCURRENCY
+    # caps the search sessions open at once across all chats of a process; keep
+    # it below the database pool size (15 connections by default).
+    CONNECTOR_SEARCH_TIMEOUT = float(os.getenv("CONNECTOR_SEARCH_TIMEOUT", "30"))
+    CONNECTOR_SEARCH_CONCURRENCY = int(os.getenv("CONNECTOR_SEARCH_CONCURRENCY", "8"))
+
+    # Web search providers share pooled keep-alive HTTP clients (HTTP/2 when the
+    # h2 package is installed). Each provider gets at most
+    # WEB_SEARCH_PROVIDER_CONCURRENCY requests in flight per process.
+    HTTP_CLIENT_TIMEOUT = float(os.getenv("HTTP_CLIENT_TIMEOUT", "30"))
+    HTTP_CLIENT_MAX_CONNECTIONS = int(os.getenv("HTTP_CLIENT_MAX_CONNECTIONS", "100"))
+    HTTP_CLIENT_MAX_KEEPALIVE = int(os.getenv("HTTP_CLIENT_MAX_KEEPALIVE", "20"))
+    WEB_SEARCH_PROVIDER_CONCURRENCY = int(
+        os.getenv("WEB_SEARCH_PROVIDER_CONCURRENCY", "8")
+    )
+
+    # Web search responses are cached for WEB_SEARCH_CACHE_TTL_SECONDS (0 = off),
+    # in Redis when WEB_SEARCH_CACHE_REDIS_URL is set and in memory otherwise.
+    # WEB_SEARCH_CACHE_DISABLED_PROVIDERS is a comma-separated list of connector
+    # types (e.g. TAVILY_API,LINKUP_API) whose results are never cached.
+    WEB_SEARCH_CACHE_TTL_SECONDS = int(os.getenv("WEB_SEARCH_CACHE_TTL_SECONDS", "600"))
+    WEB_SEARCH_CACHE_SIZE = int(os.getenv("WEB_SEARCH_CACHE_SIZE", "1000"))
+    WEB_SEARCH_CACHE_REDIS_URL = os.getenv("WEB_SEARCH_CACHE_REDIS_URL")
+    WEB_SEARCH_CACHE_DISABLED_PROVIDERS = {
+        provider.strip().upper()
+        for provider in os.getenv("WEB_SEARCH_CACHE_DISABLED_PROVIDERS", "").split(",")
+        if provider.strip()
+    }
+
+    # Connector indexing pipeline: items flow through bounded queues of
+    # INDEXING_PIPELINE_QUEUE_SIZE between the transform, existence lookup,
+    # process (summary, chunks and embeddings) and write stages, so fetching,
+    # model calls and DB writes overlap instead of running one item at a time.
+    INDEXING_PIPELINE_QUEUE_SIZE = int(os.getenv("INDEXING_PIPELINE_QUEUE_SIZE", "100"))
+    INDEXING_PIPELINE_TRANSFORM_CONCURRENCY = int(
+        os.getenv("INDEXING_PIPELINE_TRANSFORM_CONCURRENCY", "2")
+    )
+    INDEXING_PIPELINE_PROCESS_CONCURRENCY = int(
+        os.getenv("INDEXING_PIPELINE_PROCESS_CONCURRENCY", "4")
+    )
+    INDEXING_PIPELINE_LOOKUP_BATCH_SIZE = int(
+        os.getenv("INDEXING_PIPELINE_LOOKUP_BATCH_SIZE", "100")
+    )
+    INDEXING_PIPELINE_COMMIT_BATCH_SIZE = int(
+        os.getenv("INDEXING_PIPELINE_COMMIT_BATCH_SIZE", "10")
+    )
+
+    # New connector documents are written in bulk; their chunks are streamed
+    # with COPY when the database driver supports it (asyncpg) and inserted with
+    # multi-row INSERTs otherwise.
+    BULK_INSERT_USE_COPY = os.getenv("BULK_INSERT_USE_COPY", "TRUE").upper() == "TRUE"
+
     # Reranker's Configuration | Pinecode, Cohere etc. Read more at https://github.com/AnswerDotAI/rerankers?tab=readme-ov-file#usage
     RERANKERS_ENABLED = os.getenv("RERANKERS_ENABLED", "FALSE").upper() == "TRUE"
     if RERANKERS_ENABLED:
@@ -165,6 +277,30 @@ class Config:
     else:
         reranker_instance = None
 
+    # Reranking runs on RERANKER_WORKERS threads with cached (query, chunk) scores.
+    # RERANKER_TOP_N limits reranking to the best fused candidates (0 = all) and
+    # RERANKER_LATENCY_BUDGET_MS falls back to the fused order when exceeded (0 = off).
+    RERANKER_WORKERS = int(os.getenv("RERANKER_WORKERS", "1"))
+    RERANKER_CACHE_SIZE = int(os.getenv("RERANKER_CACHE_SIZE", "10000"))
+    RERANKER_TOP_N = int(os.getenv("RERANKER_TOP_N", "0"))
+    RERANKER_LATENCY_BUDGET_MS = float(os.getenv("RERANKER_LATENCY_BUDGET_MS", "0"))
+
+    # ChatLiteLLM instances are reused per (user, search space, role) for
+    # LLM_INSTANCE_CACHE_TTL_SECONDS (0 = build a new instance on every call)
+    LLM_INSTANCE_CACHE_TTL_SECONDS = int(
+        os.getenv("LLM_INSTANCE_CACHE_TTL_SECONDS", "300")
+    )
+    LLM_INSTANCE_CACHE_SIZE = int(os.getenv("LLM_INSTANCE_CACHE_SIZE", "256"))
+
+    # Opt-in semantic answer cache: a chat question whose reformulated query is at
+    # least ANSWER_CACHE_SIMILARITY similar (cosine) to a cached one in the same
+    # search space replays the cached answer. Entries are dropped when a document
+    # of the search space changes or after ANSWER_CACHE_TTL_SECONDS.
+    ANSWER_CACHE_ENABLED = os.getenv("ANSWER_CACHE_ENABLED", "FALSE").upper() == "TRUE"
+    ANSWER_CACHE_SIMILARITY = float(os.getenv("ANSWER_CACHE_SIMILARITY", "0.95"))
+    ANSWER_CACHE_TTL_SECONDS = int(os.getenv("ANSWER_CACHE_TTL_SECONDS", "86400"))
+    ANSWER_CACHE_SIZE = int(os.getenv("ANSWER_CACHE_SIZE", "1000"))
+
     # OAuth JWT
     SECRET_KEY = os.getenv("SECRET_KEY")
 
@@ -193,15 +329,18 @@ class Config:
     STT_SERVICE_API_KEY = os.getenv("STT_SERVICE_API_KEY")
 
     # Validation Checks
-    # Check embedding dimension
+    # Check embedding dimension against the pgvector index limit of the storage mode
+    max_indexed_dimension = {"halfvec": 4000, "binary": 64000}.get(
+        EMBEDDING_STORAGE_MODE, 2000
+    )
     if (
         hasattr(embedding_model_instance, "dimension")
-        and embedding_model_instance.dimension > 2000
+        and embedding_model_instance.dimension > max_indexed_dimension
     ):
         raise ValueError(
             f"Embedding dimension for Model: {EMBEDDING_MODEL} "
             f"has {embedding_model_instance.dimension} dimensions, which "
-            f"exceeds the maximum of 2000 allowed by PGVector."
+            f"exceeds the maximum of {max_indexed_dimension} allowed by PGVector."
         )
 
     @classmethod
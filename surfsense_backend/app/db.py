@@ -11,21 +11,31 @@ from sqlalchemy import (
     TIMESTAMP,
     Boolean,
     Column,
+    Computed,
     Enum as SQLAlchemyEnum,
     ForeignKey,
+    Index,
     Integer,
     String,
     Text,
     UniqueConstraint,
+    event,
     text,
 )
-from sqlalchemy.dialects.postgresql import UUID
+from sqlalchemy.dialects.postgresql import TSVECTOR, UUID
 from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
-from sqlalchemy.orm import DeclarativeBase, Mapped, declared_attr, relationship
+from sqlalchemy.orm import (
+    DeclarativeBase,
+    Mapped,
+    declared_attr,
+    deferred,
+    relationship,
+)
 
 from app.config import config
 from app.retriver.chunks_hybrid_search import ChucksHybridSearchRetriever
 from app.retriver.documents_hybrid_search import DocumentHybridSearchRetriever
+from app.utils.vector_indexes import vector_index_definition
 
 if config.AUTH_TYPE == "GOOGLE":
     from fastapi_users.db import SQLAlchemyBaseOAuthAccountTableUUID
@@ -175,6 +185,10 @@ class Document(BaseModel, TimestampMixin):
     content_hash = Column(String, nullable=False, index=True, unique=True)
     unique_identifier_hash = Column(String, nullable=True, index=True, unique=True)
     embedding = Column(Vector(config.embedding_model_instance.dimension))
+    # Stored full-text vector so keyword search does not re-tokenize content
+    search_vector = deferred(
+        Column(TSVECTOR, Computed("to_tsvector('english', content)", persisted=True))
+    )
 
     search_space_id = Column(
         Integer, ForeignKey("searchspaces.id", ondelete="CASCADE"), nullable=False
@@ -189,13 +203,69 @@ class Chunk(BaseModel, TimestampMixin):
     __tablename__ = "chunks"
 
     content = Column(Text, nullable=False)
+    # SHA-256 of the content, so document updates keep unchanged chunks and
+    # their embeddings (see create_document_chunks)
+    content_hash = Column(String, nullable=True)
+    # Position of the chunk in its document (reused chunks keep their id)
+    position = Column(Integer, nullable=True)
     embedding = Column(Vector(config.embedding_model_instance.dimension))
+    # Stored full-text vector so keyword search does not re-tokenize content
+    search_vector = deferred(
+        Column(TSVECTOR, Computed("to_tsvector('english', content)", persisted=True))
+    )
 
     document_id = Column(
         Integer, ForeignKey("documents.id", ondelete="CASCADE"), nullable=False
     )
     document = relationship("Document", back_populates="chunks")
 
+    # Copied from the parent document (see copy_document_fields_to_chunk) so chunk
+    # searches can filter without joining documents and searchspaces
+    search_space_id = Column(
+        Integer, ForeignKey("searchspaces.id", ondelete="CASCADE"), nullable=False
+    )
+    document_type = Column(SQLAlchemyEnum(DocumentType), nullable=False)
+
+    __table_args__ = (
+        Index(
+            "ix_chunks_search_space_id_document_type",
+            "search_space_id",
+            "document_type",
+        ),
+    )
+
+
+@event.listens_for(Chunk, "before_insert")
+def copy_document_fields_to_chunk(mapper, connection, target):
+    """Keep the denormalized chunk columns in sync with the parent document."""
+    document = target.document
+    if document is not None:
+        target.search_space_id = document.search_space_id
+        target.document_type = document.document_type
+
+
+INCREMENT_INDEX_VERSION = text(
+    "UPDATE searchspaces SET index_version = index_version + 1 WHERE id = ANY(:ids)"
+)
+
+
+async def increment_index_version(
+    session: AsyncSession, *search_space_ids: int
+) -> None:
+    """
+    Increment the index version of search spaces whose documents changed.
+
+    Call it right before committing a batch of document changes: the search
+    space rows stay locked until the commit.
+    """
+    ids = [
+        search_space_id
+        for search_space_id in set(search_space_ids)
+        if search_space_id is not None
+    ]
+    if ids:
+        await session.execute(INCREMENT_INDEX_VERSION, {"ids": ids})
+
 
 class Podcast(BaseModel, TimestampMixin):
     __tablename__ = "podcasts"
@@ -216,6 +286,10 @@ class SearchSpace(BaseModel, TimestampMixin):
     name = Column(String(100), nullable=False, index=True)
     description = Column(String(500), nullable=True)
 
+    # Incremented whenever a batch of document changes of the search space is
+    # committed (see increment_index_version), so cached answers can be invalidated
+    index_version = Column(Integer, nullable=False, default=0, server_default="0")
+
     user_id = Column(
         UUID(as_uuid=True), ForeignKey("user.id", ondelete="CASCADE"), nullable=False
     )
@@ -384,6 +458,24 @@ class Log(BaseModel, TimestampMixin):
     search_space = relationship("SearchSpace", back_populates="logs")
 
 
+class EmbeddingCacheEntry(Base):
+    """Content-addressed document embedding, see embedding_cache_service."""
+
+    __tablename__ = "embedding_cache"
+
+    model = Column(String, primary_key=True)
+    # SHA-256 of the embedded text
+    text_hash = Column(String(64), primary_key=True)
+    # Dimensionless so entries of models with different dimensions can coexist
+    embedding = Column(Vector(), nullable=False)
+    last_used_at = Column(
+        TIMESTAMP(timezone=True),
+        nullable=False,
+        default=lambda: datetime.now(UTC),
+        index=True,
+    )
+
+
 if config.AUTH_TYPE == "GOOGLE":
 
     class OAuthAccount(SQLAlchemyBaseOAuthAccountTableUUID, Base):
@@ -429,23 +521,23 @@ async def setup_indexes():
         # Document Summary Indexes
         await conn.execute(
             text(
-                "CREATE INDEX IF NOT EXISTS document_vector_index ON documents USING hnsw (embedding public.vector_cosine_ops)"
+                f"CREATE INDEX IF NOT EXISTS document_vector_index ON documents {vector_index_definition()}"
             )
         )
         await conn.execute(
             text(
-                "CREATE INDEX IF NOT EXISTS document_search_index ON documents USING gin (to_tsvector('english', content))"
+                "CREATE INDEX IF NOT EXISTS document_search_vector_index ON documents USING gin (search_vector)"
             )
         )
         # Document Chuck Indexes
         await conn.execute(
             text(
-                "CREATE INDEX IF NOT EXISTS chucks_vector_index ON chunks USING hnsw (embedding public.vector_cosine_ops)"
+                f"CREATE INDEX IF NOT EXISTS chucks_vector_index ON chunks {vector_index_definition()}"
             )
         )
         await conn.execute(
             text(
-                "CREATE INDEX IF NOT EXISTS chucks_search_index ON chunks USING gin (to_tsvector('english', content))"
+                "CREATE INDEX IF NOT EXISTS chucks_search_vector_index ON chunks USING gin (search_vector)"
             )
         )
 
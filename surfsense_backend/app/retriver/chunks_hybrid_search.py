@@ -14,6 +14,7 @@ class ChucksHybridSearchRetriever:
         top_k: int,
         user_id: str,
         search_space_id: int | None = None,
+        ef_search: int | None = None,
     ) -> list:
         """
         Perform vector similarity search on chunks.
@@ -23,6 +24,8 @@ class ChucksHybridSearchRetriever:
             top_k: Number of results to return
             user_id: The ID of the user performing the search
             search_space_id: Optional search space ID to filter results
+            ef_search: Optional HNSW ef_search for this query (higher for recall,
+                lower for latency); defaults to HNSW_EF_SEARCH
 
         Returns:
             List of chunks sorted by vector similarity
@@ -30,28 +33,32 @@ class ChucksHybridSearchRetriever:
         from sqlalchemy import select
         from sqlalchemy.orm import joinedload
 
-        from app.config import config
-        from app.db import Chunk, Document, SearchSpace
+        from app.db import Chunk, Document
+        from app.services.embedding_service import get_query_embedding
+        from app.utils.vector_indexes import (
+            configure_vector_search,
+            semantic_rank_query,
+        )
 
-        # Get embedding for the query
-        embedding_model = config.embedding_model_instance
-        query_embedding = embedding_model.embed(query_text)
+        # Get embedding for the query (shared across connector searches)
+        query_embedding = await get_query_embedding(query_text)
+
+        # Nearest chunks with user ownership check (re-scored if the index is quantized)
+        nearest_chunks = semantic_rank_query(
+            Chunk,
+            query_embedding,
+            self._ownership_conditions(user_id, search_space_id),
+            top_k,
+        ).subquery()
 
-        # Build the base query with user ownership check
         query = (
             select(Chunk)
             .options(joinedload(Chunk.document).joinedload(Document.search_space))
-            .join(Document, Chunk.document_id == Document.id)
-            .join(SearchSpace, Document.search_space_id == SearchSpace.id)
-            .where(SearchSpace.user_id == user_id)
+            .join(nearest_chunks, Chunk.id == nearest_chunks.c.id)
+            .order_by(nearest_chunks.c.rank)
         )
 
-        # Add search space filter if provided
-        if search_space_id is not None:
-            query = query.where(Document.search_space_id == search_space_id)
-
-        # Add vector similarity ordering
-        query = query.order_by(Chunk.embedding.op("<=>")(query_embedding)).limit(top_k)
+        await configure_vector_search(self.db_session, ef_search, top_k)
 
         # Execute the query
         result = await self.db_session.execute(query)
@@ -81,28 +88,22 @@ class ChucksHybridSearchRetriever:
         from sqlalchemy import func, select
         from sqlalchemy.orm import joinedload
 
-        from app.db import Chunk, Document, SearchSpace
+        from app.db import Chunk, Document
 
-        # Create tsvector and tsquery for PostgreSQL full-text search
-        tsvector = func.to_tsvector("english", Chunk.content)
+        # Use the stored tsvector column and a tsquery for PostgreSQL full-text search
+        tsvector = Chunk.search_vector
         tsquery = func.plainto_tsquery("english", query_text)
 
         # Build the base query with user ownership check
         query = (
             select(Chunk)
             .options(joinedload(Chunk.document).joinedload(Document.search_space))
-            .join(Document, Chunk.document_id == Document.id)
-            .join(SearchSpace, Document.search_space_id == SearchSpace.id)
-            .where(SearchSpace.user_id == user_id)
+            .where(*self._ownership_conditions(user_id, search_space_id))
             .where(
                 tsvector.op("@@")(tsquery)
             )  # Only include results that match the query
         )
 
-        # Add search space filter if provided
-        if search_space_id is not None:
-            query = query.where(Document.search_space_id == search_space_id)
-
         # Add text search ranking
         query = query.order_by(func.ts_rank_cd(tsvector, tsquery).desc()).limit(top_k)
 
@@ -119,6 +120,7 @@ class ChucksHybridSearchRetriever:
         user_id: str,
         search_space_id: int | None = None,
         document_type: str | None = None,
+        ef_search: int | None = None,
     ) -> list:
         """
         Combine vector similarity and full-text search results using Reciprocal Rank Fusion.
@@ -129,6 +131,8 @@ class ChucksHybridSearchRetriever:
             user_id: The ID of the user performing the search
             search_space_id: Optional search space ID to filter results
             document_type: Optional document type to filter results (e.g., "FILE", "CRAWLED_URL")
+            ef_search: Optional HNSW ef_search for this query (higher for recall,
+                lower for latency); defaults to HNSW_EF_SEARCH
 
         Returns:
             List of dictionaries containing chunk data and relevance scores
@@ -136,27 +140,26 @@ class ChucksHybridSearchRetriever:
         from sqlalchemy import func, select, text
         from sqlalchemy.orm import joinedload
 
-        from app.config import config
-        from app.db import Chunk, Document, DocumentType, SearchSpace
+        from app.db import Chunk, DocumentType
+        from app.services.embedding_service import get_query_embedding
+        from app.utils.vector_indexes import (
+            configure_vector_search,
+            semantic_rank_query,
+        )
 
-        # Get embedding for the query
-        embedding_model = config.embedding_model_instance
-        query_embedding = embedding_model.embed(query_text)
+        # Get embedding for the query (shared across connector searches)
+        query_embedding = await get_query_embedding(query_text)
 
         # Constants for RRF calculation
         k = 60  # Constant for RRF calculation
         n_results = top_k * 2  # Get more results for better fusion
 
-        # Create tsvector and tsquery for PostgreSQL full-text search
-        tsvector = func.to_tsvector("english", Chunk.content)
+        # Use the stored tsvector column and a tsquery for PostgreSQL full-text search
+        tsvector = Chunk.search_vector
         tsquery = func.plainto_tsquery("english", query_text)
 
-        # Base conditions for document filtering
-        base_conditions = [SearchSpace.user_id == user_id]
-
-        # Add search space filter if provided
-        if search_space_id is not None:
-            base_conditions.append(Document.search_space_id == search_space_id)
+        # Base conditions for chunk filtering (user ownership and search space)
+        base_conditions = self._ownership_conditions(user_id, search_space_id)
 
         # Add document type filter if provided
         if document_type is not None:
@@ -164,31 +167,17 @@ class ChucksHybridSearchRetriever:
             if isinstance(document_type, str):
                 try:
                     doc_type_enum = DocumentType[document_type]
-                    base_conditions.append(Document.document_type == doc_type_enum)
+                    base_conditions.append(Chunk.document_type == doc_type_enum)
                 except KeyError:
                     # If the document type doesn't exist in the enum, return empty results
                     return []
             else:
-                base_conditions.append(Document.document_type == document_type)
+                base_conditions.append(Chunk.document_type == document_type)
 
         # CTE for semantic search with user ownership check
-        semantic_search_cte = (
-            select(
-                Chunk.id,
-                func.rank()
-                .over(order_by=Chunk.embedding.op("<=>")(query_embedding))
-                .label("rank"),
-            )
-            .join(Document, Chunk.document_id == Document.id)
-            .join(SearchSpace, Document.search_space_id == SearchSpace.id)
-            .where(*base_conditions)
-        )
-
-        semantic_search_cte = (
-            semantic_search_cte.order_by(Chunk.embedding.op("<=>")(query_embedding))
-            .limit(n_results)
-            .cte("semantic_search")
-        )
+        semantic_search_cte = semantic_rank_query(
+            Chunk, query_embedding, base_conditions, n_results
+        ).cte("semantic_search")
 
         # CTE for keyword search with user ownership check
         keyword_search_cte = (
@@ -198,8 +187,6 @@ class ChucksHybridSearchRetriever:
                 .over(order_by=func.ts_rank_cd(tsvector, tsquery).desc())
                 .label("rank"),
             )
-            .join(Document, Chunk.document_id == Document.id)
-            .join(SearchSpace, Document.search_space_id == SearchSpace.id)
             .where(*base_conditions)
             .where(tsvector.op("@@")(tsquery))
         )
@@ -236,6 +223,8 @@ class ChucksHybridSearchRetriever:
             .limit(top_k)
         )
 
+        await configure_vector_search(self.db_session, ef_search, n_results)
+
         # Execute the query
         result = await self.db_session.execute(final_query)
         chunks_with_scores = result.all()
@@ -245,22 +234,205 @@ class ChucksHybridSearchRetriever:
             return []
 
         # Convert to serializable dictionaries if no reranker is available or if reranking failed
-        serialized_results = []
-        for chunk, score in chunks_with_scores:
-            serialized_results.append(
-                {
-                    "chunk_id": chunk.id,
-                    "content": chunk.content,
-                    "score": float(score),  # Ensure score is a Python float
-                    "document": {
-                        "id": chunk.document.id,
-                        "title": chunk.document.title,
-                        "document_type": chunk.document.document_type.value
-                        if hasattr(chunk.document, "document_type")
-                        else None,
-                        "metadata": chunk.document.document_metadata,
-                    },
-                }
+        return [
+            self._serialize_chunk(chunk, score) for chunk, score in chunks_with_scores
+        ]
+
+    async def hybrid_search_by_document_types(
+        self,
+        query_text: str,
+        top_k: int,
+        user_id: str,
+        search_space_id: int | None = None,
+        document_types: list[str] | None = None,
+        ef_search: int | None = None,
+    ) -> dict[str, list]:
+        """
+        Run hybrid search for several document types in a single SQL statement.
+
+        Each document type gets its own semantic and keyword candidate lists (one
+        UNION ALL branch per type, so every branch can still use the vector and
+        full-text indexes). The candidates are fused with Reciprocal Rank Fusion
+        and a window partitioned by document type keeps the top_k chunks of each
+        type. This replaces one round trip per connector with one per question.
+
+        Args:
+            query_text: The search query text
+            top_k: Number of results to return per document type
+            user_id: The ID of the user performing the search
+            search_space_id: Optional search space ID to filter results
+            document_types: Document types to search (e.g., ["FILE", "CRAWLED_URL"])
+            ef_search: Optional HNSW ef_search for this query (higher for recall,
+                lower for latency); defaults to HNSW_EF_SEARCH
+
+        Returns:
+            Dictionary mapping each requested document type to its list of chunk
+            dictionaries (same format as hybrid_search)
+        """
+        from sqlalchemy import func, select, union_all
+        from sqlalchemy.orm import joinedload
+
+        from app.db import Chunk, DocumentType
+        from app.services.embedding_service import get_query_embedding
+        from app.utils.vector_indexes import (
+            configure_vector_search,
+            semantic_rank_query,
+        )
+
+        # Only keep document types that exist in the enum
+        doc_type_enums = []
+        for document_type in document_types or []:
+            if isinstance(document_type, DocumentType):
+                doc_type_enums.append(document_type)
+            elif document_type in DocumentType.__members__:
+                doc_type_enums.append(DocumentType[document_type])
+
+        results: dict[str, list] = {doc_type.value: [] for doc_type in doc_type_enums}
+        if not doc_type_enums:
+            return results
+
+        # Get embedding for the query (shared across connector searches)
+        query_embedding = await get_query_embedding(query_text)
+
+        # Constants for RRF calculation
+        k = 60  # Constant for RRF calculation
+        n_results = top_k * 2  # Get more results for better fusion
+
+        # Use the stored tsvector column and a tsquery for PostgreSQL full-text search
+        tsvector = Chunk.search_vector
+        tsquery = func.plainto_tsquery("english", query_text)
+
+        # Base conditions for chunk filtering (user ownership and search space)
+        base_conditions = self._ownership_conditions(user_id, search_space_id)
+
+        semantic_branches = []
+        keyword_branches = []
+        for doc_type in doc_type_enums:
+            # Top candidates by vector similarity for this document type
+            semantic_branch = semantic_rank_query(
+                Chunk,
+                query_embedding,
+                [*base_conditions, Chunk.document_type == doc_type],
+                n_results,
+                Chunk.document_type,
+            ).subquery()
+            semantic_branches.append(select(semantic_branch))
+
+            # Top candidates by keyword relevance for this document type
+            keyword_branch = (
+                select(
+                    Chunk.id,
+                    Chunk.document_type,
+                    func.rank()
+                    .over(order_by=func.ts_rank_cd(tsvector, tsquery).desc())
+                    .label("rank"),
+                )
+                .where(*base_conditions, Chunk.document_type == doc_type)
+                .where(tsvector.op("@@")(tsquery))
+                .order_by(func.ts_rank_cd(tsvector, tsquery).desc())
+                .limit(n_results)
+                .subquery()
+            )
+            keyword_branches.append(select(keyword_branch))
+
+        semantic_search_cte = union_all(*semantic_branches).cte("semantic_search")
+        keyword_search_cte = union_all(*keyword_branches).cte("keyword_search")
+
+        # Fuse both candidate lists with RRF and rank the fused chunks per type
+        score = (
+            func.coalesce(1.0 / (k + semantic_search_cte.c.rank), 0.0)
+            + func.coalesce(1.0 / (k + keyword_search_cte.c.rank), 0.0)
+        ).label("score")
+        document_type_column = func.coalesce(
+            semantic_search_cte.c.document_type, keyword_search_cte.c.document_type
+        )
+        fused_results = (
+            select(
+                func.coalesce(semantic_search_cte.c.id, keyword_search_cte.c.id).label(
+                    "id"
+                ),
+                score,
+                func.row_number()
+                .over(partition_by=document_type_column, order_by=score.desc())
+                .label("type_rank"),
+            )
+            .select_from(
+                semantic_search_cte.outerjoin(
+                    keyword_search_cte,
+                    semantic_search_cte.c.id == keyword_search_cte.c.id,
+                    full=True,
+                )
+            )
+            .subquery("fused_results")
+        )
+
+        final_query = (
+            select(Chunk, fused_results.c.score)
+            .join(fused_results, Chunk.id == fused_results.c.id)
+            .where(fused_results.c.type_rank <= top_k)
+            .options(joinedload(Chunk.document))
+            .order_by(fused_results.c.score.desc())
+        )
+
+        await configure_vector_search(self.db_session, ef_search, n_results)
+
+        # Execute the query
+        result = await self.db_session.execute(final_query)
+
+        # Split the rows back into per-document-type result lists
+        for chunk, chunk_score in result.all():
+            serialized_chunk = self._serialize_chunk(chunk, chunk_score)
+            results.setdefault(
+                serialized_chunk["document"]["document_type"], []
+            ).append(serialized_chunk)
+
+        return results
+
+    @staticmethod
+    def _ownership_conditions(user_id: str, search_space_id: int | None) -> list:
+        """
+        Build the chunk filters for user ownership and the optional search space.
+
+        Chunks carry their search space, so ownership is checked against the
+        user's search space IDs instead of joining documents and searchspaces.
+        The equality filter on search_space_id also lets Postgres prune to a
+        single partition when chunks is partitioned (see app.utils.chunk_partitioning).
+        """
+        from sqlalchemy import select
+
+        from app.db import Chunk, SearchSpace
+
+        conditions = [
+            Chunk.search_space_id.in_(
+                select(SearchSpace.id).where(SearchSpace.user_id == user_id)
             )
+        ]
+        if search_space_id is not None:
+            conditions.append(Chunk.search_space_id == search_space_id)
+        return conditions
 
-        return serialized_results
+    @staticmethod
+    def _serialize_chunk(chunk, score) -> dict:
+        """
+        Convert a chunk and its fused score to a serializable dictionary.
+
+        Args:
+            chunk: The Chunk ORM object (with its document loaded)
+            score: The RRF score of the chunk
+
+        Returns:
+            Dictionary containing chunk data and relevance score
+        """
+        return {
+            "chunk_id": chunk.id,
+            "content": chunk.content,
+            "score": float(score),  # Ensure score is a Python float
+            "document": {
+                "id": chunk.document.id,
+                "title": chunk.document.title,
+                "document_type": chunk.document.document_type.value
+                if hasattr(chunk.document, "document_type")
+                else None,
+                "metadata": chunk.document.document_metadata,
+            },
+        }
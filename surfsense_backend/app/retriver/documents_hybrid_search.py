@@ -14,6 +14,7 @@ class DocumentHybridSearchRetriever:
         top_k: int,
         user_id: str,
         search_space_id: int | None = None,
+        ef_search: int | None = None,
     ) -> list:
         """
         Perform vector similarity search on documents.
@@ -23,6 +24,8 @@ class DocumentHybridSearchRetriever:
             top_k: Number of results to return
             user_id: The ID of the user performing the search
             search_space_id: Optional search space ID to filter results
+            ef_search: Optional HNSW ef_search for this query (higher for recall,
+                lower for latency); defaults to HNSW_EF_SEARCH
 
         Returns:
             List of documents sorted by vector similarity
@@ -30,30 +33,41 @@ class DocumentHybridSearchRetriever:
         from sqlalchemy import select
         from sqlalchemy.orm import joinedload
 
-        from app.config import config
         from app.db import Document, SearchSpace
+        from app.services.embedding_service import get_query_embedding
+        from app.utils.vector_indexes import (
+            configure_vector_search,
+            semantic_rank_query,
+        )
 
-        # Get embedding for the query
-        embedding_model = config.embedding_model_instance
-        query_embedding = embedding_model.embed(query_text)
+        # Get embedding for the query (shared across connector searches)
+        query_embedding = await get_query_embedding(query_text)
 
-        # Build the base query with user ownership check
-        query = (
-            select(Document)
-            .options(joinedload(Document.search_space))
-            .join(SearchSpace, Document.search_space_id == SearchSpace.id)
-            .where(SearchSpace.user_id == user_id)
-        )
+        # Base conditions with user ownership check
+        conditions = [
+            Document.search_space_id.in_(
+                select(SearchSpace.id).where(SearchSpace.user_id == user_id)
+            )
+        ]
 
         # Add search space filter if provided
         if search_space_id is not None:
-            query = query.where(Document.search_space_id == search_space_id)
+            conditions.append(Document.search_space_id == search_space_id)
 
-        # Add vector similarity ordering
-        query = query.order_by(Document.embedding.op("<=>")(query_embedding)).limit(
-            top_k
+        # Nearest documents (re-scored if the index is quantized)
+        nearest_documents = semantic_rank_query(
+            Document, query_embedding, conditions, top_k
+        ).subquery()
+
+        query = (
+            select(Document)
+            .options(joinedload(Document.search_space))
+            .join(nearest_documents, Document.id == nearest_documents.c.id)
+            .order_by(nearest_documents.c.rank)
         )
 
+        await configure_vector_search(self.db_session, ef_search, top_k)
+
         # Execute the query
         result = await self.db_session.execute(query)
         documents = result.scalars().all()
@@ -84,8 +98,8 @@ class DocumentHybridSearchRetriever:
 
         from app.db import Document, SearchSpace
 
-        # Create tsvector and tsquery for PostgreSQL full-text search
-        tsvector = func.to_tsvector("english", Document.content)
+        # Use the stored tsvector column and a tsquery for PostgreSQL full-text search
+        tsvector = Document.search_vector
         tsquery = func.plainto_tsquery("english", query_text)
 
         # Build the base query with user ownership check
@@ -119,6 +133,7 @@ class DocumentHybridSearchRetriever:
         user_id: str,
         search_space_id: int | None = None,
         document_type: str | None = None,
+        ef_search: int | None = None,
     ) -> list:
         """
         Combine vector similarity and full-text search results using Reciprocal Rank Fusion.
@@ -129,28 +144,37 @@ class DocumentHybridSearchRetriever:
             user_id: The ID of the user performing the search
             search_space_id: Optional search space ID to filter results
             document_type: Optional document type to filter results (e.g., "FILE", "CRAWLED_URL")
+            ef_search: Optional HNSW ef_search for this query (higher for recall,
+                lower for latency); defaults to HNSW_EF_SEARCH
 
         """
         from sqlalchemy import func, select, text
         from sqlalchemy.orm import joinedload
 
-        from app.config import config
         from app.db import Document, DocumentType, SearchSpace
+        from app.services.embedding_service import get_query_embedding
+        from app.utils.vector_indexes import (
+            configure_vector_search,
+            semantic_rank_query,
+        )
 
-        # Get embedding for the query
-        embedding_model = config.embedding_model_instance
-        query_embedding = embedding_model.embed(query_text)
+        # Get embedding for the query (shared across connector searches)
+        query_embedding = await get_query_embedding(query_text)
 
         # Constants for RRF calculation
         k = 60  # Constant for RRF calculation
         n_results = top_k * 2  # Get more results for better fusion
 
-        # Create tsvector and tsquery for PostgreSQL full-text search
-        tsvector = func.to_tsvector("english", Document.content)
+        # Use the stored tsvector column and a tsquery for PostgreSQL full-text search
+        tsvector = Document.search_vector
         tsquery = func.plainto_tsquery("english", query_text)
 
-        # Base conditions for document filtering
-        base_conditions = [SearchSpace.user_id == user_id]
+        # Base conditions for document filtering (user ownership)
+        base_conditions = [
+            Document.search_space_id.in_(
+                select(SearchSpace.id).where(SearchSpace.user_id == user_id)
+            )
+        ]
 
         # Add search space filter if provided
         if search_space_id is not None:
@@ -170,22 +194,9 @@ class DocumentHybridSearchRetriever:
                 base_conditions.append(Document.document_type == document_type)
 
         # CTE for semantic search with user ownership check
-        semantic_search_cte = (
-            select(
-                Document.id,
-                func.rank()
-                .over(order_by=Document.embedding.op("<=>")(query_embedding))
-                .label("rank"),
-            )
-            .join(SearchSpace, Document.search_space_id == SearchSpace.id)
-            .where(*base_conditions)
-        )
-
-        semantic_search_cte = (
-            semantic_search_cte.order_by(Document.embedding.op("<=>")(query_embedding))
-            .limit(n_results)
-            .cte("semantic_search")
-        )
+        semantic_search_cte = semantic_rank_query(
+            Document, query_embedding, base_conditions, n_results
+        ).cte("semantic_search")
 
         # CTE for keyword search with user ownership check
         keyword_search_cte = (
@@ -195,7 +206,6 @@ class DocumentHybridSearchRetriever:
                 .over(order_by=func.ts_rank_cd(tsvector, tsquery).desc())
                 .label("rank"),
             )
-            .join(SearchSpace, Document.search_space_id == SearchSpace.id)
             .where(*base_conditions)
             .where(tsvector.op("@@")(tsquery))
         )
@@ -232,6 +242,8 @@ class DocumentHybridSearchRetriever:
             .limit(top_k)
         )
 
+        await configure_vector_search(self.db_session, ef_search, n_results)
+
         # Execute the query
         result = await self.db_session.execute(final_query)
         documents_with_scores = result.all()
@@ -249,7 +261,9 @@ class DocumentHybridSearchRetriever:
             from app.db import Chunk
 
             chunks_query = (
-                select(Chunk).where(Chunk.document_id == document.id).order_by(Chunk.id)
+                select(Chunk)
+                .where(Chunk.document_id == document.id)
+                .order_by(Chunk.position, Chunk.id)
             )
             chunks_result = await self.db_session.execute(chunks_query)
             chunks = chunks_result.scalars().all()
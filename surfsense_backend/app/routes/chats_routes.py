@@ -14,6 +14,7 @@ from app.schemas import (
     ChatReadWithoutMessages,
     ChatUpdate,
 )
+from app.services.llm_service import cache_user_llm_instances
 from app.tasks.stream_connector_search_results import stream_connector_search_results
 from app.users import current_active_user
 from app.utils.check_ownership import check_ownership
@@ -80,6 +81,10 @@ async def handle_chat_data(
         user_preference = language_result.scalars().first()
         # print("UserSearchSpacePreference:", user_preference)
 
+        # The agents reuse these LLM configs instead of querying them again
+        if user_preference:
+            cache_user_llm_instances(user_preference)
+
         language = None
         if (
             user_preference
@@ -13,6 +13,7 @@ from app.db import (
     SearchSpace,
     User,
     get_async_session,
+    increment_index_version,
 )
 from app.schemas import (
     DocumentRead,
@@ -405,7 +406,7 @@ async def get_document_by_chunk_id(
     user: User = Depends(current_active_user),
 ):
     """
-    Retrieves a document based on a chunk ID, including all its chunks ordered by creation time.
+    Retrieves a document based on a chunk ID, including all its chunks in document order.
     The document's embedding and chunk embeddings are excluded from the response.
     """
     try:
@@ -433,8 +434,10 @@ async def get_document_by_chunk_id(
                 detail="Document not found or you don't have access to it",
             )
 
-        # Sort chunks by creation time
-        sorted_chunks = sorted(document.chunks, key=lambda x: x.created_at)
+        # Sort chunks by their position in the document
+        sorted_chunks = sorted(
+            document.chunks, key=lambda x: (x.position or 0, x.created_at)
+        )
 
         # Return the document with its chunks
         return DocumentWithChunksRead(
@@ -514,6 +517,7 @@ async def update_document(
         update_data = document_update.model_dump(exclude_unset=True)
         for key, value in update_data.items():
             setattr(db_document, key, value)
+        await increment_index_version(session, db_document.search_space_id)
         await session.commit()
         await session.refresh(db_document)
 
@@ -557,6 +561,7 @@ async def delete_document(
             )
 
         await session.delete(document)
+        await increment_index_version(session, document.search_space_id)
         await session.commit()
         return {"message": "Document deleted successfully"}
     except HTTPException:
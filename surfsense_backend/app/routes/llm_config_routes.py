@@ -12,7 +12,7 @@ from app.db import (
     get_async_session,
 )
 from app.schemas import LLMConfigCreate, LLMConfigRead, LLMConfigUpdate
-from app.services.llm_service import validate_llm_config
+from app.services.llm_service import invalidate_llm_cache, validate_llm_config
 from app.users import current_active_user
 
 router = APIRouter()
@@ -244,6 +244,7 @@ async def update_llm_config(
             setattr(db_llm_config, key, value)
 
         await session.commit()
+        invalidate_llm_cache(db_llm_config.search_space_id)
         await session.refresh(db_llm_config)
         return db_llm_config
     except HTTPException:
@@ -275,8 +276,10 @@ async def delete_llm_config(
         # Verify user has access to the search space
         await check_search_space_access(session, db_llm_config.search_space_id, user)
 
+        search_space_id = db_llm_config.search_space_id
         await session.delete(db_llm_config)
         await session.commit()
+        invalidate_llm_cache(search_space_id)
         return {"message": "LLM configuration deleted successfully"}
     except HTTPException:
         raise
@@ -382,6 +385,7 @@ async def update_user_llm_preferences(
             setattr(preference, key, value)
 
         await session.commit()
+        invalidate_llm_cache(search_space_id)
         await session.refresh(preference)
 
         # Reload relationships
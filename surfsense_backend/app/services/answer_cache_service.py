@@ -0,0 +1,169 @@
+from dataclasses import dataclass
+from typing import Any
+
+import numpy as np
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.config import config
+from app.db import SearchSpace
+from app.utils.lru_cache import LRUCache
+
+
+@dataclass
+class CachedAnswer:
+    """A generated chat answer with everything needed to replay it."""
+
+    search_space_id: int
+    index_version: int
+    context_key: tuple
+    query_embedding: np.ndarray
+    answer: str
+    sources: list[dict[str, Any]]
+    reranked_documents: list[dict[str, Any]]
+
+
+class AnswerCache:
+    """
+    LRU cache of chat answers matched by query embedding similarity.
+
+    An answer is reused when it was generated for the same search space index
+    version and search context (connectors, search mode, language, top_k and
+    selected documents), and its reformulated query embedding is at least
+    `similarity` similar (cosine) to the new one.
+    """
+
+    def __init__(self, max_size: int = 1000, similarity: float = 0.95, ttl: int = 0):
+        """
+        Initialize the cache
+
+        Args:
+            max_size: Maximum number of answers kept before evicting the least
+                recently used entry
+            similarity: Minimum cosine similarity between query embeddings
+            ttl: Seconds an answer stays valid (0 = no expiry)
+        """
+        self.similarity = similarity
+        self._entries: LRUCache[tuple, CachedAnswer] = LRUCache(max_size, ttl)
+
+    @staticmethod
+    def _normalize(embedding: Any) -> np.ndarray:
+        vector = np.asarray(embedding, dtype=np.float32)
+        norm = np.linalg.norm(vector)
+        return vector / norm if norm else vector
+
+    def get(
+        self,
+        search_space_id: int,
+        index_version: int,
+        context_key: tuple,
+        query_embedding: Any,
+    ) -> CachedAnswer | None:
+        """
+        Find the cached answer of the most similar query, if similar enough.
+
+        Entries of the search space generated for an older index version are
+        evicted on the way.
+
+        Args:
+            search_space_id: The search space ID
+            index_version: The current index version of the search space
+            context_key: Hashable description of the search context
+            query_embedding: Embedding of the reformulated query
+
+        Returns:
+            The matching cached answer or None
+        """
+        query_vector = self._normalize(query_embedding)
+
+        self._entries.discard_where(
+            lambda _, entry: (
+                entry.search_space_id == search_space_id
+                and entry.index_version < index_version
+            )
+        )
+
+        best_key, best_similarity = None, self.similarity
+        for key, entry in self._entries.items():
+            if (
+                entry.search_space_id != search_space_id
+                or entry.index_version != index_version
+                or entry.context_key != context_key
+            ):
+                continue
+            similarity = float(np.dot(entry.query_embedding, query_vector))
+            if similarity >= best_similarity:
+                best_key, best_similarity = key, similarity
+
+        if best_key is None:
+            return None
+        return self._entries.get(best_key)
+
+    def put(
+        self,
+        search_space_id: int,
+        index_version: int,
+        context_key: tuple,
+        query_text: str,
+        query_embedding: Any,
+        answer: str,
+        sources: list[dict[str, Any]],
+        reranked_documents: list[dict[str, Any]],
+    ) -> None:
+        """
+        Store a generated answer, evicting the least recently used entries if needed
+
+        Args:
+            search_space_id: The search space ID
+            index_version: The index version the answer was generated for
+            context_key: Hashable description of the search context
+            query_text: The reformulated query
+            query_embedding: Embedding of the reformulated query
+            answer: The generated answer
+            sources: The sources streamed with the answer
+            reranked_documents: The documents the answer was generated from
+        """
+        if self._entries.max_size <= 0:
+            return
+
+        key = (search_space_id, index_version, context_key, query_text)
+        entry = CachedAnswer(
+            search_space_id=search_space_id,
+            index_version=index_version,
+            context_key=context_key,
+            query_embedding=self._normalize(query_embedding),
+            answer=answer,
+            sources=sources,
+            reranked_documents=reranked_documents,
+        )
+        self._entries.put(key, entry)
+
+    def clear(self) -> None:
+        """Remove every cached answer."""
+        self._entries.clear()
+
+
+answer_cache = AnswerCache(
+    max_size=config.ANSWER_CACHE_SIZE,
+    similarity=config.ANSWER_CACHE_SIMILARITY,
+    ttl=config.ANSWER_CACHE_TTL_SECONDS,
+)
+
+
+async def get_search_space_index_version(
+    session: AsyncSession, search_space_id: int
+) -> int | None:
+    """
+    Get the current index version of a search space.
+
+    Args:
+        session: The database session
+        search_space_id: The search space ID
+
+    Returns:
+        The index version or None if the search space does not exist
+    """
+    result = await session.execute(
+        select(SearchSpace.index_version).where(SearchSpace.id == search_space_id)
+    )
+    return result.scalar_one_or_none()
@@ -7,7 +7,7 @@ from linkup import LinkupClient
 from sqlalchemy import func
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.future import select
-from tavily import TavilyClient
+from tavily import AsyncTavilyClient
 
 from app.agents.researcher.configuration import SearchMode
 from app.db import (
@@ -19,6 +19,9 @@ from app.db import (
 )
 from app.retriver.chunks_hybrid_search import ChucksHybridSearchRetriever
 from app.retriver.documents_hybrid_search import DocumentHybridSearchRetriever
+from app.services.web_search_cache import web_search_cache
+from app.utils.http_clients import get_http_client, provider_limit
+from app.utils.search_sessions import search_session
 
 
 class ConnectorService:
@@ -27,12 +30,47 @@ class ConnectorService:
         self.chunk_retriever = ChucksHybridSearchRetriever(session)
         self.document_retriever = DocumentHybridSearchRetriever(session)
         self.user_id = user_id
-        self.source_id_counter = (
-            100000  # High starting value to avoid collisions with existing IDs
-        )
+        # Counter state is kept in a dict so services forked for concurrent
+        # connector searches keep handing out unique source IDs
+        self._counter_state = {
+            "value": 100000  # High starting value to avoid collisions with existing IDs
+        }
         self.counter_lock = (
             asyncio.Lock()
         )  # Lock to protect counter in multithreaded environments
+        # Chunk search results fetched ahead of time for several document types,
+        # keyed by (query, search_space_id, top_k, document_type)
+        self.prefetched_chunks: dict[tuple, list] = {}
+
+    @property
+    def source_id_counter(self) -> int:
+        return self._counter_state["value"]
+
+    @source_id_counter.setter
+    def source_id_counter(self, value: int) -> None:
+        self._counter_state["value"] = value
+
+    def fork(self, session: AsyncSession | None) -> "ConnectorService":
+        """
+        Create a connector service bound to another database session.
+
+        An AsyncSession cannot run concurrent queries, so each concurrent
+        connector search gets its own session. The fork shares the source ID
+        counter, its lock and the prefetched chunk results with this service.
+
+        Args:
+            session: The database session the new service should use, or None
+                for web searches, which look up their connector configuration on
+                a short-lived search session
+
+        Returns:
+            ConnectorService: A service sharing this service's state
+        """
+        service = ConnectorService(session, user_id=self.user_id)
+        service._counter_state = self._counter_state
+        service.counter_lock = self.counter_lock
+        service.prefetched_chunks = self.prefetched_chunks
+        return service
 
     async def initialize_counter(self):
         """
@@ -59,6 +97,76 @@ class ConnectorService:
                 # Fallback to default value
                 self.source_id_counter = 1
 
+    async def prefetch_chunk_searches(
+        self,
+        user_query: str,
+        user_id: str,
+        search_space_id: int,
+        document_types: list[str],
+        top_k: int = 20,
+    ) -> None:
+        """
+        Fetch the chunk search results of several document types in one query.
+
+        The results are kept on the service, so the following search_* calls for
+        the same query split them into per-connector sources without going back
+        to the database.
+
+        Args:
+            user_query: The user's query
+            user_id: The user ID
+            search_space_id: The search space ID to search in
+            document_types: Document types of the connectors that will be searched
+            top_k: Maximum number of results to fetch per document type
+        """
+        document_types = [
+            document_type
+            for document_type in dict.fromkeys(document_types)
+            if (user_query, search_space_id, top_k, document_type)
+            not in self.prefetched_chunks
+        ]
+        if not document_types:
+            return
+
+        results_by_type = await self.chunk_retriever.hybrid_search_by_document_types(
+            query_text=user_query,
+            top_k=top_k,
+            user_id=user_id,
+            search_space_id=search_space_id,
+            document_types=document_types,
+        )
+        for document_type in document_types:
+            self.prefetched_chunks[
+                (user_query, search_space_id, top_k, document_type)
+            ] = results_by_type.get(document_type, [])
+
+    async def _chunk_hybrid_search(
+        self,
+        query_text: str,
+        top_k: int,
+        user_id: str,
+        search_space_id: int | None = None,
+        document_type: str | None = None,
+    ) -> list:
+        """
+        Chunk hybrid search that reuses prefetched results when available.
+
+        Falls back to a single-type hybrid search on a prefetch miss.
+        """
+        prefetched = self.prefetched_chunks.get(
+            (query_text, search_space_id, top_k, document_type)
+        )
+        if prefetched is not None:
+            return prefetched
+
+        return await self.chunk_retriever.hybrid_search(
+            query_text=query_text,
+            top_k=top_k,
+            user_id=user_id,
+            search_space_id=search_space_id,
+            document_type=document_type,
+        )
+
     async def search_crawled_urls(
         self,
         user_query: str,
@@ -74,7 +182,7 @@ class ConnectorService:
             tuple: (sources_info, langchain_documents)
         """
         if search_mode == SearchMode.CHUNKS:
-            crawled_urls_chunks = await self.chunk_retriever.hybrid_search(
+            crawled_urls_chunks = await self._chunk_hybrid_search(
                 query_text=user_query,
                 top_k=top_k,
                 user_id=user_id,
@@ -148,7 +256,7 @@ class ConnectorService:
             tuple: (sources_info, langchain_documents)
         """
         if search_mode == SearchMode.CHUNKS:
-            files_chunks = await self.chunk_retriever.hybrid_search(
+            files_chunks = await self._chunk_hybrid_search(
                 query_text=user_query,
                 top_k=top_k,
                 user_id=user_id,
@@ -264,6 +372,11 @@ class ConnectorService:
                 SearchSourceConnector.search_space_id == search_space_id
             )
 
+        if self.session is None:
+            async with search_session() as session:
+                result = await session.execute(query)
+                return result.scalars().first()
+
         result = await self.session.execute(query)
         return result.scalars().first()
 
@@ -296,17 +409,23 @@ class ConnectorService:
                 "sources": [],
             }, []
 
-        # Initialize Tavily client with API key from connector config
+        # Get the Tavily API key from connector config
         tavily_api_key = tavily_connector.config.get("TAVILY_API_KEY")
-        tavily_client = TavilyClient(api_key=tavily_api_key)
 
-        # Perform search with Tavily
+        # Perform search with Tavily's async client (its SDK owns the request
+        # and response format, so it does not use the shared HTTP client)
         try:
-            response = tavily_client.search(
-                query=user_query,
-                max_results=top_k,
-                search_depth="advanced",  # Use advanced search for better results
-            )
+            response = await web_search_cache.get("TAVILY_API", user_query, top_k)
+            if response is None:
+                async with provider_limit("TAVILY_API"):
+                    response = await AsyncTavilyClient(
+                        api_key=tavily_api_key
+                    ).search(
+                        query=user_query,
+                        max_results=top_k,
+                        search_depth="advanced",  # Use advanced search for better results
+                    )
+                await web_search_cache.set("TAVILY_API", user_query, top_k, response)
 
             # Extract results from Tavily response
             tavily_results = response.get("results", [])
@@ -476,33 +595,44 @@ class ConnectorService:
 
         searx_endpoint = urljoin(host if host.endswith("/") else f"{host}/", "search")
 
-        try:
-            async with httpx.AsyncClient(timeout=20.0, verify=verify_ssl) as client:
-                response = await client.get(
-                    searx_endpoint,
-                    params=params,
-                    headers=headers,
-                )
+        # The host, engines and other parameters change the results
+        searx_variant = {"endpoint": searx_endpoint, "params": params}
+        data = await web_search_cache.get(
+            "SEARXNG_API", user_query, top_k, variant=searx_variant
+        )
+        if data is None:
+            try:
+                async with provider_limit("SEARXNG_API"):
+                    response = await get_http_client(verify=verify_ssl).get(
+                        searx_endpoint,
+                        params=params,
+                        headers=headers,
+                        timeout=20.0,
+                    )
                 response.raise_for_status()
-        except httpx.HTTPError as exc:
-            print(f"Error searching with SearxNG: {exc!s}")
-            return {
-                "id": 11,
-                "name": "SearxNG Search",
-                "type": "SEARXNG_API",
-                "sources": [],
-            }, []
+            except httpx.HTTPError as exc:
+                print(f"Error searching with SearxNG: {exc!s}")
+                return {
+                    "id": 11,
+                    "name": "SearxNG Search",
+                    "type": "SEARXNG_API",
+                    "sources": [],
+                }, []
 
-        try:
-            data = response.json()
-        except ValueError:
-            print("Failed to decode JSON response from SearxNG")
-            return {
-                "id": 11,
-                "name": "SearxNG Search",
-                "type": "SEARXNG_API",
-                "sources": [],
-            }, []
+            try:
+                data = response.json()
+            except ValueError:
+                print("Failed to decode JSON response from SearxNG")
+                return {
+                    "id": 11,
+                    "name": "SearxNG Search",
+                    "type": "SEARXNG_API",
+                    "sources": [],
+                }, []
+
+            await web_search_cache.set(
+                "SEARXNG_API", user_query, top_k, data, variant=searx_variant
+            )
 
         searx_results = data.get("results", [])
         if not searx_results:
@@ -641,69 +771,83 @@ class ConnectorService:
             "enable_corner_markers": True,  # Enable reference markers
         }
 
-        try:
-            # Baidu AI Search may take longer as it performs search + summarization
-            # Increase timeout to 90 seconds
-            async with httpx.AsyncClient(timeout=90.0) as client:
-                response = await client.post(
-                    baidu_endpoint,
-                    headers=headers,
-                    json=payload,
-                )
+        baidu_variant = {"payload": payload}
+        data = await web_search_cache.get(
+            "BAIDU_SEARCH_API", user_query, top_k, variant=baidu_variant
+        )
+        if data is None:
+            try:
+                # Baidu AI Search may take longer as it performs search + summarization
+                # Increase timeout to 90 seconds
+                async with provider_limit("BAIDU_SEARCH_API"):
+                    response = await get_http_client().post(
+                        baidu_endpoint,
+                        headers=headers,
+                        json=payload,
+                        timeout=90.0,
+                    )
                 response.raise_for_status()
-        except httpx.TimeoutException as exc:
-            print(f"ERROR: Baidu API request timeout after 90s: {exc!r}")
-            print(f"Endpoint: {baidu_endpoint}")
-            return {
-                "id": 12,
-                "name": "Baidu Search",
-                "type": "BAIDU_SEARCH_API",
-                "sources": [],
-            }, []
-        except httpx.HTTPStatusError as exc:
-            print(f"ERROR: Baidu API HTTP Status Error: {exc.response.status_code}")
-            print(f"Response text: {exc.response.text[:500]}")
-            print(f"Request URL: {exc.request.url}")
-            return {
-                "id": 12,
-                "name": "Baidu Search",
-                "type": "BAIDU_SEARCH_API",
-                "sources": [],
-            }, []
-        except httpx.RequestError as exc:
-            print(f"ERROR: Baidu API Request Error: {type(exc).__name__}: {exc!r}")
-            print(f"Endpoint: {baidu_endpoint}")
-            return {
-                "id": 12,
-                "name": "Baidu Search",
-                "type": "BAIDU_SEARCH_API",
-                "sources": [],
-            }, []
-        except Exception as exc:
-            print(
-                f"ERROR: Unexpected error calling Baidu API: {type(exc).__name__}: {exc!r}"
-            )
-            print(f"Endpoint: {baidu_endpoint}")
-            print(f"Payload: {payload}")
-            return {
-                "id": 12,
-                "name": "Baidu Search",
-                "type": "BAIDU_SEARCH_API",
-                "sources": [],
-            }, []
+            except httpx.TimeoutException as exc:
+                print(f"ERROR: Baidu API request timeout after 90s: {exc!r}")
+                print(f"Endpoint: {baidu_endpoint}")
+                return {
+                    "id": 12,
+                    "name": "Baidu Search",
+                    "type": "BAIDU_SEARCH_API",
+                    "sources": [],
+                }, []
+            except httpx.HTTPStatusError as exc:
+                print(f"ERROR: Baidu API HTTP Status Error: {exc.response.status_code}")
+                print(f"Response text: {exc.response.text[:500]}")
+                print(f"Request URL: {exc.request.url}")
+                return {
+                    "id": 12,
+                    "name": "Baidu Search",
+                    "type": "BAIDU_SEARCH_API",
+                    "sources": [],
+                }, []
+            except httpx.RequestError as exc:
+                print(f"ERROR: Baidu API Request Error: {type(exc).__name__}: {exc!r}")
+                print(f"Endpoint: {baidu_endpoint}")
+                return {
+                    "id": 12,
+                    "name": "Baidu Search",
+                    "type": "BAIDU_SEARCH_API",
+                    "sources": [],
+                }, []
+            except Exception as exc:
+                print(
+                    f"ERROR: Unexpected error calling Baidu API: {type(exc).__name__}: {exc!r}"
+                )
+                print(f"Endpoint: {baidu_endpoint}")
+                print(f"Payload: {payload}")
+                return {
+                    "id": 12,
+                    "name": "Baidu Search",
+                    "type": "BAIDU_SEARCH_API",
+                    "sources": [],
+                }, []
 
-        try:
-            data = response.json()
-        except ValueError as e:
-            print(f"ERROR: Failed to decode JSON response from Baidu AI Search: {e}")
-            print(f"Response status: {response.status_code}")
-            print(f"Response text: {response.text[:500]}")  # First 500 chars
-            return {
-                "id": 12,
-                "name": "Baidu Search",
-                "type": "BAIDU_SEARCH_API",
-                "sources": [],
-            }, []
+            try:
+                data = response.json()
+            except ValueError as e:
+                print(
+                    f"ERROR: Failed to decode JSON response from Baidu AI Search: {e}"
+                )
+                print(f"Response status: {response.status_code}")
+                print(f"Response text: {response.text[:500]}")  # First 500 chars
+                return {
+                    "id": 12,
+                    "name": "Baidu Search",
+                    "type": "BAIDU_SEARCH_API",
+                    "sources": [],
+                }, []
+
+            # Only cache successful responses
+            if "code" not in data and "message" not in data:
+                await web_search_cache.set(
+                    "BAIDU_SEARCH_API", user_query, top_k, data, variant=baidu_variant
+                )
 
         # Extract references (search results) from the response
         baidu_references = data.get("references", [])
@@ -801,7 +945,7 @@ class ConnectorService:
             tuple: (sources_info, langchain_documents)
         """
         if search_mode == SearchMode.CHUNKS:
-            slack_chunks = await self.chunk_retriever.hybrid_search(
+            slack_chunks = await self._chunk_hybrid_search(
                 query_text=user_query,
                 top_k=top_k,
                 user_id=user_id,
@@ -895,7 +1039,7 @@ class ConnectorService:
             tuple: (sources_info, langchain_documents)
         """
         if search_mode == SearchMode.CHUNKS:
-            notion_chunks = await self.chunk_retriever.hybrid_search(
+            notion_chunks = await self._chunk_hybrid_search(
                 query_text=user_query,
                 top_k=top_k,
                 user_id=user_id,
@@ -992,7 +1136,7 @@ class ConnectorService:
             tuple: (sources_info, langchain_documents)
         """
         if search_mode == SearchMode.CHUNKS:
-            extension_chunks = await self.chunk_retriever.hybrid_search(
+            extension_chunks = await self._chunk_hybrid_search(
                 query_text=user_query,
                 top_k=top_k,
                 user_id=user_id,
@@ -1113,7 +1257,7 @@ class ConnectorService:
             tuple: (sources_info, langchain_documents)
         """
         if search_mode == SearchMode.CHUNKS:
-            youtube_chunks = await self.chunk_retriever.hybrid_search(
+            youtube_chunks = await self._chunk_hybrid_search(
                 query_text=user_query,
                 top_k=top_k,
                 user_id=user_id,
@@ -1204,7 +1348,7 @@ class ConnectorService:
             tuple: (sources_info, langchain_documents)
         """
         if search_mode == SearchMode.CHUNKS:
-            github_chunks = await self.chunk_retriever.hybrid_search(
+            github_chunks = await self._chunk_hybrid_search(
                 query_text=user_query,
                 top_k=top_k,
                 user_id=user_id,
@@ -1285,7 +1429,7 @@ class ConnectorService:
             tuple: (sources_info, langchain_documents)
         """
         if search_mode == SearchMode.CHUNKS:
-            linear_chunks = await self.chunk_retriever.hybrid_search(
+            linear_chunks = await self._chunk_hybrid_search(
                 query_text=user_query,
                 top_k=top_k,
                 user_id=user_id,
@@ -1395,7 +1539,7 @@ class ConnectorService:
             tuple: (sources_info, langchain_documents)
         """
         if search_mode == SearchMode.CHUNKS:
-            jira_chunks = await self.chunk_retriever.hybrid_search(
+            jira_chunks = await self._chunk_hybrid_search(
                 query_text=user_query,
                 top_k=top_k,
                 user_id=user_id,
@@ -1516,7 +1660,7 @@ class ConnectorService:
             tuple: (sources_info, langchain_documents)
         """
         if search_mode == SearchMode.CHUNKS:
-            calendar_chunks = await self.chunk_retriever.hybrid_search(
+            calendar_chunks = await self._chunk_hybrid_search(
                 query_text=user_query,
                 top_k=top_k,
                 user_id=user_id,
@@ -1649,7 +1793,7 @@ class ConnectorService:
             tuple: (sources_info, langchain_documents)
         """
         if search_mode == SearchMode.CHUNKS:
-            airtable_chunks = await self.chunk_retriever.hybrid_search(
+            airtable_chunks = await self._chunk_hybrid_search(
                 query_text=user_query,
                 top_k=top_k,
                 user_id=user_id,
@@ -1737,7 +1881,7 @@ class ConnectorService:
             tuple: (sources_info, langchain_documents)
         """
         if search_mode == SearchMode.CHUNKS:
-            gmail_chunks = await self.chunk_retriever.hybrid_search(
+            gmail_chunks = await self._chunk_hybrid_search(
                 query_text=user_query,
                 top_k=top_k,
                 user_id=user_id,
@@ -1861,7 +2005,7 @@ class ConnectorService:
             tuple: (sources_info, langchain_documents)
         """
         if search_mode == SearchMode.CHUNKS:
-            confluence_chunks = await self.chunk_retriever.hybrid_search(
+            confluence_chunks = await self._chunk_hybrid_search(
                 query_text=user_query,
                 top_k=top_k,
                 user_id=user_id,
@@ -1956,7 +2100,7 @@ class ConnectorService:
             tuple: (sources_info, langchain_documents)
         """
         if search_mode == SearchMode.CHUNKS:
-            clickup_chunks = await self.chunk_retriever.hybrid_search(
+            clickup_chunks = await self._chunk_hybrid_search(
                 query_text=user_query,
                 top_k=top_k,
                 user_id=user_id,
@@ -2083,20 +2227,31 @@ class ConnectorService:
                 "sources": [],
             }, []
 
-        # Initialize Linkup client with API key from connector config
+        # Get the Linkup API key from connector config
         linkup_api_key = linkup_connector.config.get("LINKUP_API_KEY")
-        linkup_client = LinkupClient(api_key=linkup_api_key)
 
-        # Perform search with Linkup
+        # Perform search with Linkup's async client (its SDK owns the request
+        # and response format, so it does not use the shared HTTP client)
         try:
-            response = linkup_client.search(
-                query=user_query,
-                depth=mode,  # Use the provided mode ("standard" or "deep")
-                output_type="searchResults",  # Default to search results
+            response = await web_search_cache.get(
+                "LINKUP_API", user_query, None, variant=mode
             )
+            if response is None:
+                async with provider_limit("LINKUP_API"):
+                    search_results = await LinkupClient(
+                        api_key=linkup_api_key
+                    ).async_search(
+                        query=user_query,
+                        depth=mode,  # Use the provided mode ("standard" or "deep")
+                        output_type="searchResults",  # Default to search results
+                    )
+                response = search_results.model_dump(mode="json")
+                await web_search_cache.set(
+                    "LINKUP_API", user_query, None, response, variant=mode
+                )
 
-            # Extract results from Linkup response - access as attribute instead of using .get()
-            linkup_results = response.results if hasattr(response, "results") else []
+            # Extract results from Linkup response
+            linkup_results = response.get("results") or []
 
             # Only proceed if we have results
             if not linkup_results:
@@ -2114,38 +2269,30 @@ class ConnectorService:
             async with self.counter_lock:
                 for _i, result in enumerate(linkup_results):
                     # Only process results that have content
-                    if not hasattr(result, "content") or not result.content:
+                    if not result.get("content"):
                         continue
 
                     # Create a source entry
                     source = {
                         "id": self.source_id_counter,
-                        "title": (
-                            result.name if hasattr(result, "name") else "Linkup Result"
-                        ),
-                        "description": (
-                            result.content if hasattr(result, "content") else ""
-                        ),
-                        "url": result.url if hasattr(result, "url") else "",
+                        "title": result.get("name", "Linkup Result"),
+                        "description": result.get("content", ""),
+                        "url": result.get("url", ""),
                     }
                     sources_list.append(source)
 
                     # Create a document entry
                     document = {
                         "chunk_id": self.source_id_counter,
-                        "content": result.content if hasattr(result, "content") else "",
+                        "content": result.get("content", ""),
                         "score": 1.0,  # Default score since not provided by Linkup
                         "document": {
                             "id": self.source_id_counter,
-                            "title": (
-                                result.name
-                                if hasattr(result, "name")
-                                else "Linkup Result"
-                            ),
+                            "title": result.get("name", "Linkup Result"),
                             "document_type": "LINKUP_API",
                             "metadata": {
-                                "url": result.url if hasattr(result, "url") else "",
-                                "type": result.type if hasattr(result, "type") else "",
+                                "url": result.get("url", ""),
+                                "type": result.get("type", ""),
                                 "source": "LINKUP_API",
                             },
                         },
@@ -2194,7 +2341,7 @@ class ConnectorService:
             tuple: (sources_info, langchain_documents)
         """
         if search_mode == SearchMode.CHUNKS:
-            discord_chunks = await self.chunk_retriever.hybrid_search(
+            discord_chunks = await self._chunk_hybrid_search(
                 query_text=user_query,
                 top_k=top_k,
                 user_id=user_id,
@@ -2292,7 +2439,7 @@ class ConnectorService:
             tuple: (sources_info, langchain_documents)
         """
         if search_mode == SearchMode.CHUNKS:
-            luma_chunks = await self.chunk_retriever.hybrid_search(
+            luma_chunks = await self._chunk_hybrid_search(
                 query_text=user_query,
                 top_k=top_k,
                 user_id=user_id,
@@ -2450,7 +2597,7 @@ class ConnectorService:
             tuple: (sources_info, langchain_documents)
         """
         if search_mode == SearchMode.CHUNKS:
-            elasticsearch_chunks = await self.chunk_retriever.hybrid_search(
+            elasticsearch_chunks = await self._chunk_hybrid_search(
                 query_text=user_query,
                 top_k=top_k,
                 user_id=user_id,
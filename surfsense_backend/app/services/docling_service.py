@@ -246,6 +246,15 @@ class DoclingService:
             )
             from app.prompts import SUMMARY_PROMPT_TEMPLATE
 
+            # Keep the content within the model's context window
+            model_name = getattr(llm, "model", None)
+            if model_name:
+                from app.utils.document_converters import (
+                    optimize_content_for_context_window,
+                )
+
+                content = optimize_content_for_context_window(content, None, model_name)
+
             summary_chain = SUMMARY_PROMPT_TEMPLATE | llm
             result = await summary_chain.ainvoke({"document": content})
             return result.content
@@ -345,6 +354,18 @@ Ensure:
             )
 
             combined_summaries = "\n\n".join(chunk_summaries)
+
+            # Many sections can add up to more than the context window
+            model_name = getattr(llm, "model", None)
+            if model_name:
+                from app.utils.document_converters import (
+                    optimize_content_for_context_window,
+                )
+
+                combined_summaries = optimize_content_for_context_window(
+                    combined_summaries, None, model_name
+                )
+
             combine_chain = combine_template | llm
 
             final_result = await combine_chain.ainvoke(
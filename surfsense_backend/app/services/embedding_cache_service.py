@@ -0,0 +1,244 @@
+import hashlib
+import logging
+from datetime import timedelta
+from typing import Any
+
+from sqlalchemy import delete, func, select, tuple_, update
+from sqlalchemy.dialects.postgresql import insert
+from sqlalchemy.ext.asyncio import AsyncEngine, create_async_engine
+
+from app.config import config
+from app.utils.lru_cache import LRUCache
+from app.utils.per_loop import PerLoop
+
+logger = logging.getLogger(__name__)
+
+# Maximum number of hashes sent in a single IN clause, and of rows per INSERT
+LOOKUP_BATCH_SIZE = 1000
+# Connections kept by the cache engine of each event loop (cache queries are short)
+POOL_SIZE = 2
+POOL_MAX_OVERFLOW = 2
+# A hit only refreshes last_used_at when it is older than this, so hot entries
+# are not rewritten on every read
+LAST_USED_REFRESH_INTERVAL = timedelta(hours=1)
+# Rows deleted per transaction when the table is trimmed to max_rows
+PRUNE_BATCH_SIZE = 10000
+
+
+class EmbeddingCache:
+    """
+    Content-addressed cache of document embeddings keyed by (model, SHA-256 of
+    the text).
+
+    Email signatures, repeated Slack snippets, shared Confluence templates and
+    files uploaded to several search spaces produce the same texts over and
+    over. Their vectors are kept in an in-memory LRU in front of the
+    embedding_cache table, which is shared by every API process and worker. The
+    prune_embedding_cache Celery beat task trims the table to the max_rows most
+    recently used entries.
+    """
+
+    def __init__(
+        self,
+        memory_size: int = 5000,
+        persistent: bool = True,
+        max_rows: int = 1000000,
+        database_url: str | None = None,
+    ):
+        """
+        Initialize the cache
+
+        Args:
+            memory_size: Maximum number of embeddings kept in process memory
+            persistent: Whether embeddings are also stored in the database
+            max_rows: Maximum number of rows kept in the table (0 = unlimited)
+            database_url: The database URL
+        """
+        self.persistent = persistent and bool(database_url)
+        self.max_rows = max_rows
+        self.database_url = database_url
+        self._entries: LRUCache[tuple[str, str], Any] = LRUCache(memory_size)
+        # One pooled engine per event loop, so every lookup and write of a task
+        # reuses the same few connections
+        self._engines: PerLoop[AsyncEngine] = PerLoop(
+            self._create_engine, close=lambda engine: engine.dispose()
+        )
+
+    @staticmethod
+    def text_hash(text: str) -> str:
+        return hashlib.sha256(text.encode("utf-8")).hexdigest()
+
+    def _create_engine(self) -> AsyncEngine:
+        return create_async_engine(
+            self.database_url,
+            pool_size=POOL_SIZE,
+            max_overflow=POOL_MAX_OVERFLOW,
+        )
+
+    def _get_engine(self) -> AsyncEngine:
+        return self._engines.get()
+
+    async def get_many(self, model: str, texts: list[str]) -> list[Any | None]:
+        """
+        Get the cached embeddings of texts.
+
+        Args:
+            model: The embedding model name
+            texts: The texts
+
+        Returns:
+            The cached embedding of every text, None for the misses
+        """
+        embeddings: list[Any | None] = [None] * len(texts)
+        missing: dict[str, list[int]] = {}
+
+        for i, text in enumerate(texts):
+            text_hash = self.text_hash(text)
+            embedding = self._entries.get((model, text_hash))
+            if embedding is not None:
+                embeddings[i] = embedding
+            else:
+                missing.setdefault(text_hash, []).append(i)
+
+        if not missing or not self.persistent:
+            return embeddings
+
+        from app.db import EmbeddingCacheEntry
+
+        hashes = list(missing)
+        try:
+            async with self._get_engine().begin() as conn:
+                for start in range(0, len(hashes), LOOKUP_BATCH_SIZE):
+                    batch = hashes[start : start + LOOKUP_BATCH_SIZE]
+                    rows = (
+                        await conn.execute(
+                            select(
+                                EmbeddingCacheEntry.text_hash,
+                                EmbeddingCacheEntry.embedding,
+                            ).where(
+                                EmbeddingCacheEntry.model == model,
+                                EmbeddingCacheEntry.text_hash.in_(batch),
+                            )
+                        )
+                    ).all()
+                    if not rows:
+                        continue
+
+                    await conn.execute(
+                        update(EmbeddingCacheEntry)
+                        .where(
+                            EmbeddingCacheEntry.model == model,
+                            EmbeddingCacheEntry.text_hash.in_(
+                                [text_hash for text_hash, _ in rows]
+                            ),
+                            EmbeddingCacheEntry.last_used_at
+                            < func.now() - LAST_USED_REFRESH_INTERVAL,
+                        )
+                        .values(last_used_at=func.now())
+                    )
+                    for text_hash, embedding in rows:
+                        self._entries.put((model, text_hash), embedding)
+                        for i in missing[text_hash]:
+                            embeddings[i] = embedding
+        except Exception as e:
+            logger.warning(f"Embedding cache read failed, embedding again: {e!s}")
+
+        return embeddings
+
+    async def put_many(
+        self, model: str, texts: list[str], embeddings: list[Any]
+    ) -> None:
+        """
+        Store the embeddings of texts.
+
+        Args:
+            model: The embedding model name
+            texts: The texts
+            embeddings: Their embeddings, in the same order
+        """
+        rows = {}
+        for text, embedding in zip(texts, embeddings, strict=True):
+            text_hash = self.text_hash(text)
+            self._entries.put((model, text_hash), embedding)
+            rows[text_hash] = {
+                "model": model,
+                "text_hash": text_hash,
+                "embedding": embedding,
+            }
+
+        if not rows or not self.persistent:
+            return
+
+        from app.db import EmbeddingCacheEntry
+
+        values = list(rows.values())
+        try:
+            async with self._get_engine().begin() as conn:
+                for start in range(0, len(values), LOOKUP_BATCH_SIZE):
+                    await conn.execute(
+                        insert(EmbeddingCacheEntry)
+                        .values(values[start : start + LOOKUP_BATCH_SIZE])
+                        .on_conflict_do_nothing(index_elements=["model", "text_hash"])
+                    )
+        except Exception as e:
+            logger.warning(f"Embedding cache write failed: {e!s}")
+
+    async def prune(self) -> int:
+        """
+        Delete the least recently used rows beyond max_rows.
+
+        The excess rows are deleted from the oldest end of the last_used_at
+        index in small transactions, skipping rows locked by running indexers.
+
+        Returns:
+            int: Number of deleted rows
+        """
+        if not self.persistent or self.max_rows <= 0:
+            return 0
+
+        from app.db import EmbeddingCacheEntry
+
+        engine = self._get_engine()
+        async with engine.connect() as conn:
+            row_count = (
+                await conn.execute(
+                    select(func.count()).select_from(EmbeddingCacheEntry)
+                )
+            ).scalar()
+
+        deleted = 0
+        excess = row_count - self.max_rows
+        while deleted < excess:
+            stale_entries = (
+                select(EmbeddingCacheEntry.model, EmbeddingCacheEntry.text_hash)
+                .order_by(EmbeddingCacheEntry.last_used_at)
+                .limit(min(PRUNE_BATCH_SIZE, excess - deleted))
+                .with_for_update(skip_locked=True)
+            )
+            async with engine.begin() as conn:
+                result = await conn.execute(
+                    delete(EmbeddingCacheEntry).where(
+                        tuple_(
+                            EmbeddingCacheEntry.model, EmbeddingCacheEntry.text_hash
+                        ).in_(stale_entries)
+                    )
+                )
+            if not result.rowcount:
+                break
+            deleted += result.rowcount
+
+        if deleted:
+            logger.info(f"Evicted {deleted} embedding cache entries")
+        return deleted
+
+    def clear(self) -> None:
+        """Remove every embedding kept in memory."""
+        self._entries.clear()
+
+
+embedding_cache = EmbeddingCache(
+    memory_size=config.EMBEDDING_CACHE_MEMORY_SIZE,
+    persistent=config.EMBEDDING_CACHE_PERSISTENT,
+    max_rows=config.EMBEDDING_CACHE_MAX_ROWS,
+    database_url=config.DATABASE_URL,
+)
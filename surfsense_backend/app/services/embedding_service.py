@@ -0,0 +1,322 @@
+import asyncio
+import logging
+from collections.abc import Awaitable, Callable
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any
+
+from app.config import config
+from app.services.embedding_cache_service import embedding_cache
+from app.utils.lru_cache import LRUCache
+from app.utils.per_loop import PerLoop
+
+logger = logging.getLogger(__name__)
+
+
+class QueryEmbeddingCache(LRUCache[tuple[str, str], Any]):
+    """
+    Small LRU cache of query embeddings keyed by (model, text).
+
+    A single chat turn searches every selected connector for each research
+    question, so the same query text is embedded many times. Keeping the
+    vectors around lets every retriever reuse the first embedding.
+    """
+
+
+class EmbeddingBatcher:
+    """
+    Coalesces concurrent embedding requests on one event loop into micro-batches.
+
+    Callers enqueue texts and await a future. A collector task drains the queue,
+    groups whatever arrives within a short window into one `embed_batch` call and
+    runs it on a shared thread pool, so model inference never blocks the event
+    loop and concurrent chats or processors share a single model call.
+    """
+
+    def __init__(
+        self,
+        executor: ThreadPoolExecutor,
+        max_batch_size: int,
+        max_wait_ms: float,
+        max_queue_size: int,
+        max_concurrent_batches: int,
+    ):
+        """
+        Initialize the batcher
+
+        Args:
+            executor: Thread pool running the blocking embedding calls
+            max_batch_size: Maximum number of texts embedded in one call
+            max_wait_ms: How long to wait for more requests before flushing a batch
+            max_queue_size: Maximum number of pending texts before callers wait
+            max_concurrent_batches: Maximum number of batches embedded at once
+        """
+        self.executor = executor
+        self.max_batch_size = max(1, max_batch_size)
+        self.max_wait = max(0.0, max_wait_ms) / 1000
+        self._queue: asyncio.Queue[tuple[str, asyncio.Future]] = asyncio.Queue(
+            maxsize=max(0, max_queue_size)
+        )
+        self._collector: asyncio.Task | None = None
+        self._batch_tasks: set[asyncio.Task] = set()
+        self._batch_slots = asyncio.Semaphore(max(1, max_concurrent_batches))
+
+    async def embed(self, texts: list[str]) -> list[Any]:
+        """
+        Embed texts through the shared micro-batch queue
+
+        Args:
+            texts: Texts to embed
+
+        Returns:
+            List of embeddings in the same order as texts
+        """
+        loop = asyncio.get_running_loop()
+        futures = []
+        for text in texts:
+            future = loop.create_future()
+            await self._queue.put((text, future))
+            futures.append(future)
+            self._ensure_collector()
+        return list(await asyncio.gather(*futures))
+
+    def _ensure_collector(self) -> None:
+        if self._collector is None or self._collector.done():
+            self._collector = asyncio.create_task(self._collect())
+
+    async def _collect(self) -> None:
+        """Group queued requests into batches until the queue runs dry."""
+        loop = asyncio.get_running_loop()
+        while not self._queue.empty():
+            batch = [self._queue.get_nowait()]
+            deadline = loop.time() + self.max_wait
+
+            while len(batch) < self.max_batch_size:
+                if not self._queue.empty():
+                    batch.append(self._queue.get_nowait())
+                    continue
+                remaining = deadline - loop.time()
+                if remaining <= 0:
+                    break
+                try:
+                    batch.append(await asyncio.wait_for(self._queue.get(), remaining))
+                except TimeoutError:
+                    break
+
+            await self._batch_slots.acquire()
+            task = asyncio.create_task(self._run_batch(batch))
+            self._batch_tasks.add(task)
+            task.add_done_callback(self._on_batch_done)
+
+    def _on_batch_done(self, task: asyncio.Task) -> None:
+        self._batch_tasks.discard(task)
+        self._batch_slots.release()
+
+    async def _run_batch(self, batch: list[tuple[str, asyncio.Future]]) -> None:
+        """Embed one batch on the thread pool and resolve its futures."""
+        loop = asyncio.get_running_loop()
+        texts = [text for text, _ in batch]
+        try:
+            embeddings = await loop.run_in_executor(
+                self.executor, config.embedding_model_instance.embed_batch, texts
+            )
+        except Exception as e:
+            logger.error(f"Error embedding batch of {len(texts)} texts: {e!s}")
+            for _, future in batch:
+                if not future.done():
+                    future.set_exception(e)
+            return
+
+        for (_, future), embedding in zip(batch, embeddings, strict=True):
+            if not future.done():
+                future.set_result(embedding)
+
+
+query_embedding_cache = QueryEmbeddingCache(max_size=config.QUERY_EMBEDDING_CACHE_SIZE)
+
+_embedding_executor = ThreadPoolExecutor(
+    max_workers=max(1, config.EMBEDDING_WORKERS, config.EMBEDDING_MAX_CONCURRENCY),
+    thread_name_prefix="embedding",
+)
+
+_batchers: PerLoop[EmbeddingBatcher] = PerLoop(
+    lambda: EmbeddingBatcher(
+        executor=_embedding_executor,
+        max_batch_size=config.EMBEDDING_MICRO_BATCH_SIZE,
+        max_wait_ms=config.EMBEDDING_MICRO_BATCH_WAIT_MS,
+        max_queue_size=config.EMBEDDING_QUEUE_SIZE,
+        max_concurrent_batches=config.EMBEDDING_WORKERS,
+    )
+)
+
+
+def get_embedding_batcher() -> EmbeddingBatcher:
+    """
+    Get the micro-batcher bound to the running event loop, creating it if needed.
+
+    Returns:
+        EmbeddingBatcher: The batcher for the current event loop
+    """
+    return _batchers.get()
+
+
+async def embed_texts(texts: list[str]) -> list[Any]:
+    """
+    Embed texts without blocking the event loop.
+
+    Args:
+        texts: Texts to embed
+
+    Returns:
+        List of embeddings in the same order as texts
+    """
+    if not texts:
+        return []
+    return await get_embedding_batcher().embed(texts)
+
+
+async def embed_with_cache(
+    texts: list[str], embed: Callable[[list[str]], Awaitable[list[Any]]]
+) -> list[Any]:
+    """
+    Embed document texts, reusing the content-addressed embedding cache.
+
+    Only the texts missing from the cache are passed to `embed` (each distinct
+    text once) and their embeddings are stored for the next documents.
+
+    Args:
+        texts: Texts to embed
+        embed: Coroutine function embedding a list of texts
+
+    Returns:
+        List of embeddings in the same order as texts
+    """
+    if not texts:
+        return []
+
+    model = config.EMBEDDING_MODEL
+    embeddings = await embedding_cache.get_many(model, texts)
+    missing = [i for i, embedding in enumerate(embeddings) if embedding is None]
+
+    if missing:
+        missing_texts = list(dict.fromkeys(texts[i] for i in missing))
+        new_embeddings = await embed(missing_texts)
+        await embedding_cache.put_many(model, missing_texts, new_embeddings)
+
+        embeddings_by_text = dict(zip(missing_texts, new_embeddings, strict=True))
+        for i in missing:
+            embeddings[i] = embeddings_by_text[texts[i]]
+
+    return embeddings
+
+
+async def embed_text(text: str) -> Any:
+    """
+    Embed a single document text without blocking the event loop.
+
+    Concurrent calls are coalesced into micro-batches and previously embedded
+    texts are served from the embedding cache.
+
+    Args:
+        text: Text to embed
+
+    Returns:
+        The embedding
+    """
+    return (await embed_with_cache([text], embed_texts))[0]
+
+
+async def embed_documents(
+    texts: list[str],
+    batch_size: int | None = None,
+    max_concurrency: int | None = None,
+) -> list[Any]:
+    """
+    Embed a large list of texts, such as the chunks of one document, in batches.
+
+    Texts found in the embedding cache are reused. The others are split into
+    `embed_batch` calls of `batch_size` items and at most `max_concurrency`
+    batches run at once, which keeps remote providers within their rate limits
+    while still overlapping their network latency.
+
+    Args:
+        texts: Texts to embed
+        batch_size: Number of texts per embed_batch call
+            (defaults to EMBEDDING_BATCH_SIZE)
+        max_concurrency: Maximum number of batches in flight
+            (defaults to EMBEDDING_MAX_CONCURRENCY)
+
+    Returns:
+        List of embeddings in the same order as texts
+    """
+    if not texts:
+        return []
+
+    batch_size = max(1, batch_size or config.EMBEDDING_BATCH_SIZE)
+    semaphore = asyncio.Semaphore(
+        max(1, max_concurrency or config.EMBEDDING_MAX_CONCURRENCY)
+    )
+    loop = asyncio.get_running_loop()
+
+    async def _embed_batch(batch: list[str]) -> list[Any]:
+        async with semaphore:
+            return await loop.run_in_executor(
+                _embedding_executor, config.embedding_model_instance.embed_batch, batch
+            )
+
+    async def _embed_in_batches(missing_texts: list[str]) -> list[Any]:
+        batches = [
+            missing_texts[i : i + batch_size]
+            for i in range(0, len(missing_texts), batch_size)
+        ]
+        results = await asyncio.gather(*(_embed_batch(batch) for batch in batches))
+        return [embedding for batch_result in results for embedding in batch_result]
+
+    return await embed_with_cache(texts, _embed_in_batches)
+
+
+async def embed_queries(query_texts: list[str]) -> list[Any]:
+    """
+    Embed a list of queries, reusing cached vectors and batching the rest.
+
+    Queries that are not cached yet are embedded together, so warming the cache
+    for all research questions of a chat turn costs one model or API round trip.
+
+    Args:
+        query_texts: The query texts to embed
+
+    Returns:
+        List of embeddings in the same order as query_texts
+    """
+    model = config.EMBEDDING_MODEL
+    embeddings: dict[str, Any] = {}
+    missing: list[str] = []
+
+    for query_text in query_texts:
+        if query_text in embeddings or query_text in missing:
+            continue
+        cached = query_embedding_cache.get((model, query_text))
+        if cached is not None:
+            embeddings[query_text] = cached
+        else:
+            missing.append(query_text)
+
+    if missing:
+        new_embeddings = await embed_texts(missing)
+        for query_text, embedding in zip(missing, new_embeddings, strict=True):
+            query_embedding_cache.put((model, query_text), embedding)
+            embeddings[query_text] = embedding
+
+    return [embeddings[query_text] for query_text in query_texts]
+
+
+async def get_query_embedding(query_text: str) -> Any:
+    """
+    Get the embedding for a single query, computing it only on a cache miss.
+
+    Args:
+        query_text: The query text to embed
+
+    Returns:
+        The query embedding
+    """
+    return (await embed_queries([query_text]))[0]
@@ -1,4 +1,5 @@
 import logging
+import threading
 
 import litellm
 from langchain_core.messages import HumanMessage
@@ -6,7 +7,9 @@ from langchain_litellm import ChatLiteLLM
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.future import select
 
+from app.config import config
 from app.db import LLMConfig, UserSearchSpacePreference
+from app.utils.lru_cache import LRUCache
 
 # Configure litellm to automatically drop unsupported parameters
 litellm.drop_params = True
@@ -20,6 +23,84 @@ class LLMRole:
     STRATEGIC = "strategic"
 
 
+class LLMInstanceCache:
+    """
+    Thread-safe TTL cache of ChatLiteLLM instances keyed by
+    (user, search space, role, config version).
+
+    A chat turn or an indexing run asks for the same LLM many times; a cache hit
+    skips the preference and config queries and reuses the client (and its HTTP
+    connections). Updating the LLM configs or preferences of a search space
+    bumps its config version, so the API process never serves a stale client.
+    Other processes (e.g. Celery workers) pick up changes once the TTL expires.
+    """
+
+    def __init__(self, ttl: int = 300, max_size: int = 256):
+        """
+        Initialize the cache
+
+        Args:
+            ttl: Seconds an instance is reused (0 disables the cache)
+            max_size: Maximum number of instances kept before evicting the least
+                recently used entry
+        """
+        self.ttl = ttl
+        self._entries: LRUCache[tuple, ChatLiteLLM] = LRUCache(max_size, ttl)
+        self._config_versions: dict[int, int] = {}
+        self._lock = threading.Lock()
+
+    def config_version(self, search_space_id: int) -> int:
+        """Get the current LLM config version of a search space."""
+        with self._lock:
+            return self._config_versions.get(search_space_id, 0)
+
+    def get(self, user_id, search_space_id: int, role: str) -> ChatLiteLLM | None:
+        version = self.config_version(search_space_id)
+        return self._entries.get((str(user_id), search_space_id, role, version))
+
+    def put(
+        self,
+        user_id,
+        search_space_id: int,
+        role: str,
+        llm: ChatLiteLLM,
+        config_version: int,
+    ) -> None:
+        """
+        Store an instance built from the configs read at config_version.
+
+        Instances built before an invalidation are stored under an outdated
+        version and are never returned.
+        """
+        if self.ttl <= 0:
+            return
+
+        self._entries.put((str(user_id), search_space_id, role, config_version), llm)
+
+    def invalidate(self, search_space_id: int) -> None:
+        """Drop the cached instances of a search space after its LLMs changed."""
+        with self._lock:
+            self._config_versions[search_space_id] = (
+                self._config_versions.get(search_space_id, 0) + 1
+            )
+        self._entries.discard_where(lambda key, _: key[1] == search_space_id)
+
+
+llm_instance_cache = LLMInstanceCache(
+    ttl=config.LLM_INSTANCE_CACHE_TTL_SECONDS,
+    max_size=config.LLM_INSTANCE_CACHE_SIZE,
+)
+
+
+def invalidate_llm_cache(search_space_id: int) -> None:
+    """
+    Forget the cached LLM instances of a search space.
+
+    Call after changing its LLM configs or the LLM preferences of its users.
+    """
+    llm_instance_cache.invalidate(search_space_id)
+
+
 async def validate_llm_config(
     provider: str,
     model_name: str,
@@ -126,6 +207,74 @@ async def validate_llm_config(
         return False, error_msg
 
 
+def build_chat_litellm(llm_config: LLMConfig) -> ChatLiteLLM:
+    """
+    Build a ChatLiteLLM instance from an LLM configuration.
+
+    Args:
+        llm_config: The LLM configuration
+
+    Returns:
+        ChatLiteLLM instance
+    """
+    # Build the model string for litellm / 构建 LiteLLM 的模型字符串
+    if llm_config.custom_provider:
+        model_string = f"{llm_config.custom_provider}/{llm_config.model_name}"
+    else:
+        # Map provider enum to litellm format / 将提供商枚举映射为 LiteLLM 格式
+        provider_map = {
+            "OPENAI": "openai",
+            "ANTHROPIC": "anthropic",
+            "GROQ": "groq",
+            "COHERE": "cohere",
+            "GOOGLE": "gemini",
+            "OLLAMA": "openai",  # Use OpenAI-compatible format for Ollama
+            "MISTRAL": "mistral",
+            "AZURE_OPENAI": "azure",
+            "OPENROUTER": "openrouter",
+            "COMETAPI": "cometapi",
+            # Chinese LLM providers (OpenAI-compatible)
+            "DEEPSEEK": "openai",  # DeepSeek uses OpenAI-compatible API
+            "ALIBABA_QWEN": "openai",  # Qwen uses OpenAI-compatible API
+            "MOONSHOT": "openai",  # Moonshot (Kimi) uses OpenAI-compatible API
+            "ZHIPU": "openai",  # Zhipu (GLM) uses OpenAI-compatible API
+            # Add more mappings as needed
+        }
+        provider_prefix = provider_map.get(
+            llm_config.provider.value, llm_config.provider.value.lower()
+        )
+        model_string = f"{provider_prefix}/{llm_config.model_name}"
+
+    # Create ChatLiteLLM instance
+    litellm_kwargs = {
+        "model": model_string,
+        "api_key": llm_config.api_key,
+    }
+
+    # Add optional parameters
+    if llm_config.api_base:
+        # For Ollama, ensure the API base includes /v1 for OpenAI-compatible endpoint
+        if llm_config.provider.value == "OLLAMA":
+            # Normalize Ollama API base to include /v1 if not present
+            api_base_normalized = llm_config.api_base.rstrip("/")
+            if not api_base_normalized.endswith("/v1"):
+                litellm_kwargs["api_base"] = f"{api_base_normalized}/v1"
+            else:
+                litellm_kwargs["api_base"] = api_base_normalized
+        else:
+            litellm_kwargs["api_base"] = llm_config.api_base
+    elif llm_config.provider.value == "OLLAMA":
+        # For Ollama, default to OpenAI-compatible endpoint if no api_base specified
+        # Ollama's OpenAI-compatible API is at http://localhost:11434/v1
+        litellm_kwargs["api_base"] = "http://localhost:11434/v1"
+
+    # Add any additional litellm parameters
+    if llm_config.litellm_params:
+        litellm_kwargs.update(llm_config.litellm_params)
+
+    return ChatLiteLLM(**litellm_kwargs)
+
+
 async def get_user_llm_instance(
     session: AsyncSession, user_id: str, search_space_id: int, role: str
 ) -> ChatLiteLLM | None:
@@ -141,6 +290,11 @@ async def get_user_llm_instance(
     Returns:
         ChatLiteLLM instance or None if not found
     """
+    llm = llm_instance_cache.get(user_id, search_space_id, role)
+    if llm is not None:
+        return llm
+    config_version = llm_instance_cache.config_version(search_space_id)
+
     try:
         # Get user's LLM preferences for this search space
         result = await session.execute(
@@ -190,62 +344,9 @@ async def get_user_llm_instance(
             )
             return None
 
-        # Build the model string for litellm / 构建 LiteLLM 的模型字符串
-        if llm_config.custom_provider:
-            model_string = f"{llm_config.custom_provider}/{llm_config.model_name}"
-        else:
-            # Map provider enum to litellm format / 将提供商枚举映射为 LiteLLM 格式
-            provider_map = {
-                "OPENAI": "openai",
-                "ANTHROPIC": "anthropic",
-                "GROQ": "groq",
-                "COHERE": "cohere",
-                "GOOGLE": "gemini",
-                "OLLAMA": "openai",  # Use OpenAI-compatible format for Ollama
-                "MISTRAL": "mistral",
-                "AZURE_OPENAI": "azure",
-                "OPENROUTER": "openrouter",
-                "COMETAPI": "cometapi",
-                # Chinese LLM providers (OpenAI-compatible)
-                "DEEPSEEK": "openai",  # DeepSeek uses OpenAI-compatible API
-                "ALIBABA_QWEN": "openai",  # Qwen uses OpenAI-compatible API
-                "MOONSHOT": "openai",  # Moonshot (Kimi) uses OpenAI-compatible API
-                "ZHIPU": "openai",  # Zhipu (GLM) uses OpenAI-compatible API
-                # Add more mappings as needed
-            }
-            provider_prefix = provider_map.get(
-                llm_config.provider.value, llm_config.provider.value.lower()
-            )
-            model_string = f"{provider_prefix}/{llm_config.model_name}"
-
-        # Create ChatLiteLLM instance
-        litellm_kwargs = {
-            "model": model_string,
-            "api_key": llm_config.api_key,
-        }
-
-        # Add optional parameters
-        if llm_config.api_base:
-            # For Ollama, ensure the API base includes /v1 for OpenAI-compatible endpoint
-            if llm_config.provider.value == "OLLAMA":
-                # Normalize Ollama API base to include /v1 if not present
-                api_base_normalized = llm_config.api_base.rstrip("/")
-                if not api_base_normalized.endswith("/v1"):
-                    litellm_kwargs["api_base"] = f"{api_base_normalized}/v1"
-                else:
-                    litellm_kwargs["api_base"] = api_base_normalized
-            else:
-                litellm_kwargs["api_base"] = llm_config.api_base
-        elif llm_config.provider.value == "OLLAMA":
-            # For Ollama, default to OpenAI-compatible endpoint if no api_base specified
-            # Ollama's OpenAI-compatible API is at http://localhost:11434/v1
-            litellm_kwargs["api_base"] = "http://localhost:11434/v1"
-
-        # Add any additional litellm parameters
-        if llm_config.litellm_params:
-            litellm_kwargs.update(llm_config.litellm_params)
-
-        return ChatLiteLLM(**litellm_kwargs)
+        llm = build_chat_litellm(llm_config)
+        llm_instance_cache.put(user_id, search_space_id, role, llm, config_version)
+        return llm
 
     except Exception as e:
         logger.error(
@@ -254,6 +355,42 @@ async def get_user_llm_instance(
         return None
 
 
+def cache_user_llm_instances(preference: UserSearchSpacePreference) -> None:
+    """
+    Cache the LLM instances of a preference whose LLM configs are already loaded.
+
+    Lets callers that load the preference with its long_context_llm, fast_llm
+    and strategic_llm relationships spare the agents the same queries.
+
+    Args:
+        preference: The user's preference with its LLM relationships loaded
+    """
+    config_version = llm_instance_cache.config_version(preference.search_space_id)
+    for role, llm_config in (
+        (LLMRole.LONG_CONTEXT, preference.long_context_llm),
+        (LLMRole.FAST, preference.fast_llm),
+        (LLMRole.STRATEGIC, preference.strategic_llm),
+    ):
+        if (
+            llm_config is None
+            or llm_config.search_space_id != preference.search_space_id
+            or llm_instance_cache.get(
+                preference.user_id, preference.search_space_id, role
+            )
+        ):
+            continue
+        try:
+            llm_instance_cache.put(
+                preference.user_id,
+                preference.search_space_id,
+                role,
+                build_chat_litellm(llm_config),
+                config_version,
+            )
+        except Exception as e:
+            logger.error(f"Error caching {role} LLM instance: {e!s}")
+
+
 async def get_user_long_context_llm(
     session: AsyncSession, user_id: str, search_space_id: int
 ) -> ChatLiteLLM | None:
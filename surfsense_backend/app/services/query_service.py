@@ -1,4 +1,5 @@
 import datetime
+import re
 from typing import Any
 
 from langchain.schema import AIMessage, HumanMessage, SystemMessage
@@ -6,6 +7,42 @@ from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.services.llm_service import get_user_strategic_llm
 
+# Words that make a follow-up question depend on the previous turns
+CONTEXT_DEPENDENT_WORDS = {
+    "it",
+    "its",
+    "it's",
+    "this",
+    "that",
+    "that's",
+    "these",
+    "those",
+    "they",
+    "them",
+    "their",
+    "he",
+    "him",
+    "his",
+    "she",
+    "her",
+    "there",
+    "above",
+    "previous",
+    "earlier",
+    "former",
+    "latter",
+    "same",
+    "also",
+    "else",
+    "more",
+    "again",
+}
+
+# Questions with fewer words are usually follow-ups ("why?", "and the second one?")
+SELF_CONTAINED_MIN_WORDS = 3
+# Longer questions benefit from being condensed into a search query
+SELF_CONTAINED_MAX_WORDS = 12
+
 
 class QueryService:
     """
@@ -97,6 +134,25 @@ class QueryService:
             print(f"Error reformulating query: {e}")
             return user_query
 
+    @staticmethod
+    def is_self_contained_query(user_query: str) -> bool:
+        """
+        Check whether a query can be searched as is, without the chat history.
+
+        Short questions that do not refer back to the conversation (no pronouns
+        or words like "previous" or "more") are searched without reformulation.
+
+        Args:
+            user_query: The original user query
+
+        Returns:
+            bool: True if reformulating the query is unlikely to improve retrieval
+        """
+        words = re.findall(r"[\w']+", user_query.lower())
+        if not SELF_CONTAINED_MIN_WORDS <= len(words) <= SELF_CONTAINED_MAX_WORDS:
+            return False
+        return CONTEXT_DEPENDENT_WORDS.isdisjoint(words)
+
     @staticmethod
     async def langchain_chat_history_to_str(chat_history: list[Any]) -> str:
         """
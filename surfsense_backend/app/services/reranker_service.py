@@ -1,8 +1,35 @@
+import asyncio
+import hashlib
 import logging
+from concurrent.futures import ThreadPoolExecutor
 from typing import Any, Optional
 
 from rerankers import Document as RerankerDocument
 
+from app.config import config as app_config
+from app.utils.lru_cache import LRUCache
+
+
+class RerankScoreCache(LRUCache[tuple, float]):
+    """
+    LRU cache of reranker scores keyed by (query hash, content hash,
+    model).
+
+    Follow-up questions and concurrent users often rerank the same chunks for
+    the same query, so cached pairs skip the cross-encoder entirely. Keys use
+    the content rather than chunk_id, which is a per-request counter for web
+    results and a positional fallback for documents without one.
+    """
+
+
+rerank_score_cache = RerankScoreCache(max_size=app_config.RERANKER_CACHE_SIZE)
+
+# Reranker models run on a small dedicated pool shared by all requests, so
+# concurrent chats queue for the model instead of blocking the event loop
+_reranker_executor = ThreadPoolExecutor(
+    max_workers=max(1, app_config.RERANKER_WORKERS), thread_name_prefix="reranker"
+)
+
 
 class RerankerService:
     """
@@ -89,6 +116,136 @@ class RerankerService:
             # Fall back to original documents without reranking
             return documents
 
+    async def arerank_documents(
+        self,
+        query_text: str,
+        documents: list[dict[str, Any]],
+        top_n: int | None = None,
+        latency_budget_ms: float | None = None,
+    ) -> list[dict[str, Any]]:
+        """
+        Rerank documents on the reranker worker pool without blocking the event loop
+
+        Scores are cached per (query hash, content hash, model), so only pairs
+        that were not scored before reach the model. If the model does not answer
+        within the latency budget (or fails), the documents are returned sorted by
+        their fused score; the scores still land in the cache for the next request.
+
+        Args:
+            query_text: The query text to use for reranking
+            documents: List of document dictionaries to rerank
+            top_n: Only rerank the top_n documents by fused score (defaults to
+                RERANKER_TOP_N, 0 reranks all); the rest keep their order after them
+            latency_budget_ms: Maximum time to wait for the model (defaults to
+                RERANKER_LATENCY_BUDGET_MS, 0 waits indefinitely)
+
+        Returns:
+            List[Dict[str, Any]]: Reranked documents, best first
+        """
+        if not self.reranker_instance or not documents:
+            return documents
+
+        top_n = app_config.RERANKER_TOP_N if top_n is None else top_n
+        if latency_budget_ms is None:
+            latency_budget_ms = app_config.RERANKER_LATENCY_BUDGET_MS
+
+        ranked_by_fusion = sorted(
+            documents, key=lambda doc: doc.get("score", 0.0), reverse=True
+        )
+        candidates = ranked_by_fusion
+        remaining: list[dict[str, Any]] = []
+        if top_n and len(documents) > top_n:
+            candidates = ranked_by_fusion[:top_n]
+            remaining = ranked_by_fusion[top_n:]
+
+        model_name = self._model_name()
+        query_hash = self._hash(query_text)
+        content_hashes = [self._hash(doc.get("content", "")) for doc in candidates]
+
+        # Only score contents that are not cached yet (each distinct one once)
+        scores: dict[str, float] = {}
+        missing: dict[str, str] = {}
+        for doc, content_hash in zip(candidates, content_hashes, strict=True):
+            if content_hash in scores or content_hash in missing:
+                continue
+            cached = rerank_score_cache.get((query_hash, content_hash, model_name))
+            if cached is not None:
+                scores[content_hash] = cached
+            else:
+                missing[content_hash] = doc.get("content", "")
+
+        if missing:
+            loop = asyncio.get_running_loop()
+            scoring = loop.run_in_executor(
+                _reranker_executor, self._score_contents, query_text, missing
+            )
+            scoring.add_done_callback(
+                lambda future: self._cache_scores(future, query_hash, model_name)
+            )
+            try:
+                if latency_budget_ms and latency_budget_ms > 0:
+                    new_scores = await asyncio.wait_for(
+                        asyncio.shield(scoring), latency_budget_ms / 1000
+                    )
+                else:
+                    new_scores = await scoring
+            except TimeoutError:
+                logging.warning(
+                    f"Reranking exceeded {latency_budget_ms}ms budget, using fused order"
+                )
+                return ranked_by_fusion
+            except Exception as e:
+                logging.error(f"Error during reranking: {e!s}")
+                return ranked_by_fusion
+            scores.update(new_scores)
+
+        reranked_docs = []
+        for doc, content_hash in zip(candidates, content_hashes, strict=True):
+            reranked_doc = doc.copy()
+            reranked_doc["score"] = float(scores.get(content_hash, 0.0))
+            reranked_docs.append(reranked_doc)
+        reranked_docs.sort(key=lambda doc: doc["score"], reverse=True)
+        for rank, doc in enumerate(reranked_docs, 1):
+            doc["rank"] = rank
+
+        return reranked_docs + remaining
+
+    def _score_contents(
+        self, query_text: str, contents: dict[str, str]
+    ) -> dict[str, float]:
+        """
+        Score contents keyed by content hash with the reranker model (runs on the
+        worker pool).
+        """
+        reranker_docs = [
+            RerankerDocument(text=content, doc_id=content_hash)
+            for content_hash, content in contents.items()
+        ]
+        reranking_results = self.reranker_instance.rank(
+            query=query_text, docs=reranker_docs
+        )
+        return {
+            result.document.doc_id: float(result.score)
+            for result in reranking_results.results
+        }
+
+    @staticmethod
+    def _cache_scores(future: asyncio.Future, query_hash: str, model_name: str) -> None:
+        if future.cancelled() or future.exception() is not None:
+            return
+        for content_hash, score in future.result().items():
+            rerank_score_cache.put((query_hash, content_hash, model_name), score)
+
+    @staticmethod
+    def _hash(text: str) -> str:
+        return hashlib.sha256(text.encode()).hexdigest()
+
+    def _model_name(self) -> str:
+        return (
+            getattr(app_config, "RERANKERS_MODEL_NAME", None)
+            or type(self.reranker_instance).__name__
+        )
+
     @staticmethod
     def get_reranker_instance() -> Optional["RerankerService"]:
         """
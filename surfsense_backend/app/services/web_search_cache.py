@@ -0,0 +1,147 @@
+import hashlib
+import json
+import logging
+import re
+from typing import Any
+
+from app.config import config
+from app.utils.lru_cache import LRUCache
+from app.utils.per_loop import PerLoop
+
+logger = logging.getLogger(__name__)
+
+
+class WebSearchCache:
+    """
+    Short-lived cache of web search provider responses keyed by
+    (provider, normalized query, top_k, request variant).
+
+    A chat turn searches both the original and the reformulated question and
+    users often retry the same question, so repeated provider calls (paid and
+    slow) are answered from the cache. Responses are kept in Redis when
+    WEB_SEARCH_CACHE_REDIS_URL is set, so every API process and worker shares
+    them, and in process memory otherwise (or while Redis is unreachable).
+    """
+
+    def __init__(
+        self,
+        ttl: int = 600,
+        max_size: int = 1000,
+        redis_url: str | None = None,
+        disabled_providers: set[str] | None = None,
+    ):
+        """
+        Initialize the cache
+
+        Args:
+            ttl: Seconds a response is reused (0 disables the cache)
+            max_size: Maximum number of responses kept in process memory
+            redis_url: Optional Redis URL shared by all processes
+            disabled_providers: Providers whose responses are never cached
+        """
+        self.ttl = ttl
+        self.redis_url = redis_url
+        self.disabled_providers = disabled_providers or set()
+        self._entries: LRUCache[str, Any] = LRUCache(max_size, ttl)
+        self._redis_clients: PerLoop[Any] | None = None
+        if redis_url:
+            self._redis_clients = PerLoop(
+                self._create_redis_client, close=lambda client: client.aclose()
+            )
+
+    def is_enabled(self, provider: str) -> bool:
+        return self.ttl > 0 and provider not in self.disabled_providers
+
+    @staticmethod
+    def make_key(
+        provider: str, query: str, top_k: int | None, variant: Any = None
+    ) -> str:
+        """
+        Build the cache key of a provider request.
+
+        Args:
+            provider: The provider name (e.g. "TAVILY_API")
+            query: The search query, normalized for case and whitespace
+            top_k: Number of requested results
+            variant: Other request parameters that change the results (e.g. the
+                SearxNG host and engines), must be JSON serializable
+
+        Returns:
+            str: The cache key
+        """
+        normalized_query = re.sub(r"\s+", " ", query).strip().lower()
+        digest = hashlib.blake2b(
+            json.dumps(
+                [normalized_query, top_k, variant], sort_keys=True, default=str
+            ).encode(),
+            digest_size=16,
+        ).hexdigest()
+        return f"surfsense:web_search:{provider}:{digest}"
+
+    def _create_redis_client(self):
+        import redis.asyncio as redis
+
+        return redis.from_url(self.redis_url)
+
+    def _get_redis(self):
+        if self._redis_clients is None:
+            return None
+        return self._redis_clients.get()
+
+    async def get(
+        self, provider: str, query: str, top_k: int | None, variant: Any = None
+    ) -> Any | None:
+        """
+        Get a cached provider response.
+
+        Returns:
+            The cached response or None on a miss
+        """
+        if not self.is_enabled(provider):
+            return None
+
+        key = self.make_key(provider, query, top_k, variant)
+
+        redis_client = self._get_redis()
+        if redis_client is not None:
+            try:
+                value = await redis_client.get(key)
+                return json.loads(value) if value is not None else None
+            except Exception as e:
+                logger.warning(f"Web search cache read failed, using memory: {e!s}")
+
+        return self._entries.get(key)
+
+    async def set(
+        self,
+        provider: str,
+        query: str,
+        top_k: int | None,
+        response: Any,
+        variant: Any = None,
+    ) -> None:
+        """
+        Cache a successful provider response (must be JSON serializable).
+        """
+        if not self.is_enabled(provider):
+            return
+
+        key = self.make_key(provider, query, top_k, variant)
+
+        redis_client = self._get_redis()
+        if redis_client is not None:
+            try:
+                await redis_client.set(key, json.dumps(response), ex=self.ttl)
+                return
+            except Exception as e:
+                logger.warning(f"Web search cache write failed, using memory: {e!s}")
+
+        self._entries.put(key, response)
+
+
+web_search_cache = WebSearchCache(
+    ttl=config.WEB_SEARCH_CACHE_TTL_SECONDS,
+    max_size=config.WEB_SEARCH_CACHE_SIZE,
+    redis_url=config.WEB_SEARCH_CACHE_REDIS_URL,
+    disabled_providers=config.WEB_SEARCH_CACHE_DISABLED_PROVIDERS,
+)
@@ -7,6 +7,7 @@ from sqlalchemy.pool import NullPool
 
 from app.celery_app import celery_app
 from app.config import config
+from app.utils.per_loop import close_loop_objects
 
 logger = logging.getLogger(__name__)
 
@@ -47,6 +48,7 @@ def index_slack_messages_task(
             )
         )
     finally:
+        loop.run_until_complete(close_loop_objects())
         loop.close()
 
 
@@ -90,6 +92,7 @@ def index_notion_pages_task(
             )
         )
     finally:
+        loop.run_until_complete(close_loop_objects())
         loop.close()
 
 
@@ -133,6 +136,7 @@ def index_github_repos_task(
             )
         )
     finally:
+        loop.run_until_complete(close_loop_objects())
         loop.close()
 
 
@@ -176,6 +180,7 @@ def index_linear_issues_task(
             )
         )
     finally:
+        loop.run_until_complete(close_loop_objects())
         loop.close()
 
 
@@ -219,6 +224,7 @@ def index_jira_issues_task(
             )
         )
     finally:
+        loop.run_until_complete(close_loop_objects())
         loop.close()
 
 
@@ -262,6 +268,7 @@ def index_confluence_pages_task(
             )
         )
     finally:
+        loop.run_until_complete(close_loop_objects())
         loop.close()
 
 
@@ -305,6 +312,7 @@ def index_clickup_tasks_task(
             )
         )
     finally:
+        loop.run_until_complete(close_loop_objects())
         loop.close()
 
 
@@ -348,6 +356,7 @@ def index_google_calendar_events_task(
             )
         )
     finally:
+        loop.run_until_complete(close_loop_objects())
         loop.close()
 
 
@@ -391,6 +400,7 @@ def index_airtable_records_task(
             )
         )
     finally:
+        loop.run_until_complete(close_loop_objects())
         loop.close()
 
 
@@ -434,6 +444,7 @@ def index_google_gmail_messages_task(
             )
         )
     finally:
+        loop.run_until_complete(close_loop_objects())
         loop.close()
 
 
@@ -495,6 +506,7 @@ def index_discord_messages_task(
             )
         )
     finally:
+        loop.run_until_complete(close_loop_objects())
         loop.close()
 
 
@@ -538,6 +550,7 @@ def index_luma_events_task(
             )
         )
     finally:
+        loop.run_until_complete(close_loop_objects())
         loop.close()
 
 
@@ -581,6 +594,7 @@ def index_elasticsearch_documents_task(
             )
         )
     finally:
+        loop.run_until_complete(close_loop_objects())
         loop.close()
 
 
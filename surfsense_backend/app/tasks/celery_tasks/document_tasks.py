@@ -13,6 +13,7 @@ from app.tasks.document_processors import (
     add_extension_received_document,
     add_youtube_video_document,
 )
+from app.utils.per_loop import close_loop_objects
 
 logger = logging.getLogger(__name__)
 
@@ -56,6 +57,7 @@ def process_extension_document_task(
             )
         )
     finally:
+        loop.run_until_complete(close_loop_objects())
         loop.close()
 
 
@@ -130,6 +132,7 @@ def process_crawled_url_task(self, url: str, search_space_id: int, user_id: str)
     try:
         loop.run_until_complete(_process_crawled_url(url, search_space_id, user_id))
     finally:
+        loop.run_until_complete(close_loop_objects())
         loop.close()
 
 
@@ -195,6 +198,7 @@ def process_youtube_video_task(self, url: str, search_space_id: int, user_id: st
     try:
         loop.run_until_complete(_process_youtube_video(url, search_space_id, user_id))
     finally:
+        loop.run_until_complete(close_loop_objects())
         loop.close()
 
 
@@ -265,6 +269,7 @@ def process_file_upload_task(
             _process_file_upload(file_path, filename, search_space_id, user_id)
         )
     finally:
+        loop.run_until_complete(close_loop_objects())
         loop.close()
 
 
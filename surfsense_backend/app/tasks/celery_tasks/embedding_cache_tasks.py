@@ -0,0 +1,29 @@
+"""Celery tasks for the shared embedding cache."""
+
+import asyncio
+import logging
+
+from app.celery_app import celery_app
+from app.services.embedding_cache_service import embedding_cache
+from app.utils.per_loop import close_loop_objects
+
+logger = logging.getLogger(__name__)
+
+
+@celery_app.task(name="prune_embedding_cache")
+def prune_embedding_cache_task():
+    """
+    Trim the embedding_cache table to EMBEDDING_CACHE_MAX_ROWS rows.
+
+    Runs periodically from Celery beat, so indexing never pays for the trim.
+    """
+    loop = asyncio.new_event_loop()
+    asyncio.set_event_loop(loop)
+
+    try:
+        loop.run_until_complete(embedding_cache.prune())
+    except Exception as e:
+        logger.error(f"Error pruning the embedding cache: {e!s}", exc_info=True)
+    finally:
+        loop.run_until_complete(close_loop_objects())
+        loop.close()
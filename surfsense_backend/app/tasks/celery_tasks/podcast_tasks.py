@@ -10,6 +10,7 @@ from sqlalchemy.pool import NullPool
 from app.celery_app import celery_app
 from app.config import config
 from app.tasks.podcast_tasks import generate_chat_podcast
+from app.utils.per_loop import close_loop_objects
 
 logger = logging.getLogger(__name__)
 
@@ -58,6 +59,7 @@ def generate_chat_podcast_task(
         )
         loop.run_until_complete(loop.shutdown_asyncgens())
     finally:
+        loop.run_until_complete(close_loop_objects())
         asyncio.set_event_loop(None)
         loop.close()
 
@@ -5,25 +5,30 @@ Airtable connector indexer.
 from sqlalchemy.exc import SQLAlchemyError
 from sqlalchemy.ext.asyncio import AsyncSession
 
-from app.config import config
 from app.connectors.airtable_connector import AirtableConnector
-from app.db import Document, DocumentType, SearchSourceConnectorType
+from app.db import (
+    Document,
+    DocumentType,
+    SearchSourceConnectorType,
+    increment_index_version,
+)
 from app.routes.airtable_add_connector_route import refresh_airtable_token
 from app.schemas.airtable_auth_credentials import AirtableAuthCredentialsBase
+from app.services.embedding_service import embed_text
 from app.services.llm_service import get_user_long_context_llm
 from app.services.task_logging_service import TaskLoggingService
 from app.utils.document_converters import (
     create_document_chunks,
     generate_content_hash,
     generate_document_summary,
-    generate_unique_identifier_hash,
 )
 
 from .base import (
     calculate_date_range,
-    check_document_by_unique_identifier,
     get_connector_by_id,
+    get_document_with_chunks,
     logger,
+    lookup_source_items,
     update_connector_last_indexed,
 )
 
@@ -221,8 +226,18 @@ async def index_airtable_records(
                     documents_indexed = 0
                     skipped_messages = []
                     documents_skipped = 0
+                    # Look up all already indexed records of the table in one query
+                    source_items = await lookup_source_items(
+                        session,
+                        DocumentType.AIRTABLE_CONNECTOR,
+                        search_space_id,
+                        records,
+                        lambda record: record.get("id", "Unknown"),
+                    )
+                    documents_skipped += source_items.repeated_count
+
                     # Process each record
-                    for record in records:
+                    for record, unique_identifier_hash in source_items.items:
                         try:
                             # Generate markdown content
                             markdown_content = (
@@ -243,23 +258,14 @@ async def index_airtable_records(
 
                             record_id = record.get("id", "Unknown")
 
-                            # Generate unique identifier hash for this Airtable record
-                            unique_identifier_hash = generate_unique_identifier_hash(
-                                DocumentType.AIRTABLE_CONNECTOR,
-                                record_id,
-                                search_space_id,
-                            )
-
                             # Generate content hash
                             content_hash = generate_content_hash(
                                 markdown_content, search_space_id
                             )
 
                             # Check if document with this unique identifier already exists
-                            existing_document = (
-                                await check_document_by_unique_identifier(
-                                    session, unique_identifier_hash
-                                )
+                            existing_document = source_items.existing_documents.get(
+                                unique_identifier_hash
                             )
 
                             if existing_document:
@@ -275,6 +281,9 @@ async def index_airtable_records(
                                     logger.info(
                                         f"Content changed for Airtable record {record_id}. Updating document."
                                     )
+                                    existing_document = await get_document_with_chunks(
+                                        session, existing_document.id
+                                    )
 
                                     # Generate document summary
                                     user_llm = await get_user_long_context_llm(
@@ -302,15 +311,14 @@ async def index_airtable_records(
                                         summary_content = (
                                             f"Airtable Record: {record_id}\n\n"
                                         )
-                                        summary_embedding = (
-                                            config.embedding_model_instance.embed(
-                                                summary_content
-                                            )
+                                        summary_embedding = await embed_text(
+                                            summary_content
                                         )
 
                                     # Process chunks
                                     chunks = await create_document_chunks(
-                                        markdown_content
+                                        markdown_content,
+                                        existing_chunks=existing_document.chunks,
                                     )
 
                                     # Update existing document
@@ -356,11 +364,7 @@ async def index_airtable_records(
                             else:
                                 # Fallback to simple summary if no LLM configured
                                 summary_content = f"Airtable Record: {record_id}\n\n"
-                                summary_embedding = (
-                                    config.embedding_model_instance.embed(
-                                        summary_content
-                                    )
-                                )
+                                summary_embedding = await embed_text(summary_content)
 
                             # Process chunks
                             chunks = await create_document_chunks(markdown_content)
@@ -395,6 +399,7 @@ async def index_airtable_records(
                                 logger.info(
                                     f"Committing batch: {documents_indexed} Airtable records processed so far"
                                 )
+                                await increment_index_version(session, search_space_id)
                                 await session.commit()
 
                         except Exception as e:
@@ -419,6 +424,8 @@ async def index_airtable_records(
                     logger.info(
                         f"Final commit: Total {documents_indexed} Airtable records processed"
                     )
+                    if documents_indexed > 0:
+                        await increment_index_version(session, search_space_id)
                     await session.commit()
                     logger.info(
                         "Successfully committed all Airtable document changes to database"
@@ -2,21 +2,43 @@
 Base functionality and shared imports for connector indexers.
 """
 
+import asyncio
+import inspect
 import logging
+from collections.abc import AsyncIterable, Awaitable, Callable, Iterable
+from dataclasses import dataclass, field
 from datetime import datetime, timedelta
+from typing import Any, NamedTuple
 
+from sqlalchemy.exc import SQLAlchemyError
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.future import select
+from sqlalchemy.orm import selectinload
 
+from app.config import config
 from app.db import (
     Document,
+    DocumentType,
     SearchSourceConnector,
     SearchSourceConnectorType,
+    increment_index_version,
 )
+from app.utils.bulk_insert import bulk_insert_documents
+from app.utils.document_converters import generate_unique_identifier_hash
 
 # Set up logging
 logger = logging.getLogger(__name__)
 
+# Maximum number of hashes sent in a single IN clause
+EXISTENCE_LOOKUP_BATCH_SIZE = 1000
+
+
+class ExistingDocument(NamedTuple):
+    """ID and content hash of an already indexed document."""
+
+    id: int
+    content_hash: str
+
 
 async def check_duplicate_document_by_hash(
     session: AsyncSession, content_hash: str
@@ -51,8 +73,6 @@ async def check_document_by_unique_identifier(
     Returns:
         Existing document if found, None otherwise
     """
-    from sqlalchemy.orm import selectinload
-
     existing_doc_result = await session.execute(
         select(Document)
         .options(selectinload(Document.chunks))
@@ -61,6 +81,495 @@ async def check_document_by_unique_identifier(
     return existing_doc_result.scalars().first()
 
 
+async def get_existing_documents_by_unique_identifiers(
+    session: AsyncSession, unique_identifier_hashes: list[str]
+) -> dict[str, ExistingDocument]:
+    """
+    Look up which documents of a batch are already indexed, in one query per
+    EXISTENCE_LOOKUP_BATCH_SIZE hashes instead of one query per item.
+
+    Only IDs and content hashes are fetched so unchanged items can be skipped
+    without loading them; use get_document_with_chunks for the documents whose
+    content changed.
+
+    Args:
+        session: Database session
+        unique_identifier_hashes: Unique identifier hashes of the batch
+
+    Returns:
+        Dict mapping the unique identifier hash of every existing document to
+        its ID and content hash
+    """
+    hashes = list(dict.fromkeys(unique_identifier_hashes))
+    existing_documents = {}
+
+    for start in range(0, len(hashes), EXISTENCE_LOOKUP_BATCH_SIZE):
+        result = await session.execute(
+            select(
+                Document.unique_identifier_hash, Document.id, Document.content_hash
+            ).where(
+                Document.unique_identifier_hash.in_(
+                    hashes[start : start + EXISTENCE_LOOKUP_BATCH_SIZE]
+                )
+            )
+        )
+        for unique_identifier_hash, document_id, content_hash in result.all():
+            existing_documents[unique_identifier_hash] = ExistingDocument(
+                document_id, content_hash
+            )
+
+    return existing_documents
+
+
+@dataclass
+class SourceItemBatch:
+    """Source items of a sync batch, ready to be checked against the index."""
+
+    # (source item, unique identifier hash) pairs, without repeated items
+    items: list[tuple[Any, str]]
+    # Already indexed documents by unique identifier hash
+    existing_documents: dict[str, ExistingDocument]
+    # Number of items dropped because they were repeated within the batch
+    repeated_count: int
+
+
+async def lookup_source_items(
+    session: AsyncSession,
+    document_type: DocumentType,
+    search_space_id: int,
+    source_items: Iterable[Any],
+    unique_identifier: Callable[[Any], str | int | float],
+) -> SourceItemBatch:
+    """
+    Hash the unique identifier of every source item once, drop the items
+    repeated within the batch (e.g. overlapping pages) and look up the already
+    indexed ones with get_existing_documents_by_unique_identifiers.
+
+    Args:
+        session: Database session
+        document_type: The type of the documents
+        search_space_id: The search space the documents belong to
+        source_items: The items fetched from the source system
+        unique_identifier: Returns the unique ID of an item in the source system
+
+    Returns:
+        SourceItemBatch: The unique items with their hashes and existing documents
+    """
+    unique_items: dict[str, Any] = {}
+    item_count = 0
+    for source_item in source_items:
+        item_count += 1
+        unique_identifier_hash = generate_unique_identifier_hash(
+            document_type, unique_identifier(source_item), search_space_id
+        )
+        unique_items.setdefault(unique_identifier_hash, source_item)
+
+    repeated_count = item_count - len(unique_items)
+    if repeated_count:
+        logger.info(
+            f"Skipping {repeated_count} {document_type.value} items repeated "
+            "within this sync."
+        )
+
+    existing_documents = await get_existing_documents_by_unique_identifiers(
+        session, list(unique_items)
+    )
+    return SourceItemBatch(
+        items=[
+            (source_item, unique_identifier_hash)
+            for unique_identifier_hash, source_item in unique_items.items()
+        ],
+        existing_documents=existing_documents,
+        repeated_count=repeated_count,
+    )
+
+
+async def get_existing_content_hashes(
+    session: AsyncSession, content_hashes: list[str]
+) -> set[str]:
+    """
+    Look up which content hashes of a batch are already used by a document.
+
+    Args:
+        session: Database session
+        content_hashes: Content hashes of the batch
+
+    Returns:
+        Set of the content hashes found
+    """
+    hashes = list(dict.fromkeys(content_hashes))
+    existing_hashes = set()
+
+    for start in range(0, len(hashes), EXISTENCE_LOOKUP_BATCH_SIZE):
+        result = await session.execute(
+            select(Document.content_hash).where(
+                Document.content_hash.in_(
+                    hashes[start : start + EXISTENCE_LOOKUP_BATCH_SIZE]
+                )
+            )
+        )
+        existing_hashes.update(result.scalars().all())
+
+    return existing_hashes
+
+
+async def get_document_with_chunks(
+    session: AsyncSession, document_id: int
+) -> Document | None:
+    """
+    Get a document by ID with its chunks eagerly loaded, ready to be updated.
+
+    Args:
+        session: Database session
+        document_id: ID of the document
+
+    Returns:
+        The document if found, None otherwise
+    """
+    result = await session.execute(
+        select(Document)
+        .options(selectinload(Document.chunks))
+        .where(Document.id == document_id)
+    )
+    return result.scalars().first()
+
+
+@dataclass
+class PipelineItem:
+    """A source item on its way through an IndexingPipeline."""
+
+    # Short label used in logs and skip reports (e.g. the Jira issue key)
+    label: str
+    unique_identifier_hash: str
+    content_hash: str
+    # Data produced by the transform stage for the process and write stages
+    data: dict[str, Any] = field(default_factory=dict)
+    # Data produced by the process stage (summary, embedding, chunks...)
+    result: dict[str, Any] = field(default_factory=dict)
+    existing_document_id: int | None = None
+    # The document being updated, with its chunks loaded before processing
+    existing_document: Document | None = None
+
+
+@dataclass
+class PipelineStats:
+    """Outcome of an IndexingPipeline run."""
+
+    documents_indexed: int = 0
+    documents_skipped: int = 0
+    failed_items: list[str] = field(default_factory=list)
+
+
+_STAGE_DONE = object()
+
+
+def _first_exception(error: BaseException) -> BaseException:
+    while isinstance(error, BaseExceptionGroup):
+        error = error.exceptions[0]
+    return error
+
+
+class IndexingPipeline:
+    """
+    Staged indexing engine shared by the connector indexers.
+
+    Items flow through bounded queues between five stages that run
+    concurrently, so a slow stage only applies backpressure instead of
+    serializing the whole sync:
+
+    1. fetch: iterates the (sync or async) source items
+    2. transform: `transform(source_item)` formats an item and returns a
+       PipelineItem with its hashes, or None to skip it
+    3. lookup: checks batches of items against the existing documents; unchanged
+       items, repeated items and items whose content is already indexed (by
+       another document or earlier in the run) are skipped, so they cannot fail
+       a whole write batch on the unique constraints
+    4. process: `await process(item)` stores the summary, embedding and chunks
+       of an item in `item.result`; concurrent embed calls are coalesced into
+       batches by the embedding micro-batcher. For updates,
+       `item.existing_document` is loaded with its chunks so unchanged chunks
+       can be reused (see create_document_chunks)
+    5. write: `write(item, existing_document)` returns the new or updated
+       Document. Updated documents are flushed by the session, new ones are
+       bulk inserted with their chunks (see bulk_insert_documents), and the
+       search space index versions are incremented every commit_batch_size
+       documents
+
+    The session is only used by the lookup and write stages, one at a time.
+    The final commit is left to the caller.
+    """
+
+    def __init__(
+        self,
+        session: AsyncSession,
+        transform: Callable[
+            [Any], PipelineItem | Awaitable[PipelineItem | None] | None
+        ],
+        process: Callable[[PipelineItem], Awaitable[None]],
+        write: Callable[[PipelineItem, Document | None], Document],
+        label: Callable[[Any], str] | None = None,
+        transform_concurrency: int | None = None,
+        process_concurrency: int | None = None,
+        lookup_batch_size: int | None = None,
+        commit_batch_size: int | None = None,
+        queue_size: int | None = None,
+    ):
+        """
+        Initialize the pipeline
+
+        Args:
+            session: Database session
+            transform: Builds the PipelineItem of a source item (None skips it)
+            process: Generates the summary, embeddings and chunks of an item
+            write: Builds the new Document or updates the existing one
+            label: Describes a source item in logs when its transform fails
+            transform_concurrency: Number of transform workers
+            process_concurrency: Number of items processed at once
+            lookup_batch_size: Maximum number of items per existence lookup
+            commit_batch_size: Number of written documents per commit
+            queue_size: Capacity of the queues between stages
+        """
+        self.session = session
+        self.transform = transform
+        self.process = process
+        self.write = write
+        self.label = label or (lambda _: "Unknown")
+        self.transform_concurrency = max(
+            1, transform_concurrency or config.INDEXING_PIPELINE_TRANSFORM_CONCURRENCY
+        )
+        self.process_concurrency = max(
+            1, process_concurrency or config.INDEXING_PIPELINE_PROCESS_CONCURRENCY
+        )
+        self.lookup_batch_size = max(
+            1, lookup_batch_size or config.INDEXING_PIPELINE_LOOKUP_BATCH_SIZE
+        )
+        self.commit_batch_size = max(
+            1, commit_batch_size or config.INDEXING_PIPELINE_COMMIT_BATCH_SIZE
+        )
+        self.queue_size = max(1, queue_size or config.INDEXING_PIPELINE_QUEUE_SIZE)
+        self.stats = PipelineStats()
+        self._session_lock = asyncio.Lock()
+        self._seen_hashes: set[str] = set()
+        self._seen_content_hashes: set[str] = set()
+        self._new_documents: list[Document] = []
+        self._updated_search_space_ids: set[int] = set()
+
+    def _fail(self, label: str, error: Exception) -> None:
+        logger.error(f"Error processing {label}: {error!s}", exc_info=True)
+        self.stats.failed_items.append(f"{label} (processing error)")
+        self.stats.documents_skipped += 1
+
+    async def run(
+        self, source_items: Iterable[Any] | AsyncIterable[Any]
+    ) -> PipelineStats:
+        """
+        Index source items through the pipeline.
+
+        Args:
+            source_items: The fetched source items, or an async iterator
+                yielding them while they are fetched
+
+        Returns:
+            PipelineStats: Number of indexed and skipped documents and the items
+            that failed
+        """
+        transform_queue = asyncio.Queue(maxsize=self.queue_size)
+        lookup_queue = asyncio.Queue(maxsize=self.queue_size)
+        process_queue = asyncio.Queue(maxsize=self.queue_size)
+        write_queue = asyncio.Queue(maxsize=self.queue_size)
+
+        try:
+            async with asyncio.TaskGroup() as stages:
+                stages.create_task(self._fetch(source_items, transform_queue))
+                stages.create_task(
+                    self._run_stage(
+                        self._transform_item,
+                        self.transform_concurrency,
+                        transform_queue,
+                        lookup_queue,
+                        1,
+                    )
+                )
+                stages.create_task(self._lookup(lookup_queue, process_queue))
+                stages.create_task(
+                    self._run_stage(
+                        self._process_item,
+                        self.process_concurrency,
+                        process_queue,
+                        write_queue,
+                        1,
+                    )
+                )
+                stages.create_task(
+                    self._run_stage(self._write_item, 1, write_queue, None, 0)
+                )
+        except BaseExceptionGroup as group:
+            # Surface the original error (e.g. SQLAlchemyError) to the indexer
+            raise _first_exception(group) from None
+
+        async with self._session_lock:
+            await self._write_batch()
+        return self.stats
+
+    async def _write_batch(self) -> None:
+        """Insert the buffered new documents and bump the updated index versions."""
+        new_documents, self._new_documents = self._new_documents, []
+        await bulk_insert_documents(self.session, new_documents)
+
+        updated_search_space_ids = self._updated_search_space_ids
+        self._updated_search_space_ids = set()
+        await increment_index_version(self.session, *updated_search_space_ids)
+
+    async def _fetch(
+        self,
+        source_items: Iterable[Any] | AsyncIterable[Any],
+        outbox: asyncio.Queue,
+    ) -> None:
+        if isinstance(source_items, AsyncIterable):
+            async for source_item in source_items:
+                await outbox.put(source_item)
+        else:
+            for source_item in source_items:
+                await outbox.put(source_item)
+
+        for _ in range(self.transform_concurrency):
+            await outbox.put(_STAGE_DONE)
+
+    async def _run_stage(
+        self,
+        handle: Callable[[Any, asyncio.Queue | None], Awaitable[None]],
+        concurrency: int,
+        inbox: asyncio.Queue,
+        outbox: asyncio.Queue | None,
+        outbox_consumers: int,
+    ) -> None:
+        async def worker():
+            while (entry := await inbox.get()) is not _STAGE_DONE:
+                await handle(entry, outbox)
+
+        async with asyncio.TaskGroup() as workers:
+            for _ in range(concurrency):
+                workers.create_task(worker())
+
+        for _ in range(outbox_consumers):
+            await outbox.put(_STAGE_DONE)
+
+    async def _transform_item(self, source_item: Any, outbox: asyncio.Queue) -> None:
+        try:
+            item = self.transform(source_item)
+            if inspect.isawaitable(item):
+                item = await item
+        except Exception as e:
+            self._fail(self.label(source_item), e)
+            return
+
+        if item is None:
+            self.stats.documents_skipped += 1
+            return
+        await outbox.put(item)
+
+    async def _lookup(self, inbox: asyncio.Queue, outbox: asyncio.Queue) -> None:
+        done = False
+        while not done:
+            batch = []
+            entry = await inbox.get()
+            while entry is not _STAGE_DONE:
+                batch.append(entry)
+                if len(batch) >= self.lookup_batch_size or inbox.empty():
+                    break
+                entry = inbox.get_nowait()
+            done = entry is _STAGE_DONE
+
+            existing_documents = {}
+            existing_content_hashes = set()
+            if batch:
+                async with self._session_lock:
+                    existing_documents = (
+                        await get_existing_documents_by_unique_identifiers(
+                            self.session,
+                            [item.unique_identifier_hash for item in batch],
+                        )
+                    )
+                    existing_content_hashes = await get_existing_content_hashes(
+                        self.session, [item.content_hash for item in batch]
+                    )
+
+            for item in batch:
+                if item.unique_identifier_hash in self._seen_hashes:
+                    logger.info(f"Skipping duplicate item {item.label}.")
+                    self.stats.documents_skipped += 1
+                    continue
+                self._seen_hashes.add(item.unique_identifier_hash)
+
+                existing_document = existing_documents.get(item.unique_identifier_hash)
+                if (
+                    existing_document
+                    and existing_document.content_hash == item.content_hash
+                ):
+                    logger.info(f"Document for {item.label} unchanged. Skipping.")
+                    self.stats.documents_skipped += 1
+                    continue
+
+                if (
+                    item.content_hash in self._seen_content_hashes
+                    or item.content_hash in existing_content_hashes
+                ):
+                    logger.warning(
+                        f"Content of {item.label} is already indexed by another document. Skipping."
+                    )
+                    self.stats.failed_items.append(f"{item.label} (duplicate content)")
+                    self.stats.documents_skipped += 1
+                    continue
+                self._seen_content_hashes.add(item.content_hash)
+
+                if existing_document:
+                    logger.info(f"Content changed for {item.label}. Updating document.")
+                    item.existing_document_id = existing_document.id
+                await outbox.put(item)
+
+        for _ in range(self.process_concurrency):
+            await outbox.put(_STAGE_DONE)
+
+    async def _process_item(self, item: PipelineItem, outbox: asyncio.Queue) -> None:
+        try:
+            if item.existing_document_id is not None:
+                async with self._session_lock:
+                    item.existing_document = await get_document_with_chunks(
+                        self.session, item.existing_document_id
+                    )
+            await self.process(item)
+        except Exception as e:
+            self._fail(item.label, e)
+            return
+        await outbox.put(item)
+
+    async def _write_item(self, item: PipelineItem, _outbox: None) -> None:
+        async with self._session_lock:
+            existing_document = item.existing_document
+            try:
+                document = self.write(item, existing_document)
+            except SQLAlchemyError:
+                raise
+            except Exception as e:
+                self._fail(item.label, e)
+                return
+
+            if existing_document is None:
+                self._new_documents.append(document)
+            else:
+                self.session.add(document)
+                self._updated_search_space_ids.add(document.search_space_id)
+            self.stats.documents_indexed += 1
+            logger.info(f"Successfully indexed {item.label}")
+
+            if self.stats.documents_indexed % self.commit_batch_size == 0:
+                logger.info(
+                    f"Committing batch: {self.stats.documents_indexed} documents processed so far"
+                )
+                await self._write_batch()
+                await self.session.commit()
+
+
 async def get_connector_by_id(
     session: AsyncSession, connector_id: int, connector_type: SearchSourceConnectorType
 ) -> SearchSourceConnector | None:
@@ -7,22 +7,27 @@ from datetime import datetime
 from sqlalchemy.exc import SQLAlchemyError
 from sqlalchemy.ext.asyncio import AsyncSession
 
-from app.config import config
 from app.connectors.clickup_connector import ClickUpConnector
-from app.db import Document, DocumentType, SearchSourceConnectorType
+from app.db import (
+    Document,
+    DocumentType,
+    SearchSourceConnectorType,
+    increment_index_version,
+)
+from app.services.embedding_service import embed_text
 from app.services.llm_service import get_user_long_context_llm
 from app.services.task_logging_service import TaskLoggingService
 from app.utils.document_converters import (
     create_document_chunks,
     generate_content_hash,
     generate_document_summary,
-    generate_unique_identifier_hash,
 )
 
 from .base import (
-    check_document_by_unique_identifier,
     get_connector_by_id,
+    get_document_with_chunks,
     logger,
+    lookup_source_items,
     update_connector_last_indexed,
 )
 
@@ -162,7 +167,17 @@ async def index_clickup_tasks(
                 {"stage": "tasks_found", "task_count": len(tasks)},
             )
 
-            for task in tasks:
+            # Look up all already indexed tasks of the workspace in one query
+            source_items = await lookup_source_items(
+                session,
+                DocumentType.CLICKUP_CONNECTOR,
+                search_space_id,
+                tasks,
+                lambda task: task.get("id"),
+            )
+            documents_skipped += source_items.repeated_count
+
+            for task, unique_identifier_hash in source_items.items:
                 try:
                     task_id = task.get("id")
                     task_name = task.get("name", "Untitled Task")
@@ -210,17 +225,12 @@ async def index_clickup_tasks(
                         documents_skipped += 1
                         continue
 
-                    # Generate unique identifier hash for this ClickUp task
-                    unique_identifier_hash = generate_unique_identifier_hash(
-                        DocumentType.CLICKUP_CONNECTOR, task_id, search_space_id
-                    )
-
                     # Generate content hash
                     content_hash = generate_content_hash(task_content, search_space_id)
 
                     # Check if document with this unique identifier already exists
-                    existing_document = await check_document_by_unique_identifier(
-                        session, unique_identifier_hash
+                    existing_document = source_items.existing_documents.get(
+                        unique_identifier_hash
                     )
 
                     if existing_document:
@@ -236,6 +246,9 @@ async def index_clickup_tasks(
                             logger.info(
                                 f"Content changed for ClickUp task {task_name}. Updating document."
                             )
+                            existing_document = await get_document_with_chunks(
+                                session, existing_document.id
+                            )
 
                             # Generate summary with metadata
                             user_llm = await get_user_long_context_llm(
@@ -262,12 +275,12 @@ async def index_clickup_tasks(
                                 )
                             else:
                                 summary_content = task_content
-                                summary_embedding = (
-                                    config.embedding_model_instance.embed(task_content)
-                                )
+                                summary_embedding = await embed_text(task_content)
 
                             # Process chunks
-                            chunks = await create_document_chunks(task_content)
+                            chunks = await create_document_chunks(
+                                task_content, existing_chunks=existing_document.chunks
+                            )
 
                             # Update existing document
                             existing_document.title = f"Task - {task_name}"
@@ -322,9 +335,7 @@ async def index_clickup_tasks(
                     else:
                         # Fallback to simple summary if no LLM configured
                         summary_content = task_content
-                        summary_embedding = config.embedding_model_instance.embed(
-                            task_content
-                        )
+                        summary_embedding = await embed_text(task_content)
 
                     chunks = await create_document_chunks(task_content)
 
@@ -359,6 +370,7 @@ async def index_clickup_tasks(
                         logger.info(
                             f"Committing batch: {documents_indexed} ClickUp tasks processed so far"
                         )
+                        await increment_index_version(session, search_space_id)
                         await session.commit()
 
                 except Exception as e:
@@ -375,6 +387,8 @@ async def index_clickup_tasks(
 
         # Final commit for any remaining documents not yet committed in batches
         logger.info(f"Final commit: Total {documents_indexed} ClickUp tasks processed")
+        if documents_indexed > 0:
+            await increment_index_version(session, search_space_id)
         await session.commit()
 
         await task_logger.log_task_success(
@@ -7,9 +7,9 @@ from datetime import datetime
 from sqlalchemy.exc import SQLAlchemyError
 from sqlalchemy.ext.asyncio import AsyncSession
 
-from app.config import config
 from app.connectors.confluence_connector import ConfluenceConnector
 from app.db import Document, DocumentType, SearchSourceConnectorType
+from app.services.embedding_service import embed_text
 from app.services.llm_service import get_user_long_context_llm
 from app.services.task_logging_service import TaskLoggingService
 from app.utils.document_converters import (
@@ -20,8 +20,9 @@ from app.utils.document_converters import (
 )
 
 from .base import (
+    IndexingPipeline,
+    PipelineItem,
     calculate_date_range,
-    check_document_by_unique_identifier,
     get_connector_by_id,
     logger,
     update_connector_last_indexed,
@@ -169,222 +170,147 @@ async def index_confluence_pages(
             return 0, f"Error fetching Confluence pages: {e!s}"
 
         # Process and index each page
-        documents_indexed = 0
         skipped_pages = []
-        documents_skipped = 0
+        user_llm = await get_user_long_context_llm(session, user_id, search_space_id)
 
-        for page in pages:
-            try:
-                page_id = page.get("id")
-                page_title = page.get("title", "")
-                space_id = page.get("spaceId", "")
+        def transform_page(page: dict) -> PipelineItem | None:
+            page_id = page.get("id")
+            page_title = page.get("title", "")
+            space_id = page.get("spaceId", "")
 
-                if not page_id or not page_title:
-                    logger.warning(
-                        f"Skipping page with missing ID or title: {page_id or 'Unknown'}"
+            if not page_id or not page_title:
+                logger.warning(
+                    f"Skipping page with missing ID or title: {page_id or 'Unknown'}"
+                )
+                skipped_pages.append(f"{page_title or 'Unknown'} (missing data)")
+                return None
+
+            # Extract page content
+            page_content = ""
+            if page.get("body") and page["body"].get("storage"):
+                page_content = page["body"]["storage"].get("value", "")
+
+            # Add comments to content
+            comments = page.get("comments", [])
+            comments_content = ""
+            if comments:
+                comments_content = "\n\n## Comments\n\n"
+                for comment in comments:
+                    comment_body = ""
+                    if comment.get("body") and comment["body"].get("storage"):
+                        comment_body = comment["body"]["storage"].get("value", "")
+
+                    comment_author = comment.get("version", {}).get(
+                        "authorId", "Unknown"
                     )
-                    skipped_pages.append(f"{page_title or 'Unknown'} (missing data)")
-                    documents_skipped += 1
-                    continue
-
-                # Extract page content
-                page_content = ""
-                if page.get("body") and page["body"].get("storage"):
-                    page_content = page["body"]["storage"].get("value", "")
-
-                # Add comments to content
-                comments = page.get("comments", [])
-                comments_content = ""
-                if comments:
-                    comments_content = "\n\n## Comments\n\n"
-                    for comment in comments:
-                        comment_body = ""
-                        if comment.get("body") and comment["body"].get("storage"):
-                            comment_body = comment["body"]["storage"].get("value", "")
-
-                        comment_author = comment.get("version", {}).get(
-                            "authorId", "Unknown"
-                        )
-                        comment_date = comment.get("version", {}).get("createdAt", "")
+                    comment_date = comment.get("version", {}).get("createdAt", "")
 
-                        comments_content += f"**Comment by {comment_author}** ({comment_date}):\n{comment_body}\n\n"
+                    comments_content += f"**Comment by {comment_author}** ({comment_date}):\n{comment_body}\n\n"
 
-                # Combine page content with comments
-                full_content = f"# {page_title}\n\n{page_content}{comments_content}"
+            # Combine page content with comments
+            full_content = f"# {page_title}\n\n{page_content}{comments_content}"
 
-                if not full_content.strip():
-                    logger.warning(f"Skipping page with no content: {page_title}")
-                    skipped_pages.append(f"{page_title} (no content)")
-                    documents_skipped += 1
-                    continue
+            if not full_content.strip():
+                logger.warning(f"Skipping page with no content: {page_title}")
+                skipped_pages.append(f"{page_title} (no content)")
+                return None
 
-                # Generate unique identifier hash for this Confluence page
-                unique_identifier_hash = generate_unique_identifier_hash(
+            return PipelineItem(
+                label=f"Confluence page {page_title}",
+                unique_identifier_hash=generate_unique_identifier_hash(
                     DocumentType.CONFLUENCE_CONNECTOR, page_id, search_space_id
-                )
-
-                # Generate content hash
-                content_hash = generate_content_hash(full_content, search_space_id)
-
-                # Check if document with this unique identifier already exists
-                existing_document = await check_document_by_unique_identifier(
-                    session, unique_identifier_hash
-                )
-
-                comment_count = len(comments)
-
-                if existing_document:
-                    # Document exists - check if content has changed
-                    if existing_document.content_hash == content_hash:
-                        logger.info(
-                            f"Document for Confluence page {page_title} unchanged. Skipping."
-                        )
-                        documents_skipped += 1
-                        continue
-                    else:
-                        # Content has changed - update the existing document
-                        logger.info(
-                            f"Content changed for Confluence page {page_title}. Updating document."
-                        )
-
-                        # Generate summary with metadata
-                        user_llm = await get_user_long_context_llm(
-                            session, user_id, search_space_id
-                        )
-
-                        if user_llm:
-                            document_metadata = {
-                                "page_title": page_title,
-                                "page_id": page_id,
-                                "space_id": space_id,
-                                "comment_count": comment_count,
-                                "document_type": "Confluence Page",
-                                "connector_type": "Confluence",
-                            }
-                            (
-                                summary_content,
-                                summary_embedding,
-                            ) = await generate_document_summary(
-                                full_content, user_llm, document_metadata
-                            )
-                        else:
-                            summary_content = f"Confluence Page: {page_title}\n\nSpace ID: {space_id}\n\n"
-                            if page_content:
-                                content_preview = page_content[:1000]
-                                if len(page_content) > 1000:
-                                    content_preview += "..."
-                                summary_content += (
-                                    f"Content Preview: {content_preview}\n\n"
-                                )
-                            summary_content += f"Comments: {comment_count}"
-                            summary_embedding = config.embedding_model_instance.embed(
-                                summary_content
-                            )
-
-                        # Process chunks
-                        chunks = await create_document_chunks(full_content)
-
-                        # Update existing document
-                        existing_document.title = f"Confluence - {page_title}"
-                        existing_document.content = summary_content
-                        existing_document.content_hash = content_hash
-                        existing_document.embedding = summary_embedding
-                        existing_document.document_metadata = {
-                            "page_id": page_id,
-                            "page_title": page_title,
-                            "space_id": space_id,
-                            "comment_count": comment_count,
-                            "indexed_at": datetime.now().strftime("%Y-%m-%d %H:%M:%S"),
-                        }
-                        existing_document.chunks = chunks
-
-                        documents_indexed += 1
-                        logger.info(
-                            f"Successfully updated Confluence page {page_title}"
-                        )
-                        continue
+                ),
+                content_hash=generate_content_hash(full_content, search_space_id),
+                data={
+                    "page_id": page_id,
+                    "page_title": page_title,
+                    "space_id": space_id,
+                    "page_content": page_content,
+                    "full_content": full_content,
+                    "comment_count": len(comments),
+                },
+            )
 
-                # Document doesn't exist - create new one
-                # Generate summary with metadata
-                user_llm = await get_user_long_context_llm(
-                    session, user_id, search_space_id
+        async def process_page(item: PipelineItem) -> None:
+            page_title = item.data["page_title"]
+            space_id = item.data["space_id"]
+            page_content = item.data["page_content"]
+            comment_count = item.data["comment_count"]
+
+            # Generate summary with metadata
+            if user_llm:
+                document_metadata = {
+                    "page_title": page_title,
+                    "page_id": item.data["page_id"],
+                    "space_id": space_id,
+                    "comment_count": comment_count,
+                    "document_type": "Confluence Page",
+                    "connector_type": "Confluence",
+                }
+                (
+                    summary_content,
+                    summary_embedding,
+                ) = await generate_document_summary(
+                    item.data["full_content"], user_llm, document_metadata
                 )
-
-                if user_llm:
-                    document_metadata = {
-                        "page_title": page_title,
-                        "page_id": page_id,
-                        "space_id": space_id,
-                        "comment_count": comment_count,
-                        "document_type": "Confluence Page",
-                        "connector_type": "Confluence",
-                    }
-                    (
-                        summary_content,
-                        summary_embedding,
-                    ) = await generate_document_summary(
-                        full_content, user_llm, document_metadata
-                    )
-                else:
-                    # Fallback to simple summary if no LLM configured
-                    summary_content = (
-                        f"Confluence Page: {page_title}\n\nSpace ID: {space_id}\n\n"
-                    )
-                    if page_content:
-                        # Take first 500 characters of content for summary
-                        content_preview = page_content[:1000]
-                        if len(page_content) > 1000:
-                            content_preview += "..."
-                        summary_content += f"Content Preview: {content_preview}\n\n"
-                    summary_content += f"Comments: {comment_count}"
-                    summary_embedding = config.embedding_model_instance.embed(
-                        summary_content
-                    )
-
-                # Process chunks - using the full page content with comments
-                chunks = await create_document_chunks(full_content)
-
-                # Create and store new document
-                logger.info(f"Creating new document for page {page_title}")
-                document = Document(
-                    search_space_id=search_space_id,
-                    title=f"Confluence - {page_title}",
-                    document_type=DocumentType.CONFLUENCE_CONNECTOR,
-                    document_metadata={
-                        "page_id": page_id,
-                        "page_title": page_title,
-                        "space_id": space_id,
-                        "comment_count": comment_count,
-                        "indexed_at": datetime.now().strftime("%Y-%m-%d %H:%M:%S"),
-                    },
-                    content=summary_content,
-                    content_hash=content_hash,
-                    unique_identifier_hash=unique_identifier_hash,
-                    embedding=summary_embedding,
-                    chunks=chunks,
+            else:
+                # Fallback to simple summary if no LLM configured
+                summary_content = (
+                    f"Confluence Page: {page_title}\n\nSpace ID: {space_id}\n\n"
                 )
+                if page_content:
+                    # Take first 1000 characters of content for summary
+                    content_preview = page_content[:1000]
+                    if len(page_content) > 1000:
+                        content_preview += "..."
+                    summary_content += f"Content Preview: {content_preview}\n\n"
+                summary_content += f"Comments: {comment_count}"
+                summary_embedding = await embed_text(summary_content)
+
+            item.result["summary_content"] = summary_content
+            item.result["summary_embedding"] = summary_embedding
+            # Process chunks - using the full page content with comments
+            item.result["chunks"] = await create_document_chunks(
+                item.data["full_content"],
+                existing_chunks=(
+                    item.existing_document.chunks if item.existing_document else None
+                ),
+            )
 
-                session.add(document)
-                documents_indexed += 1
-                logger.info(f"Successfully indexed new page {page_title}")
-
-                # Batch commit every 10 documents
-                if documents_indexed % 10 == 0:
-                    logger.info(
-                        f"Committing batch: {documents_indexed} Confluence pages processed so far"
-                    )
-                    await session.commit()
-
-            except Exception as e:
-                logger.error(
-                    f"Error processing page {page.get('title', 'Unknown')}: {e!s}",
-                    exc_info=True,
-                )
-                skipped_pages.append(
-                    f"{page.get('title', 'Unknown')} (processing error)"
-                )
-                documents_skipped += 1
-                continue  # Skip this page and continue with others
+        def write_page(
+            item: PipelineItem, existing_document: Document | None
+        ) -> Document:
+            page_title = item.data["page_title"]
+            document = existing_document or Document(
+                search_space_id=search_space_id,
+                document_type=DocumentType.CONFLUENCE_CONNECTOR,
+                unique_identifier_hash=item.unique_identifier_hash,
+            )
+            document.title = f"Confluence - {page_title}"
+            document.content = item.result["summary_content"]
+            document.content_hash = item.content_hash
+            document.embedding = item.result["summary_embedding"]
+            document.document_metadata = {
+                "page_id": item.data["page_id"],
+                "page_title": page_title,
+                "space_id": item.data["space_id"],
+                "comment_count": item.data["comment_count"],
+                "indexed_at": datetime.now().strftime("%Y-%m-%d %H:%M:%S"),
+            }
+            document.chunks = item.result["chunks"]
+            return document
+
+        pipeline_stats = await IndexingPipeline(
+            session,
+            transform=transform_page,
+            process=process_page,
+            write=write_page,
+            label=lambda page: f"Confluence page {page.get('title', 'Unknown')}",
+        ).run(pages)
+
+        documents_indexed = pipeline_stats.documents_indexed
+        documents_skipped = pipeline_stats.documents_skipped
+        skipped_pages.extend(pipeline_stats.failed_items)
 
         # Update the last_indexed_at timestamp for the connector only if requested
         total_processed = documents_indexed
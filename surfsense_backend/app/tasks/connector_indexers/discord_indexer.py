@@ -9,21 +9,26 @@ from sqlalchemy.exc import SQLAlchemyError
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.connectors.discord_connector import DiscordConnector
-from app.db import Document, DocumentType, SearchSourceConnectorType
+from app.db import (
+    Document,
+    DocumentType,
+    SearchSourceConnectorType,
+    increment_index_version,
+)
 from app.services.llm_service import get_user_long_context_llm
 from app.services.task_logging_service import TaskLoggingService
 from app.utils.document_converters import (
     create_document_chunks,
     generate_content_hash,
     generate_document_summary,
-    generate_unique_identifier_hash,
 )
 
 from .base import (
     build_document_metadata_string,
-    check_document_by_unique_identifier,
     get_connector_by_id,
+    get_document_with_chunks,
     logger,
+    lookup_source_items,
     update_connector_last_indexed,
 )
 
@@ -228,7 +233,17 @@ async def index_discord_messages(
                         documents_skipped += 1
                         continue
 
-                    for channel in channels:
+                    # Look up all already indexed channels of the guild in one query
+                    source_items = await lookup_source_items(
+                        session,
+                        DocumentType.DISCORD_CONNECTOR,
+                        search_space_id,
+                        channels,
+                        lambda channel: channel["id"],
+                    )
+                    documents_skipped += source_items.repeated_count
+
+                    for channel, unique_identifier_hash in source_items.items:
                         channel_id = channel["id"]
                         channel_name = channel["name"]
 
@@ -309,19 +324,14 @@ async def index_discord_messages(
                             metadata_sections
                         )
 
-                        # Generate unique identifier hash for this Discord channel
-                        unique_identifier_hash = generate_unique_identifier_hash(
-                            DocumentType.DISCORD_CONNECTOR, channel_id, search_space_id
-                        )
-
                         # Generate content hash
                         content_hash = generate_content_hash(
                             combined_document_string, search_space_id
                         )
 
                         # Check if document with this unique identifier already exists
-                        existing_document = await check_document_by_unique_identifier(
-                            session, unique_identifier_hash
+                        existing_document = source_items.existing_documents.get(
+                            unique_identifier_hash
                         )
 
                         if existing_document:
@@ -337,6 +347,9 @@ async def index_discord_messages(
                                 logger.info(
                                     f"Content changed for Discord channel {guild_name}#{channel_name}. Updating document."
                                 )
+                                existing_document = await get_document_with_chunks(
+                                    session, existing_document.id
+                                )
 
                                 # Get user's long context LLM
                                 user_llm = await get_user_long_context_llm(
@@ -370,7 +383,10 @@ async def index_discord_messages(
                                 )
 
                                 # Chunks from channel content
-                                chunks = await create_document_chunks(channel_content)
+                                chunks = await create_document_chunks(
+                                    channel_content,
+                                    existing_chunks=existing_document.chunks,
+                                )
 
                                 # Update existing document
                                 existing_document.title = (
@@ -467,6 +483,7 @@ async def index_discord_messages(
                             logger.info(
                                 f"Committing batch: {documents_indexed} Discord channels processed so far"
                             )
+                            await increment_index_version(session, search_space_id)
                             await session.commit()
 
                 except Exception as e:
@@ -487,6 +504,8 @@ async def index_discord_messages(
         logger.info(
             f"Final commit: Total {documents_indexed} Discord channels processed"
         )
+        if documents_indexed > 0:
+            await increment_index_version(session, search_space_id)
         await session.commit()
 
         # Prepare result message
@@ -11,7 +11,12 @@ from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.future import select
 
 from app.connectors.elasticsearch_connector import ElasticsearchConnector
-from app.db import Document, DocumentType, SearchSourceConnector
+from app.db import (
+    Document,
+    DocumentType,
+    SearchSourceConnector,
+    increment_index_version,
+)
 from app.services.task_logging_service import TaskLoggingService
 from app.utils.document_converters import (
     create_document_chunks,
@@ -247,11 +252,14 @@ async def index_elasticsearch_documents(
                             existing_doc.content_hash = content_hash
                             existing_doc.document_metadata = metadata
                             existing_doc.unique_identifier_hash = unique_identifier_hash
-                            chunks = await create_document_chunks(content)
+                            chunks = await create_document_chunks(
+                                content, existing_chunks=existing_doc.chunks
+                            )
                             existing_doc.chunks = chunks
                             await session.flush()
                             documents_processed += 1
                             if documents_processed % 10 == 0:
+                                await increment_index_version(session, search_space_id)
                                 await session.commit()
                             continue
 
@@ -278,6 +286,7 @@ async def index_elasticsearch_documents(
                         logger.info(
                             f"Processed {documents_processed} Elasticsearch documents"
                         )
+                        await increment_index_version(session, search_space_id)
                         await session.commit()
 
                 except Exception as e:
@@ -295,6 +304,8 @@ async def index_elasticsearch_documents(
                     continue
 
             # Final commit
+            if documents_processed > 0:
+                await increment_index_version(session, search_space_id)
             await session.commit()
 
             await task_logger.log_task_success(
@@ -9,20 +9,26 @@ from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.config import config
 from app.connectors.github_connector import GitHubConnector
-from app.db import Document, DocumentType, SearchSourceConnectorType
+from app.db import (
+    Document,
+    DocumentType,
+    SearchSourceConnectorType,
+    increment_index_version,
+)
+from app.services.embedding_service import embed_text
 from app.services.llm_service import get_user_long_context_llm
 from app.services.task_logging_service import TaskLoggingService
 from app.utils.document_converters import (
     create_document_chunks,
     generate_content_hash,
     generate_document_summary,
-    generate_unique_identifier_hash,
 )
 
 from .base import (
-    check_document_by_unique_identifier,
     get_connector_by_id,
+    get_document_with_chunks,
     logger,
+    lookup_source_items,
 )
 
 
@@ -176,7 +182,16 @@ async def index_github_repos(
                     f"Found {len(files_to_index)} files to process in {repo_full_name}"
                 )
 
-                for file_info in files_to_index:
+                # Look up all already indexed files of the repository in one query
+                source_items = await lookup_source_items(
+                    session,
+                    DocumentType.GITHUB_CONNECTOR,
+                    search_space_id,
+                    files_to_index,
+                    lambda file_info: file_info.get("sha"),
+                )
+
+                for file_info, unique_identifier_hash in source_items.items:
                     file_path = file_info.get("path")
                     file_url = file_info.get("url")
                     file_sha = file_info.get("sha")
@@ -200,17 +215,12 @@ async def index_github_repos(
                         )
                         continue  # Skip if content fetch failed
 
-                    # Generate unique identifier hash for this GitHub file
-                    unique_identifier_hash = generate_unique_identifier_hash(
-                        DocumentType.GITHUB_CONNECTOR, file_sha, search_space_id
-                    )
-
                     # Generate content hash
                     content_hash = generate_content_hash(file_content, search_space_id)
 
                     # Check if document with this unique identifier already exists
-                    existing_document = await check_document_by_unique_identifier(
-                        session, unique_identifier_hash
+                    existing_document = source_items.existing_documents.get(
+                        unique_identifier_hash
                     )
 
                     if existing_document:
@@ -225,6 +235,9 @@ async def index_github_repos(
                             logger.info(
                                 f"Content changed for GitHub file {full_path_key}. Updating document."
                             )
+                            existing_document = await get_document_with_chunks(
+                                session, existing_document.id
+                            )
 
                             # Generate summary with metadata
                             user_llm = await get_user_long_context_llm(
@@ -251,22 +264,18 @@ async def index_github_repos(
                                 )
                             else:
                                 summary_content = f"GitHub file: {full_path_key}\n\n{file_content[:1000]}..."
-                                summary_embedding = (
-                                    config.embedding_model_instance.embed(
-                                        summary_content
-                                    )
-                                )
+                                summary_embedding = await embed_text(summary_content)
 
                             # Chunk the content
                             try:
-                                if hasattr(config, "code_chunker_instance"):
-                                    chunks_data = [
-                                        await create_document_chunks(file_content)
-                                    ][0]
-                                else:
-                                    chunks_data = await create_document_chunks(
-                                        file_content
-                                    )
+                                # Use code chunker if available, otherwise regular chunker
+                                chunks_data = await create_document_chunks(
+                                    file_content,
+                                    chunker=getattr(
+                                        config, "code_chunker_instance", None
+                                    ),
+                                    existing_chunks=existing_document.chunks,
+                                )
                             except Exception as chunk_err:
                                 logger.error(
                                     f"Failed to chunk file {full_path_key}: {chunk_err}"
@@ -322,29 +331,15 @@ async def index_github_repos(
                         summary_content = (
                             f"GitHub file: {full_path_key}\n\n{file_content[:1000]}..."
                         )
-                        summary_embedding = config.embedding_model_instance.embed(
-                            summary_content
-                        )
+                        summary_embedding = await embed_text(summary_content)
 
                     # Chunk the content
                     try:
-                        chunks_data = [await create_document_chunks(file_content)][0]
-
                         # Use code chunker if available, otherwise regular chunker
-                        if hasattr(config, "code_chunker_instance"):
-                            chunks_data = [
-                                {
-                                    "content": chunk.text,
-                                    "embedding": config.embedding_model_instance.embed(
-                                        chunk.text
-                                    ),
-                                }
-                                for chunk in config.code_chunker_instance.chunk(
-                                    file_content
-                                )
-                            ]
-                        else:
-                            chunks_data = await create_document_chunks(file_content)
+                        chunks_data = await create_document_chunks(
+                            file_content,
+                            chunker=getattr(config, "code_chunker_instance", None),
+                        )
 
                     except Exception as chunk_err:
                         logger.error(
@@ -386,6 +381,7 @@ async def index_github_repos(
                         logger.info(
                             f"Committing batch: {documents_processed} GitHub files processed so far"
                         )
+                        await increment_index_version(session, search_space_id)
                         await session.commit()
 
             except Exception as repo_err:
@@ -396,6 +392,8 @@ async def index_github_repos(
 
         # Final commit for any remaining documents not yet committed in batches
         logger.info(f"Final commit: Total {documents_processed} GitHub files processed")
+        if documents_processed > 0:
+            await increment_index_version(session, search_space_id)
         await session.commit()
         logger.info(
             f"Finished GitHub indexing for connector {connector_id}. Processed {documents_processed} files."
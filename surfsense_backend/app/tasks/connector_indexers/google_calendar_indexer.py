@@ -8,22 +8,27 @@ from google.oauth2.credentials import Credentials
 from sqlalchemy.exc import SQLAlchemyError
 from sqlalchemy.ext.asyncio import AsyncSession
 
-from app.config import config
 from app.connectors.google_calendar_connector import GoogleCalendarConnector
-from app.db import Document, DocumentType, SearchSourceConnectorType
+from app.db import (
+    Document,
+    DocumentType,
+    SearchSourceConnectorType,
+    increment_index_version,
+)
+from app.services.embedding_service import embed_text
 from app.services.llm_service import get_user_long_context_llm
 from app.services.task_logging_service import TaskLoggingService
 from app.utils.document_converters import (
     create_document_chunks,
     generate_content_hash,
     generate_document_summary,
-    generate_unique_identifier_hash,
 )
 
 from .base import (
-    check_document_by_unique_identifier,
     get_connector_by_id,
+    get_document_with_chunks,
     logger,
+    lookup_source_items,
     update_connector_last_indexed,
 )
 
@@ -224,7 +229,17 @@ async def index_google_calendar_events(
         documents_skipped = 0
         skipped_events = []
 
-        for event in events:
+        # Look up all already indexed events in one query
+        source_items = await lookup_source_items(
+            session,
+            DocumentType.GOOGLE_CALENDAR_CONNECTOR,
+            search_space_id,
+            events,
+            lambda event: event.get("id"),
+        )
+        documents_skipped += source_items.repeated_count
+
+        for event, unique_identifier_hash in source_items.items:
             try:
                 event_id = event.get("id")
                 event_summary = event.get("summary", "No Title")
@@ -250,17 +265,12 @@ async def index_google_calendar_events(
                 location = event.get("location", "")
                 description = event.get("description", "")
 
-                # Generate unique identifier hash for this Google Calendar event
-                unique_identifier_hash = generate_unique_identifier_hash(
-                    DocumentType.GOOGLE_CALENDAR_CONNECTOR, event_id, search_space_id
-                )
-
                 # Generate content hash
                 content_hash = generate_content_hash(event_markdown, search_space_id)
 
                 # Check if document with this unique identifier already exists
-                existing_document = await check_document_by_unique_identifier(
-                    session, unique_identifier_hash
+                existing_document = source_items.existing_documents.get(
+                    unique_identifier_hash
                 )
 
                 if existing_document:
@@ -276,6 +286,9 @@ async def index_google_calendar_events(
                         logger.info(
                             f"Content changed for Google Calendar event {event_summary}. Updating document."
                         )
+                        existing_document = await get_document_with_chunks(
+                            session, existing_document.id
+                        )
 
                         # Generate summary with metadata
                         user_llm = await get_user_long_context_llm(
@@ -313,12 +326,12 @@ async def index_google_calendar_events(
                                 if len(description) > 1000:
                                     desc_preview += "..."
                                 summary_content += f"Description: {desc_preview}\n"
-                            summary_embedding = config.embedding_model_instance.embed(
-                                summary_content
-                            )
+                            summary_embedding = await embed_text(summary_content)
 
                         # Process chunks
-                        chunks = await create_document_chunks(event_markdown)
+                        chunks = await create_document_chunks(
+                            event_markdown, existing_chunks=existing_document.chunks
+                        )
 
                         # Update existing document
                         existing_document.title = f"Calendar Event - {event_summary}"
@@ -378,9 +391,7 @@ async def index_google_calendar_events(
                         if len(description) > 1000:
                             desc_preview += "..."
                         summary_content += f"Description: {desc_preview}\n"
-                    summary_embedding = config.embedding_model_instance.embed(
-                        summary_content
-                    )
+                    summary_embedding = await embed_text(summary_content)
                 chunks = await create_document_chunks(event_markdown)
 
                 document = Document(
@@ -412,6 +423,7 @@ async def index_google_calendar_events(
                     logger.info(
                         f"Committing batch: {documents_indexed} Google Calendar events processed so far"
                     )
+                    await increment_index_version(session, search_space_id)
                     await session.commit()
 
             except Exception as e:
@@ -433,6 +445,8 @@ async def index_google_calendar_events(
         logger.info(
             f"Final commit: Total {documents_indexed} Google Calendar events processed"
         )
+        if documents_indexed > 0:
+            await increment_index_version(session, search_space_id)
         await session.commit()
 
         await task_logger.log_task_success(
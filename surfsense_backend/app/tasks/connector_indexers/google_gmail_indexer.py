@@ -8,26 +8,27 @@ from google.oauth2.credentials import Credentials
 from sqlalchemy.exc import SQLAlchemyError
 from sqlalchemy.ext.asyncio import AsyncSession
 
-from app.config import config
 from app.connectors.google_gmail_connector import GoogleGmailConnector
 from app.db import (
     Document,
     DocumentType,
     SearchSourceConnectorType,
+    increment_index_version,
 )
+from app.services.embedding_service import embed_text
 from app.services.llm_service import get_user_long_context_llm
 from app.services.task_logging_service import TaskLoggingService
 from app.utils.document_converters import (
     create_document_chunks,
     generate_content_hash,
     generate_document_summary,
-    generate_unique_identifier_hash,
 )
 
 from .base import (
-    check_document_by_unique_identifier,
     get_connector_by_id,
+    get_document_with_chunks,
     logger,
+    lookup_source_items,
     update_connector_last_indexed,
 )
 
@@ -149,7 +150,17 @@ async def index_google_gmail_messages(
         documents_indexed = 0
         skipped_messages = []
         documents_skipped = 0
-        for message in messages:
+        # Look up all already indexed messages in one query
+        source_items = await lookup_source_items(
+            session,
+            DocumentType.GOOGLE_GMAIL_CONNECTOR,
+            search_space_id,
+            messages,
+            lambda message: message.get("id", ""),
+        )
+        documents_skipped += source_items.repeated_count
+
+        for message, unique_identifier_hash in source_items.items:
             try:
                 # Extract message information
                 message_id = message.get("id", "")
@@ -188,17 +199,12 @@ async def index_google_gmail_messages(
                     documents_skipped += 1
                     continue
 
-                # Generate unique identifier hash for this Gmail message
-                unique_identifier_hash = generate_unique_identifier_hash(
-                    DocumentType.GOOGLE_GMAIL_CONNECTOR, message_id, search_space_id
-                )
-
                 # Generate content hash
                 content_hash = generate_content_hash(markdown_content, search_space_id)
 
                 # Check if document with this unique identifier already exists
-                existing_document = await check_document_by_unique_identifier(
-                    session, unique_identifier_hash
+                existing_document = source_items.existing_documents.get(
+                    unique_identifier_hash
                 )
 
                 if existing_document:
@@ -214,6 +220,9 @@ async def index_google_gmail_messages(
                         logger.info(
                             f"Content changed for Gmail message {subject}. Updating document."
                         )
+                        existing_document = await get_document_with_chunks(
+                            session, existing_document.id
+                        )
 
                         # Generate summary with metadata
                         user_llm = await get_user_long_context_llm(
@@ -240,12 +249,12 @@ async def index_google_gmail_messages(
                             summary_content = f"Google Gmail Message: {subject}\n\n"
                             summary_content += f"Sender: {sender}\n"
                             summary_content += f"Date: {date_str}\n"
-                            summary_embedding = config.embedding_model_instance.embed(
-                                summary_content
-                            )
+                            summary_embedding = await embed_text(summary_content)
 
                         # Process chunks
-                        chunks = await create_document_chunks(markdown_content)
+                        chunks = await create_document_chunks(
+                            markdown_content, existing_chunks=existing_document.chunks
+                        )
 
                         # Update existing document
                         existing_document.title = f"Gmail: {subject}"
@@ -293,9 +302,7 @@ async def index_google_gmail_messages(
                     summary_content = f"Google Gmail Message: {subject}\n\n"
                     summary_content += f"Sender: {sender}\n"
                     summary_content += f"Date: {date_str}\n"
-                    summary_embedding = config.embedding_model_instance.embed(
-                        summary_content
-                    )
+                    summary_embedding = await embed_text(summary_content)
 
                 # Process chunks
                 chunks = await create_document_chunks(markdown_content)
@@ -329,6 +336,7 @@ async def index_google_gmail_messages(
                     logger.info(
                         f"Committing batch: {documents_indexed} Gmail messages processed so far"
                     )
+                    await increment_index_version(session, search_space_id)
                     await session.commit()
 
             except Exception as e:
@@ -347,6 +355,8 @@ async def index_google_gmail_messages(
 
         # Final commit for any remaining documents not yet committed in batches
         logger.info(f"Final commit: Total {documents_indexed} Gmail messages processed")
+        if documents_indexed > 0:
+            await increment_index_version(session, search_space_id)
         await session.commit()
         logger.info(
             "Successfully committed all Google gmail document changes to database"
@@ -7,9 +7,9 @@ from datetime import datetime
 from sqlalchemy.exc import SQLAlchemyError
 from sqlalchemy.ext.asyncio import AsyncSession
 
-from app.config import config
 from app.connectors.jira_connector import JiraConnector
 from app.db import Document, DocumentType, SearchSourceConnectorType
+from app.services.embedding_service import embed_text
 from app.services.llm_service import get_user_long_context_llm
 from app.services.task_logging_service import TaskLoggingService
 from app.utils.document_converters import (
@@ -20,8 +20,9 @@ from app.utils.document_converters import (
 )
 
 from .base import (
+    IndexingPipeline,
+    PipelineItem,
     calculate_date_range,
-    check_document_by_unique_identifier,
     get_connector_by_id,
     logger,
     update_connector_last_indexed,
@@ -167,208 +168,129 @@ async def index_jira_issues(
             return 0, f"Error fetching Jira issues: {e!s}"
 
         # Process and index each issue
-        documents_indexed = 0
         skipped_issues = []
-        documents_skipped = 0
+        user_llm = await get_user_long_context_llm(session, user_id, search_space_id)
 
-        for issue in issues:
-            try:
-                issue_id = issue.get("key")
-                issue_identifier = issue.get("key", "")
-                issue_title = issue.get("id", "")
+        def transform_issue(issue: dict) -> PipelineItem | None:
+            issue_id = issue.get("key")
+            issue_identifier = issue.get("key", "")
+            issue_title = issue.get("id", "")
 
-                if not issue_id or not issue_title:
-                    logger.warning(
-                        f"Skipping issue with missing ID or title: {issue_id or 'Unknown'}"
-                    )
-                    skipped_issues.append(
-                        f"{issue_identifier or 'Unknown'} (missing data)"
-                    )
-                    documents_skipped += 1
-                    continue
-
-                # Format the issue for better readability
-                formatted_issue = jira_client.format_issue(issue)
-
-                # Convert to markdown
-                issue_content = jira_client.format_issue_to_markdown(formatted_issue)
-
-                if not issue_content:
-                    logger.warning(
-                        f"Skipping issue with no content: {issue_identifier} - {issue_title}"
-                    )
-                    skipped_issues.append(f"{issue_identifier} (no content)")
-                    documents_skipped += 1
-                    continue
-
-                # Generate unique identifier hash for this Jira issue
-                unique_identifier_hash = generate_unique_identifier_hash(
-                    DocumentType.JIRA_CONNECTOR, issue_id, search_space_id
+            if not issue_id or not issue_title:
+                logger.warning(
+                    f"Skipping issue with missing ID or title: {issue_id or 'Unknown'}"
                 )
+                skipped_issues.append(f"{issue_identifier or 'Unknown'} (missing data)")
+                return None
 
-                # Generate content hash
-                content_hash = generate_content_hash(issue_content, search_space_id)
-
-                # Check if document with this unique identifier already exists
-                existing_document = await check_document_by_unique_identifier(
-                    session, unique_identifier_hash
-                )
+            # Format the issue for better readability
+            formatted_issue = jira_client.format_issue(issue)
 
-                comment_count = len(formatted_issue.get("comments", []))
+            # Convert to markdown
+            issue_content = jira_client.format_issue_to_markdown(formatted_issue)
 
-                if existing_document:
-                    # Document exists - check if content has changed
-                    if existing_document.content_hash == content_hash:
-                        logger.info(
-                            f"Document for Jira issue {issue_identifier} unchanged. Skipping."
-                        )
-                        documents_skipped += 1
-                        continue
-                    else:
-                        # Content has changed - update the existing document
-                        logger.info(
-                            f"Content changed for Jira issue {issue_identifier}. Updating document."
-                        )
-
-                        # Generate summary with metadata
-                        user_llm = await get_user_long_context_llm(
-                            session, user_id, search_space_id
-                        )
-
-                        if user_llm:
-                            document_metadata = {
-                                "issue_key": issue_identifier,
-                                "issue_title": issue_title,
-                                "status": formatted_issue.get("status", "Unknown"),
-                                "priority": formatted_issue.get("priority", "Unknown"),
-                                "comment_count": comment_count,
-                                "document_type": "Jira Issue",
-                                "connector_type": "Jira",
-                            }
-                            (
-                                summary_content,
-                                summary_embedding,
-                            ) = await generate_document_summary(
-                                issue_content, user_llm, document_metadata
-                            )
-                        else:
-                            summary_content = f"Jira Issue {issue_identifier}: {issue_title}\n\nStatus: {formatted_issue.get('status', 'Unknown')}\n\n"
-                            if formatted_issue.get("description"):
-                                summary_content += f"Description: {formatted_issue.get('description')}\n\n"
-                            summary_content += f"Comments: {comment_count}"
-                            summary_embedding = config.embedding_model_instance.embed(
-                                summary_content
-                            )
-
-                        # Process chunks
-                        chunks = await create_document_chunks(issue_content)
-
-                        # Update existing document
-                        existing_document.title = (
-                            f"Jira - {issue_identifier}: {issue_title}"
-                        )
-                        existing_document.content = summary_content
-                        existing_document.content_hash = content_hash
-                        existing_document.embedding = summary_embedding
-                        existing_document.document_metadata = {
-                            "issue_id": issue_id,
-                            "issue_identifier": issue_identifier,
-                            "issue_title": issue_title,
-                            "state": formatted_issue.get("status", "Unknown"),
-                            "comment_count": comment_count,
-                            "indexed_at": datetime.now().strftime("%Y-%m-%d %H:%M:%S"),
-                        }
-                        existing_document.chunks = chunks
-
-                        documents_indexed += 1
-                        logger.info(
-                            f"Successfully updated Jira issue {issue_identifier}"
-                        )
-                        continue
-
-                # Document doesn't exist - create new one
-                # Generate summary with metadata
-                user_llm = await get_user_long_context_llm(
-                    session, user_id, search_space_id
+            if not issue_content:
+                logger.warning(
+                    f"Skipping issue with no content: {issue_identifier} - {issue_title}"
                 )
+                skipped_issues.append(f"{issue_identifier} (no content)")
+                return None
 
-                if user_llm:
-                    document_metadata = {
-                        "issue_key": issue_identifier,
-                        "issue_title": issue_title,
-                        "status": formatted_issue.get("status", "Unknown"),
-                        "priority": formatted_issue.get("priority", "Unknown"),
-                        "comment_count": comment_count,
-                        "document_type": "Jira Issue",
-                        "connector_type": "Jira",
-                    }
-                    (
-                        summary_content,
-                        summary_embedding,
-                    ) = await generate_document_summary(
-                        issue_content, user_llm, document_metadata
-                    )
-                else:
-                    # Fallback to simple summary if no LLM configured
-                    summary_content = f"Jira Issue {issue_identifier}: {issue_title}\n\nStatus: {formatted_issue.get('status', 'Unknown')}\n\n"
-                    if formatted_issue.get("description"):
-                        summary_content += (
-                            f"Description: {formatted_issue.get('description')}\n\n"
-                        )
-                    summary_content += f"Comments: {comment_count}"
-                    summary_embedding = config.embedding_model_instance.embed(
-                        summary_content
-                    )
-
-                # Process chunks - using the full issue content with comments
-                chunks = await create_document_chunks(issue_content)
-
-                # Create and store new document
-                logger.info(
-                    f"Creating new document for issue {issue_identifier} - {issue_title}"
-                )
-                document = Document(
-                    search_space_id=search_space_id,
-                    title=f"Jira - {issue_identifier}: {issue_title}",
-                    document_type=DocumentType.JIRA_CONNECTOR,
-                    document_metadata={
-                        "issue_id": issue_id,
-                        "issue_identifier": issue_identifier,
-                        "issue_title": issue_title,
-                        "state": formatted_issue.get("status", "Unknown"),
-                        "comment_count": comment_count,
-                        "indexed_at": datetime.now().strftime("%Y-%m-%d %H:%M:%S"),
-                    },
-                    content=summary_content,
-                    content_hash=content_hash,
-                    unique_identifier_hash=unique_identifier_hash,
-                    embedding=summary_embedding,
-                    chunks=chunks,
-                )
+            return PipelineItem(
+                label=f"Jira issue {issue_identifier}",
+                unique_identifier_hash=generate_unique_identifier_hash(
+                    DocumentType.JIRA_CONNECTOR, issue_id, search_space_id
+                ),
+                content_hash=generate_content_hash(issue_content, search_space_id),
+                data={
+                    "issue_id": issue_id,
+                    "issue_identifier": issue_identifier,
+                    "issue_title": issue_title,
+                    "formatted_issue": formatted_issue,
+                    "issue_content": issue_content,
+                    "comment_count": len(formatted_issue.get("comments", [])),
+                },
+            )
 
-                session.add(document)
-                documents_indexed += 1
-                logger.info(
-                    f"Successfully indexed new issue {issue_identifier} - {issue_title}"
+        async def process_issue(item: PipelineItem) -> None:
+            issue_identifier = item.data["issue_identifier"]
+            issue_title = item.data["issue_title"]
+            formatted_issue = item.data["formatted_issue"]
+            comment_count = item.data["comment_count"]
+
+            # Generate summary with metadata
+            if user_llm:
+                document_metadata = {
+                    "issue_key": issue_identifier,
+                    "issue_title": issue_title,
+                    "status": formatted_issue.get("status", "Unknown"),
+                    "priority": formatted_issue.get("priority", "Unknown"),
+                    "comment_count": comment_count,
+                    "document_type": "Jira Issue",
+                    "connector_type": "Jira",
+                }
+                (
+                    summary_content,
+                    summary_embedding,
+                ) = await generate_document_summary(
+                    item.data["issue_content"], user_llm, document_metadata
                 )
-
-                # Batch commit every 10 documents
-                if documents_indexed % 10 == 0:
-                    logger.info(
-                        f"Committing batch: {documents_indexed} Jira issues processed so far"
+            else:
+                # Fallback to simple summary if no LLM configured
+                summary_content = f"Jira Issue {issue_identifier}: {issue_title}\n\nStatus: {formatted_issue.get('status', 'Unknown')}\n\n"
+                if formatted_issue.get("description"):
+                    summary_content += (
+                        f"Description: {formatted_issue.get('description')}\n\n"
                     )
-                    await session.commit()
+                summary_content += f"Comments: {comment_count}"
+                summary_embedding = await embed_text(summary_content)
+
+            item.result["summary_content"] = summary_content
+            item.result["summary_embedding"] = summary_embedding
+            # Process chunks - using the full issue content with comments
+            item.result["chunks"] = await create_document_chunks(
+                item.data["issue_content"],
+                existing_chunks=(
+                    item.existing_document.chunks if item.existing_document else None
+                ),
+            )
 
-            except Exception as e:
-                logger.error(
-                    f"Error processing issue {issue.get('identifier', 'Unknown')}: {e!s}",
-                    exc_info=True,
-                )
-                skipped_issues.append(
-                    f"{issue.get('identifier', 'Unknown')} (processing error)"
-                )
-                documents_skipped += 1
-                continue  # Skip this issue and continue with others
+        def write_issue(
+            item: PipelineItem, existing_document: Document | None
+        ) -> Document:
+            issue_identifier = item.data["issue_identifier"]
+            issue_title = item.data["issue_title"]
+            document = existing_document or Document(
+                search_space_id=search_space_id,
+                document_type=DocumentType.JIRA_CONNECTOR,
+                unique_identifier_hash=item.unique_identifier_hash,
+            )
+            document.title = f"Jira - {issue_identifier}: {issue_title}"
+            document.content = item.result["summary_content"]
+            document.content_hash = item.content_hash
+            document.embedding = item.result["summary_embedding"]
+            document.document_metadata = {
+                "issue_id": item.data["issue_id"],
+                "issue_identifier": issue_identifier,
+                "issue_title": issue_title,
+                "state": item.data["formatted_issue"].get("status", "Unknown"),
+                "comment_count": item.data["comment_count"],
+                "indexed_at": datetime.now().strftime("%Y-%m-%d %H:%M:%S"),
+            }
+            document.chunks = item.result["chunks"]
+            return document
+
+        pipeline_stats = await IndexingPipeline(
+            session,
+            transform=transform_issue,
+            process=process_issue,
+            write=write_issue,
+            label=lambda issue: f"Jira issue {issue.get('key', 'Unknown')}",
+        ).run(issues)
+
+        documents_indexed = pipeline_stats.documents_indexed
+        documents_skipped = pipeline_stats.documents_skipped
+        skipped_issues.extend(pipeline_stats.failed_items)
 
         # Update the last_indexed_at timestamp for the connector only if requested
         total_processed = documents_indexed
@@ -7,23 +7,28 @@ from datetime import datetime
 from sqlalchemy.exc import SQLAlchemyError
 from sqlalchemy.ext.asyncio import AsyncSession
 
-from app.config import config
 from app.connectors.linear_connector import LinearConnector
-from app.db import Document, DocumentType, SearchSourceConnectorType
+from app.db import (
+    Document,
+    DocumentType,
+    SearchSourceConnectorType,
+    increment_index_version,
+)
+from app.services.embedding_service import embed_text
 from app.services.llm_service import get_user_long_context_llm
 from app.services.task_logging_service import TaskLoggingService
 from app.utils.document_converters import (
     create_document_chunks,
     generate_content_hash,
     generate_document_summary,
-    generate_unique_identifier_hash,
 )
 
 from .base import (
     calculate_date_range,
-    check_document_by_unique_identifier,
     get_connector_by_id,
+    get_document_with_chunks,
     logger,
+    lookup_source_items,
     update_connector_last_indexed,
 )
 
@@ -184,7 +189,17 @@ async def index_linear_issues(
         )
 
         # Process each issue
-        for issue in issues:
+        # Look up all already indexed issues in one query
+        source_items = await lookup_source_items(
+            session,
+            DocumentType.LINEAR_CONNECTOR,
+            search_space_id,
+            issues,
+            lambda issue: issue.get("id", ""),
+        )
+        documents_skipped += source_items.repeated_count
+
+        for issue, unique_identifier_hash in source_items.items:
             try:
                 issue_id = issue.get("id", "")
                 issue_identifier = issue.get("identifier", "")
@@ -214,17 +229,12 @@ async def index_linear_issues(
                     documents_skipped += 1
                     continue
 
-                # Generate unique identifier hash for this Linear issue
-                unique_identifier_hash = generate_unique_identifier_hash(
-                    DocumentType.LINEAR_CONNECTOR, issue_id, search_space_id
-                )
-
                 # Generate content hash
                 content_hash = generate_content_hash(issue_content, search_space_id)
 
                 # Check if document with this unique identifier already exists
-                existing_document = await check_document_by_unique_identifier(
-                    session, unique_identifier_hash
+                existing_document = source_items.existing_documents.get(
+                    unique_identifier_hash
                 )
 
                 state = formatted_issue.get("state", "Unknown")
@@ -244,6 +254,9 @@ async def index_linear_issues(
                         logger.info(
                             f"Content changed for Linear issue {issue_identifier}. Updating document."
                         )
+                        existing_document = await get_document_with_chunks(
+                            session, existing_document.id
+                        )
 
                         # Generate summary with metadata
                         user_llm = await get_user_long_context_llm(
@@ -274,12 +287,12 @@ async def index_linear_issues(
                             if description:
                                 summary_content += f"Description: {description}\n\n"
                             summary_content += f"Comments: {comment_count}"
-                            summary_embedding = config.embedding_model_instance.embed(
-                                summary_content
-                            )
+                            summary_embedding = await embed_text(summary_content)
 
                         # Process chunks
-                        chunks = await create_document_chunks(issue_content)
+                        chunks = await create_document_chunks(
+                            issue_content, existing_chunks=existing_document.chunks
+                        )
 
                         # Update existing document
                         existing_document.title = (
@@ -335,9 +348,7 @@ async def index_linear_issues(
                     if description:
                         summary_content += f"Description: {description}\n\n"
                     summary_content += f"Comments: {comment_count}"
-                    summary_embedding = config.embedding_model_instance.embed(
-                        summary_content
-                    )
+                    summary_embedding = await embed_text(summary_content)
 
                 # Process chunks - using the full issue content with comments
                 chunks = await create_document_chunks(issue_content)
@@ -376,6 +387,7 @@ async def index_linear_issues(
                     logger.info(
                         f"Committing batch: {documents_indexed} Linear issues processed so far"
                     )
+                    await increment_index_version(session, search_space_id)
                     await session.commit()
 
             except Exception as e:
@@ -396,6 +408,8 @@ async def index_linear_issues(
 
         # Final commit for any remaining documents not yet committed in batches
         logger.info(f"Final commit: Total {documents_indexed} Linear issues processed")
+        if documents_indexed > 0:
+            await increment_index_version(session, search_space_id)
         await session.commit()
         logger.info("Successfully committed all Linear document changes to database")
 
@@ -8,21 +8,26 @@ from sqlalchemy.exc import SQLAlchemyError
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.connectors.notion_history import NotionHistoryConnector
-from app.db import Document, DocumentType, SearchSourceConnectorType
+from app.db import (
+    Document,
+    DocumentType,
+    SearchSourceConnectorType,
+    increment_index_version,
+)
 from app.services.llm_service import get_user_long_context_llm
 from app.services.task_logging_service import TaskLoggingService
 from app.utils.document_converters import (
     create_document_chunks,
     generate_content_hash,
     generate_document_summary,
-    generate_unique_identifier_hash,
 )
 
 from .base import (
     build_document_metadata_string,
-    check_document_by_unique_identifier,
     get_connector_by_id,
+    get_document_with_chunks,
     logger,
+    lookup_source_items,
     update_connector_last_indexed,
 )
 
@@ -196,7 +201,17 @@ async def index_notion_pages(
         )
 
         # Process each page
-        for page in pages:
+        # Look up all already indexed pages in one query
+        source_items = await lookup_source_items(
+            session,
+            DocumentType.NOTION_CONNECTOR,
+            search_space_id,
+            pages,
+            lambda page: page.get("page_id"),
+        )
+        documents_skipped += source_items.repeated_count
+
+        for page, unique_identifier_hash in source_items.items:
             try:
                 page_id = page.get("page_id")
                 page_title = page.get("title", f"Untitled page ({page_id})")
@@ -284,19 +299,14 @@ async def index_notion_pages(
                     metadata_sections
                 )
 
-                # Generate unique identifier hash for this Notion page
-                unique_identifier_hash = generate_unique_identifier_hash(
-                    DocumentType.NOTION_CONNECTOR, page_id, search_space_id
-                )
-
                 # Generate content hash
                 content_hash = generate_content_hash(
                     combined_document_string, search_space_id
                 )
 
                 # Check if document with this unique identifier already exists
-                existing_document = await check_document_by_unique_identifier(
-                    session, unique_identifier_hash
+                existing_document = source_items.existing_documents.get(
+                    unique_identifier_hash
                 )
 
                 if existing_document:
@@ -312,6 +322,9 @@ async def index_notion_pages(
                         logger.info(
                             f"Content changed for Notion page {page_title}. Updating document."
                         )
+                        existing_document = await get_document_with_chunks(
+                            session, existing_document.id
+                        )
 
                         # Get user's long context LLM
                         user_llm = await get_user_long_context_llm(
@@ -340,7 +353,9 @@ async def index_notion_pages(
                         )
 
                         # Process chunks
-                        chunks = await create_document_chunks(markdown_content)
+                        chunks = await create_document_chunks(
+                            markdown_content, existing_chunks=existing_document.chunks
+                        )
 
                         # Update existing document
                         existing_document.title = f"Notion - {page_title}"
@@ -362,6 +377,7 @@ async def index_notion_pages(
                             logger.info(
                                 f"Committing batch: {documents_indexed} documents processed so far"
                             )
+                            await increment_index_version(session, search_space_id)
                             await session.commit()
 
                         continue
@@ -419,6 +435,7 @@ async def index_notion_pages(
                     logger.info(
                         f"Committing batch: {documents_indexed} documents processed so far"
                     )
+                    await increment_index_version(session, search_space_id)
                     await session.commit()
 
             except Exception as e:
@@ -440,6 +457,8 @@ async def index_notion_pages(
 
         # Final commit for any remaining documents not yet committed in batches
         logger.info(f"Final commit: Total {documents_indexed} documents processed")
+        if documents_indexed > 0:
+            await increment_index_version(session, search_space_id)
         await session.commit()
 
         # Prepare result message
@@ -8,22 +8,27 @@ from slack_sdk.errors import SlackApiError
 from sqlalchemy.exc import SQLAlchemyError
 from sqlalchemy.ext.asyncio import AsyncSession
 
-from app.config import config
 from app.connectors.slack_history import SlackHistory
-from app.db import Document, DocumentType, SearchSourceConnectorType
+from app.db import (
+    Document,
+    DocumentType,
+    SearchSourceConnectorType,
+    increment_index_version,
+)
+from app.services.embedding_service import embed_text
 from app.services.task_logging_service import TaskLoggingService
 from app.utils.document_converters import (
     create_document_chunks,
     generate_content_hash,
-    generate_unique_identifier_hash,
 )
 
 from .base import (
     build_document_metadata_markdown,
     calculate_date_range,
-    check_document_by_unique_identifier,
     get_connector_by_id,
+    get_document_with_chunks,
     logger,
+    lookup_source_items,
     update_connector_last_indexed,
 )
 
@@ -234,7 +239,19 @@ async def index_slack_messages(
                     documents_skipped += 1
                     continue  # Skip if no valid messages after filtering
 
-                for msg in formatted_messages:
+                # Look up all already indexed messages of the channel in one query
+                source_items = await lookup_source_items(
+                    session,
+                    DocumentType.SLACK_CONNECTOR,
+                    search_space_id,
+                    formatted_messages,
+                    lambda msg, channel_id=channel_id: (
+                        f"{channel_id}_{msg.get('ts', msg.get('datetime', 'Unknown Time'))}"
+                    ),
+                )
+                documents_skipped += source_items.repeated_count
+
+                for msg, unique_identifier_hash in source_items.items:
                     timestamp = msg.get("datetime", "Unknown Time")
                     msg_ts = msg.get("ts", timestamp)  # Get original Slack timestamp
                     msg_user_name = msg.get("user_name", "Unknown User")
@@ -264,20 +281,14 @@ async def index_slack_messages(
                         metadata_sections
                     )
 
-                    # Generate unique identifier hash for this Slack message
-                    unique_identifier = f"{channel_id}_{msg_ts}"
-                    unique_identifier_hash = generate_unique_identifier_hash(
-                        DocumentType.SLACK_CONNECTOR, unique_identifier, search_space_id
-                    )
-
                     # Generate content hash
                     content_hash = generate_content_hash(
                         combined_document_string, search_space_id
                     )
 
                     # Check if document with this unique identifier already exists
-                    existing_document = await check_document_by_unique_identifier(
-                        session, unique_identifier_hash
+                    existing_document = source_items.existing_documents.get(
+                        unique_identifier_hash
                     )
 
                     if existing_document:
@@ -293,14 +304,16 @@ async def index_slack_messages(
                             logger.info(
                                 f"Content changed for Slack message {msg_ts} in channel {channel_name}. Updating document."
                             )
+                            existing_document = await get_document_with_chunks(
+                                session, existing_document.id
+                            )
 
                             # Update chunks and embedding
                             chunks = await create_document_chunks(
-                                combined_document_string
-                            )
-                            doc_embedding = config.embedding_model_instance.embed(
-                                combined_document_string
+                                combined_document_string,
+                                existing_chunks=existing_document.chunks,
                             )
+                            doc_embedding = await embed_text(combined_document_string)
 
                             # Update existing document
                             existing_document.content = combined_document_string
@@ -327,9 +340,7 @@ async def index_slack_messages(
                     # Document doesn't exist - create new one
                     # Process chunks
                     chunks = await create_document_chunks(combined_document_string)
-                    doc_embedding = config.embedding_model_instance.embed(
-                        combined_document_string
-                    )
+                    doc_embedding = await embed_text(combined_document_string)
 
                     # Create and store new document
                     document = Document(
@@ -359,6 +370,7 @@ async def index_slack_messages(
                         logger.info(
                             f"Committing batch: {documents_indexed} Slack channels processed so far"
                         )
+                        await increment_index_version(session, search_space_id)
                         await session.commit()
 
                 logger.info(
@@ -386,6 +398,8 @@ async def index_slack_messages(
 
         # Final commit for any remaining documents not yet committed in batches
         logger.info(f"Final commit: Total {documents_indexed} Slack channels processed")
+        if documents_indexed > 0:
+            await increment_index_version(session, search_space_id)
         await session.commit()
 
         # Prepare result message
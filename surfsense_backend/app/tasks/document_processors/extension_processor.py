@@ -7,7 +7,7 @@ import logging
 from sqlalchemy.exc import SQLAlchemyError
 from sqlalchemy.ext.asyncio import AsyncSession
 
-from app.db import Document, DocumentType
+from app.db import Document, DocumentType, increment_index_version
 from app.schemas import ExtensionDocumentContent
 from app.services.llm_service import get_user_long_context_llm
 from app.services.task_logging_service import TaskLoggingService
@@ -143,7 +143,10 @@ async def add_extension_received_document(
         )
 
         # Process chunks
-        chunks = await create_document_chunks(content.pageContent)
+        chunks = await create_document_chunks(
+            content.pageContent,
+            existing_chunks=existing_document.chunks if existing_document else None,
+        )
 
         # Update or create document
         if existing_document:
@@ -155,6 +158,7 @@ async def add_extension_received_document(
             existing_document.document_metadata = content.metadata.model_dump()
             existing_document.chunks = chunks
 
+            await increment_index_version(session, search_space_id)
             await session.commit()
             await session.refresh(existing_document)
             document = existing_document
@@ -173,6 +177,7 @@ async def add_extension_received_document(
             )
 
             session.add(document)
+            await increment_index_version(session, search_space_id)
             await session.commit()
             await session.refresh(document)
 
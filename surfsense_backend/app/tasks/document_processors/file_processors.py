@@ -14,7 +14,8 @@ from sqlalchemy.exc import SQLAlchemyError
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.config import config as app_config
-from app.db import Document, DocumentType, Log
+from app.db import Document, DocumentType, Log, increment_index_version
+from app.services.embedding_service import embed_text
 from app.services.llm_service import get_user_long_context_llm
 from app.services.task_logging_service import TaskLoggingService
 from app.utils.document_converters import (
@@ -98,7 +99,10 @@ async def add_received_file_document_using_unstructured(
         )
 
         # Process chunks
-        chunks = await create_document_chunks(file_in_markdown)
+        chunks = await create_document_chunks(
+            file_in_markdown,
+            existing_chunks=existing_document.chunks if existing_document else None,
+        )
 
         # Update or create document
         if existing_document:
@@ -113,6 +117,7 @@ async def add_received_file_document_using_unstructured(
             }
             existing_document.chunks = chunks
 
+            await increment_index_version(session, search_space_id)
             await session.commit()
             await session.refresh(existing_document)
             document = existing_document
@@ -134,6 +139,7 @@ async def add_received_file_document_using_unstructured(
             )
 
             session.add(document)
+            await increment_index_version(session, search_space_id)
             await session.commit()
             await session.refresh(document)
 
@@ -212,7 +218,10 @@ async def add_received_file_document_using_llamacloud(
         )
 
         # Process chunks
-        chunks = await create_document_chunks(file_in_markdown)
+        chunks = await create_document_chunks(
+            file_in_markdown,
+            existing_chunks=existing_document.chunks if existing_document else None,
+        )
 
         # Update or create document
         if existing_document:
@@ -227,6 +236,7 @@ async def add_received_file_document_using_llamacloud(
             }
             existing_document.chunks = chunks
 
+            await increment_index_version(session, search_space_id)
             await session.commit()
             await session.refresh(existing_document)
             document = existing_document
@@ -248,6 +258,7 @@ async def add_received_file_document_using_llamacloud(
             )
 
             session.add(document)
+            await increment_index_version(session, search_space_id)
             await session.commit()
             await session.refresh(document)
 
@@ -344,14 +355,13 @@ async def add_received_file_document_using_docling(
             f"{metadata_section}\n\n# DOCUMENT SUMMARY\n\n{summary_content}"
         )
 
-        from app.config import config
-
-        summary_embedding = config.embedding_model_instance.embed(
-            enhanced_summary_content
-        )
+        summary_embedding = await embed_text(enhanced_summary_content)
 
         # Process chunks
-        chunks = await create_document_chunks(file_in_markdown)
+        chunks = await create_document_chunks(
+            file_in_markdown,
+            existing_chunks=existing_document.chunks if existing_document else None,
+        )
 
         # Update or create document
         if existing_document:
@@ -366,6 +376,7 @@ async def add_received_file_document_using_docling(
             }
             existing_document.chunks = chunks
 
+            await increment_index_version(session, search_space_id)
             await session.commit()
             await session.refresh(existing_document)
             document = existing_document
@@ -387,6 +398,7 @@ async def add_received_file_document_using_docling(
             )
 
         session.add(document)
+        await increment_index_version(session, search_space_id)
         await session.commit()
         await session.refresh(document)
 
@@ -7,7 +7,7 @@ import logging
 from sqlalchemy.exc import SQLAlchemyError
 from sqlalchemy.ext.asyncio import AsyncSession
 
-from app.db import Document, DocumentType
+from app.db import Document, DocumentType, increment_index_version
 from app.services.llm_service import get_user_long_context_llm
 from app.services.task_logging_service import TaskLoggingService
 from app.utils.document_converters import (
@@ -108,7 +108,10 @@ async def add_received_markdown_file_document(
         )
 
         # Process chunks
-        chunks = await create_document_chunks(file_in_markdown)
+        chunks = await create_document_chunks(
+            file_in_markdown,
+            existing_chunks=existing_document.chunks if existing_document else None,
+        )
 
         # Update or create document
         if existing_document:
@@ -122,6 +125,7 @@ async def add_received_markdown_file_document(
             }
             existing_document.chunks = chunks
 
+            await increment_index_version(session, search_space_id)
             await session.commit()
             await session.refresh(existing_document)
             document = existing_document
@@ -142,6 +146,7 @@ async def add_received_markdown_file_document(
             )
 
             session.add(document)
+            await increment_index_version(session, search_space_id)
             await session.commit()
             await session.refresh(document)
 
@@ -12,7 +12,7 @@ from sqlalchemy.exc import SQLAlchemyError
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.config import config
-from app.db import Document, DocumentType
+from app.db import Document, DocumentType, increment_index_version
 from app.services.llm_service import get_user_long_context_llm
 from app.services.task_logging_service import TaskLoggingService
 from app.utils.document_converters import (
@@ -248,7 +248,10 @@ async def add_crawled_url_document(
             {"stage": "chunk_processing"},
         )
 
-        chunks = await create_document_chunks(content_in_markdown)
+        chunks = await create_document_chunks(
+            content_in_markdown,
+            existing_chunks=existing_document.chunks if existing_document else None,
+        )
 
         # Update or create document
         if existing_document:
@@ -292,6 +295,7 @@ async def add_crawled_url_document(
             )
 
             session.add(document)
+        await increment_index_version(session, search_space_id)
         await session.commit()
         await session.refresh(document)
 
@@ -10,7 +10,7 @@ from sqlalchemy.exc import SQLAlchemyError
 from sqlalchemy.ext.asyncio import AsyncSession
 from youtube_transcript_api import YouTubeTranscriptApi
 
-from app.db import Document, DocumentType
+from app.db import Document, DocumentType, increment_index_version
 from app.services.llm_service import get_user_long_context_llm
 from app.services.task_logging_service import TaskLoggingService
 from app.utils.document_converters import (
@@ -291,7 +291,10 @@ async def add_youtube_video_document(
             {"stage": "chunk_processing"},
         )
 
-        chunks = await create_document_chunks(combined_document_string)
+        chunks = await create_document_chunks(
+            combined_document_string,
+            existing_chunks=existing_document.chunks if existing_document else None,
+        )
 
         # Update or create document
         if existing_document:
@@ -315,6 +318,7 @@ async def add_youtube_video_document(
             }
             existing_document.chunks = chunks
 
+            await increment_index_version(session, search_space_id)
             await session.commit()
             await session.refresh(existing_document)
             document = existing_document
@@ -345,6 +349,7 @@ async def add_youtube_video_document(
             )
 
             session.add(document)
+            await increment_index_version(session, search_space_id)
             await session.commit()
             await session.refresh(document)
 
@@ -62,22 +62,29 @@ async def stream_connector_search_results(
     }
     # print(f"Researcher configuration: {config['configurable']}")  # Debug print
     # Initialize state with database session and streaming service
+    background_tasks = []
     initial_state = State(
         db_session=session,
         streaming_service=streaming_service,
         chat_history=langchain_chat_history,
+        background_tasks=background_tasks,
     )
 
     # Run the graph directly
     print("\nRunning the complete researcher workflow...")
 
-    # Use streaming with config parameter
-    async for chunk in researcher_graph.astream(
-        initial_state,
-        config=config,
-        stream_mode="custom",
-    ):
-        if isinstance(chunk, dict) and "yield_value" in chunk:
-            yield chunk["yield_value"]
+    try:
+        # Use streaming with config parameter
+        async for chunk in researcher_graph.astream(
+            initial_state,
+            config=config,
+            stream_mode="custom",
+        ):
+            if isinstance(chunk, dict) and "yield_value" in chunk:
+                yield chunk["yield_value"]
 
-    yield streaming_service.format_completion()
+        yield streaming_service.format_completion()
+    finally:
+        # Stop background work (e.g. further questions) if the client disconnected
+        for task in background_tasks:
+            task.cancel()
@@ -0,0 +1,153 @@
+"""
+Bulk insert path for new documents and their chunks.
+
+Adding documents to the session one at a time makes the ORM flush emit their
+rows and every chunk row with large vector parameters. The writer below inserts
+a batch of new documents with one multi-row INSERT ... RETURNING id, then
+streams all their chunks with COPY (asyncpg) or multi-row INSERTs, so large
+initial syncs are bound by write throughput instead of round trips.
+"""
+
+import csv
+import io
+import logging
+from datetime import UTC, datetime
+
+from sqlalchemy import insert
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.config import config
+from app.db import Chunk, Document, increment_index_version
+
+logger = logging.getLogger(__name__)
+
+DOCUMENT_COLUMNS = [
+    "title",
+    "document_type",
+    "document_metadata",
+    "content",
+    "content_hash",
+    "unique_identifier_hash",
+    "embedding",
+    "search_space_id",
+]
+CHUNK_COLUMNS = [
+    "content",
+    "content_hash",
+    "position",
+    "embedding",
+    "document_id",
+    "search_space_id",
+    "document_type",
+    "created_at",
+]
+
+
+def _vector_literal(embedding) -> str | None:
+    if embedding is None:
+        return None
+    return "[" + ",".join(repr(float(value)) for value in embedding) + "]"
+
+
+async def _copy_chunk_rows(session: AsyncSession, rows: list[dict]) -> bool:
+    """
+    Stream chunk rows with COPY ... FROM STDIN (CSV) on the session connection.
+
+    Returns:
+        bool: False if the driver does not support COPY (rows not written)
+    """
+    created_at = datetime.now(UTC).isoformat()
+    connection = await session.connection()
+    raw_connection = await connection.get_raw_connection()
+    driver_connection = getattr(raw_connection, "driver_connection", None)
+    if not hasattr(driver_connection, "copy_to_table"):
+        return False
+
+    buffer = io.StringIO()
+    # QUOTE_NOTNULL writes None unquoted, which COPY reads as NULL
+    writer = csv.writer(buffer, quoting=csv.QUOTE_NOTNULL)
+    for row in rows:
+        writer.writerow(
+            [
+                row["content"],
+                row["content_hash"],
+                row["position"],
+                _vector_literal(row["embedding"]),
+                row["document_id"],
+                row["search_space_id"],
+                row["document_type"].name,
+                created_at,
+            ]
+        )
+
+    await driver_connection.copy_to_table(
+        Chunk.__tablename__,
+        source=io.BytesIO(buffer.getvalue().encode("utf-8")),
+        columns=CHUNK_COLUMNS,
+        format="csv",
+    )
+    return True
+
+
+async def bulk_insert_documents(
+    session: AsyncSession, documents: list[Document]
+) -> list[int]:
+    """
+    Insert new (transient) documents and their chunks in bulk.
+
+    The documents are not added to the session; their rows are written in the
+    session's transaction, which the caller commits right after. The index
+    versions of their search spaces are incremented.
+
+    Args:
+        session: Database session
+        documents: New Document objects with their chunks set
+
+    Returns:
+        List of the inserted document IDs, in the same order as documents
+    """
+    if not documents:
+        return []
+
+    document_table = Document.__table__
+    result = await session.execute(
+        insert(document_table).returning(
+            document_table.c.id, sort_by_parameter_order=True
+        ),
+        [
+            {column: getattr(document, column) for column in DOCUMENT_COLUMNS}
+            for document in documents
+        ],
+    )
+    document_ids = list(result.scalars().all())
+
+    chunk_rows = [
+        {
+            "content": chunk.content,
+            "content_hash": chunk.content_hash,
+            "position": chunk.position,
+            "embedding": chunk.embedding,
+            "document_id": document_id,
+            "search_space_id": document.search_space_id,
+            "document_type": document.document_type,
+        }
+        for document, document_id in zip(documents, document_ids, strict=True)
+        for chunk in document.chunks
+    ]
+
+    if chunk_rows:
+        copied = config.BULK_INSERT_USE_COPY and await _copy_chunk_rows(
+            session, chunk_rows
+        )
+        if not copied:
+            # Multi-row INSERT ... VALUES batches through executemany
+            await session.execute(insert(Chunk.__table__), chunk_rows)
+
+    await increment_index_version(
+        session, *(document.search_space_id for document in documents)
+    )
+
+    logger.info(
+        f"Bulk inserted {len(document_ids)} documents with {len(chunk_rows)} chunks"
+    )
+    return document_ids
@@ -0,0 +1,353 @@
+"""
+Optional hash partitioning of the chunks table by search space.
+
+By default every search space shares one chunks table and one HNSW index. On
+large installations this tool converts chunks into a table hash-partitioned on
+search_space_id, where each partition has its own (smaller) vector and GIN index.
+The chunk retriever always filters on Chunk.search_space_id, so Postgres prunes
+the search down to a single partition.
+
+The documents table stays unpartitioned: its content_hash and
+unique_identifier_hash unique constraints are global, and a partitioned table
+can only enforce uniqueness on columns that include the partition key.
+
+Usage:
+    python -m app.utils.chunk_partitioning status
+    python -m app.utils.chunk_partitioning partition --partitions 16
+    python -m app.utils.chunk_partitioning partition --partitions 16 --drop-old
+
+Rows are copied in batches while the application keeps running; a trigger on
+chunks records the IDs of rows written or deleted meanwhile. Only the final
+swap locks the chunks table, re-syncs the recorded rows and copies the new ones.
+Unless --drop-old is passed, the previous table is
+kept as chunks_unpartitioned so the change can be rolled back by renaming.
+"""
+
+import argparse
+import asyncio
+
+from sqlalchemy import text
+
+from app.utils.vector_indexes import vector_index_definition
+
+NEW_TABLE = "chunks_partitioned"
+OLD_TABLE = "chunks_unpartitioned"
+CHANGES_TABLE = "chunks_partition_changes"
+CHANGES_TRIGGER = "chunks_partition_track_changes"
+
+# Canonical index names of the chunks table and their definitions
+PARTITIONED_INDEXES = [
+    ("ix_chunks_id", "(id)"),
+    ("ix_chunks_created_at", "(created_at)"),
+    ("ix_chunks_search_space_id_document_type", "(search_space_id, document_type)"),
+    ("chucks_vector_index", vector_index_definition()),
+    ("chucks_search_vector_index", "USING gin (search_vector)"),
+]
+
+
+async def is_chunks_partitioned(conn) -> bool:
+    """
+    Check whether the chunks table is already partitioned.
+
+    Args:
+        conn: An async SQLAlchemy connection
+
+    Returns:
+        bool: True if chunks is a partitioned table
+    """
+    result = await conn.execute(
+        text(
+            "SELECT 1 FROM pg_partitioned_table pt "
+            "JOIN pg_class c ON c.oid = pt.partrelid "
+            "WHERE c.relname = 'chunks' AND c.relnamespace = 'public'::regnamespace"
+        )
+    )
+    return result.scalar() is not None
+
+
+async def _insertable_columns(conn, table: str) -> list[str]:
+    """Get the columns of a table that can be inserted (skips generated columns)."""
+    result = await conn.execute(
+        text(
+            "SELECT column_name FROM information_schema.columns "
+            "WHERE table_schema = 'public' AND table_name = :table "
+            "AND is_generated = 'NEVER' ORDER BY ordinal_position"
+        ),
+        {"table": table},
+    )
+    return [row[0] for row in result.all()]
+
+
+async def _copy_rows(conn, columns: list[str], after_id: int, upper_id: int) -> None:
+    """Copy chunks with after_id < id <= upper_id into the partitioned table."""
+    column_list = ", ".join(columns)
+    await conn.execute(
+        text(
+            f"INSERT INTO {NEW_TABLE} ({column_list}) "
+            f"SELECT {column_list} FROM chunks "
+            "WHERE id > :after_id AND id <= :upper_id"
+        ),
+        {"after_id": after_id, "upper_id": upper_id},
+    )
+
+
+async def create_partitioned_table(conn, partitions: int) -> None:
+    """
+    Create the hash-partitioned copy of chunks with its partitions and indexes.
+
+    Args:
+        conn: An async SQLAlchemy connection
+        partitions: Number of hash partitions
+    """
+    await conn.execute(
+        text(
+            f"CREATE TABLE {NEW_TABLE} "
+            "(LIKE chunks INCLUDING DEFAULTS INCLUDING GENERATED) "
+            "PARTITION BY HASH (search_space_id)"
+        )
+    )
+    # The partition key must be part of the primary key
+    await conn.execute(
+        text(
+            f"ALTER TABLE {NEW_TABLE} ADD CONSTRAINT {NEW_TABLE}_pkey "
+            "PRIMARY KEY (id, search_space_id)"
+        )
+    )
+    # Foreign keys are checked row by row while copying, so the swap stays short
+    await conn.execute(
+        text(
+            f"ALTER TABLE {NEW_TABLE} ADD CONSTRAINT {NEW_TABLE}_document_id_fkey "
+            "FOREIGN KEY (document_id) REFERENCES documents(id) ON DELETE CASCADE"
+        )
+    )
+    await conn.execute(
+        text(
+            f"ALTER TABLE {NEW_TABLE} ADD CONSTRAINT {NEW_TABLE}_search_space_id_fkey "
+            "FOREIGN KEY (search_space_id) REFERENCES searchspaces(id) "
+            "ON DELETE CASCADE"
+        )
+    )
+    for remainder in range(partitions):
+        await conn.execute(
+            text(
+                f"CREATE TABLE chunks_p{remainder} PARTITION OF {NEW_TABLE} "
+                f"FOR VALUES WITH (MODULUS {partitions}, REMAINDER {remainder})"
+            )
+        )
+    # Indexes created on the parent are created on every partition
+    for index_name, definition in PARTITIONED_INDEXES:
+        await conn.execute(
+            text(f"CREATE INDEX {index_name}_partitioned ON {NEW_TABLE} {definition}")
+        )
+
+
+async def track_changes(conn) -> None:
+    """
+    Record the IDs of chunks inserted, updated or deleted while they are being
+    copied.
+
+    IDs are handed out before their transaction commits, so a chunk can commit
+    with an ID inside a range that was already copied; recording inserts too
+    makes the swap pick those up.
+
+    Args:
+        conn: An async SQLAlchemy connection
+    """
+    await conn.execute(text(f"CREATE TABLE {CHANGES_TABLE} (id INTEGER NOT NULL)"))
+    await conn.execute(
+        text(
+            f"CREATE FUNCTION {CHANGES_TRIGGER}() RETURNS trigger AS $$ "
+            f"BEGIN INSERT INTO {CHANGES_TABLE} (id) "
+            "VALUES (COALESCE(NEW.id, OLD.id)); RETURN NULL; END; $$ LANGUAGE plpgsql"
+        )
+    )
+    await conn.execute(
+        text(
+            f"CREATE TRIGGER {CHANGES_TRIGGER} "
+            "AFTER INSERT OR UPDATE OR DELETE ON chunks FOR EACH ROW "
+            f"EXECUTE FUNCTION {CHANGES_TRIGGER}()"
+        )
+    )
+
+
+async def drop_change_tracking(conn) -> None:
+    """Remove the change tracking trigger, its function and the recorded IDs."""
+    await conn.execute(text(f"DROP TRIGGER IF EXISTS {CHANGES_TRIGGER} ON chunks"))
+    await conn.execute(text(f"DROP FUNCTION IF EXISTS {CHANGES_TRIGGER}()"))
+    await conn.execute(text(f"DROP TABLE IF EXISTS {CHANGES_TABLE}"))
+
+
+async def swap_tables(conn, columns: list[str], last_copied_id: int) -> None:
+    """
+    Copy the remaining rows and swap the partitioned table in place of chunks.
+
+    Must run in a single transaction; the chunks table is locked until commit.
+
+    Args:
+        conn: An async SQLAlchemy connection inside a transaction
+        columns: Insertable chunk columns
+        last_copied_id: Highest chunk ID already copied
+    """
+    await conn.execute(text("LOCK TABLE chunks IN ACCESS EXCLUSIVE MODE"))
+
+    # Re-sync the chunks of the copied ID range inserted late, updated (e.g.
+    # reused chunks getting a new position) or deleted while copying, then copy
+    # the chunks inserted since
+    column_list = ", ".join(columns)
+    await conn.execute(
+        text(
+            f"DELETE FROM {NEW_TABLE} p USING (SELECT DISTINCT id FROM "
+            f"{CHANGES_TABLE}) c WHERE p.id = c.id"
+        )
+    )
+    await conn.execute(
+        text(
+            f"INSERT INTO {NEW_TABLE} ({column_list}) "
+            f"SELECT {column_list} FROM chunks "
+            f"WHERE id IN (SELECT id FROM {CHANGES_TABLE}) AND id <= :last_copied_id"
+        ),
+        {"last_copied_id": last_copied_id},
+    )
+    await drop_change_tracking(conn)
+
+    max_id = (
+        await conn.execute(text("SELECT COALESCE(MAX(id), 0) FROM chunks"))
+    ).scalar()
+    await _copy_rows(conn, columns, last_copied_id, max_id)
+
+    # Move the canonical names over to the partitioned table
+    old_indexes = await conn.execute(
+        text("SELECT indexname FROM pg_indexes WHERE tablename = 'chunks'")
+    )
+    for (index_name,) in old_indexes.all():
+        await conn.execute(
+            text(f'ALTER INDEX "{index_name}" RENAME TO "{OLD_TABLE}_{index_name}"')
+        )
+    await conn.execute(text(f"ALTER TABLE chunks RENAME TO {OLD_TABLE}"))
+    await conn.execute(text(f"ALTER TABLE {NEW_TABLE} RENAME TO chunks"))
+    await conn.execute(text(f"ALTER INDEX {NEW_TABLE}_pkey RENAME TO chunks_pkey"))
+    for index_name, _ in PARTITIONED_INDEXES:
+        await conn.execute(
+            text(f"ALTER INDEX {index_name}_partitioned RENAME TO {index_name}")
+        )
+
+    # The ID sequence must outlive the old table
+    await conn.execute(text("ALTER SEQUENCE chunks_id_seq OWNED BY chunks.id"))
+
+
+async def partition_chunks(
+    partitions: int, batch_size: int = 10000, drop_old: bool = False
+) -> None:
+    """
+    Convert the chunks table into a table hash-partitioned by search_space_id.
+
+    Args:
+        partitions: Number of hash partitions
+        batch_size: Number of chunk IDs copied per transaction
+        drop_old: Drop the previous unpartitioned table after the swap
+    """
+    from app.db import engine
+
+    async with engine.begin() as conn:
+        if await is_chunks_partitioned(conn):
+            print("The chunks table is already partitioned.")
+            return
+        await conn.execute(text(f"DROP TABLE IF EXISTS {NEW_TABLE}"))
+        await drop_change_tracking(conn)
+        await create_partitioned_table(conn, partitions)
+        # Tracking starts before max_id is read, so no change can be missed
+        await track_changes(conn)
+        columns = await _insertable_columns(conn, "chunks")
+        max_id = (
+            await conn.execute(text("SELECT COALESCE(MAX(id), 0) FROM chunks"))
+        ).scalar()
+
+    print(f"Created {partitions} partitions, copying chunks up to ID {max_id}...")
+
+    try:
+        # Copy existing rows in batches without blocking the application
+        last_copied_id = 0
+        while last_copied_id < max_id:
+            upper_id = min(last_copied_id + batch_size, max_id)
+            async with engine.begin() as conn:
+                await _copy_rows(conn, columns, last_copied_id, upper_id)
+            last_copied_id = upper_id
+            print(f"Copied chunks up to ID {last_copied_id}/{max_id}")
+
+        async with engine.begin() as conn:
+            await swap_tables(conn, columns, last_copied_id)
+    except BaseException:
+        # Do not leave the trigger slowing down every chunk write
+        async with engine.begin() as conn:
+            await drop_change_tracking(conn)
+            await conn.execute(text(f"DROP TABLE IF EXISTS {NEW_TABLE}"))
+        raise
+
+    if drop_old:
+        async with engine.begin() as conn:
+            await conn.execute(text(f"DROP TABLE {OLD_TABLE}"))
+
+    print("The chunks table is now partitioned by search space.")
+
+
+async def print_status() -> None:
+    """Print whether chunks is partitioned and the row count of each partition."""
+    from app.db import engine
+
+    async with engine.connect() as conn:
+        if not await is_chunks_partitioned(conn):
+            print("The chunks table is not partitioned.")
+            return
+
+        result = await conn.execute(
+            text(
+                "SELECT c.relname, c.reltuples::bigint FROM pg_inherits i "
+                "JOIN pg_class c ON c.oid = i.inhrelid "
+                "WHERE i.inhparent = 'chunks'::regclass ORDER BY c.relname"
+            )
+        )
+        partitions = result.all()
+        print(f"The chunks table has {len(partitions)} partitions:")
+        for name, estimated_rows in partitions:
+            print(f"  {name}: ~{max(estimated_rows, 0)} rows")
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(
+        description="Partition the chunks table by search space"
+    )
+    subparsers = parser.add_subparsers(dest="command", required=True)
+
+    subparsers.add_parser("status", help="Show the partitioning status")
+
+    partition_parser = subparsers.add_parser(
+        "partition", help="Convert chunks into a hash-partitioned table"
+    )
+    partition_parser.add_argument(
+        "--partitions", type=int, default=16, help="Number of hash partitions"
+    )
+    partition_parser.add_argument(
+        "--batch-size", type=int, default=10000, help="Chunk IDs copied per batch"
+    )
+    partition_parser.add_argument(
+        "--drop-old",
+        action="store_true",
+        help="Drop the previous unpartitioned table after the swap",
+    )
+
+    args = parser.parse_args()
+
+    if args.command == "status":
+        asyncio.run(print_status())
+    else:
+        asyncio.run(
+            partition_chunks(
+                partitions=args.partitions,
+                batch_size=args.batch_size,
+                drop_old=args.drop_old,
+            )
+        )
+
+
+if __name__ == "__main__":
+    main()
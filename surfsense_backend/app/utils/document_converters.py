@@ -1,10 +1,12 @@
 import hashlib
 
-from litellm import get_model_info, token_counter
+from litellm import get_model_info
 
 from app.config import config
 from app.db import Chunk, DocumentType
 from app.prompts import SUMMARY_PROMPT_TEMPLATE
+from app.services.embedding_service import embed_documents, embed_text
+from app.utils.tokenization import count_message_tokens_batch, truncate_to_token_limit
 
 
 def get_model_context_window(model_name: str) -> int:
@@ -24,7 +26,10 @@ def optimize_content_for_context_window(
     content: str, document_metadata: dict | None, model_name: str
 ) -> str:
     """
-    Optimize content length to fit within model context window using binary search.
+    Optimize content length to fit within model context window.
+
+    The content is tokenized once and cut at the token budget left after the
+    reserved prompt, metadata and output tokens.
 
     Args:
         content: Original document content
@@ -50,10 +55,7 @@ def optimize_content_for_context_window(
         metadata_text = (
             f"<DOCUMENT_METADATA>\n\n{document_metadata}\n\n</DOCUMENT_METADATA>"
         )
-        metadata_tokens = token_counter(
-            messages=[{"role": "user", "content": metadata_text}], model=model_name
-        )
-        reserved_tokens += metadata_tokens
+        reserved_tokens += count_message_tokens_batch([metadata_text], model_name)[0]
 
     available_tokens = context_window - reserved_tokens
 
@@ -61,33 +63,20 @@ def optimize_content_for_context_window(
         print(f"Warning: Very limited tokens available for content: {available_tokens}")
         return content[:500]  # Fallback to first 500 chars
 
-    # Binary search to find optimal content length
-    left, right = 0, len(content)
-    optimal_length = 0
-
-    while left <= right:
-        mid = (left + right) // 2
-        test_content = content[:mid]
-
-        # Test token count for this content length
-        test_document = f"<DOCUMENT_CONTENT>\n\n{test_content}\n\n</DOCUMENT_CONTENT>"
-        test_tokens = token_counter(
-            messages=[{"role": "user", "content": test_document}], model=model_name
-        )
-
-        if test_tokens <= available_tokens:
-            optimal_length = mid
-            left = mid + 1
-        else:
-            right = mid - 1
+    # Tokens used by the content wrapper and message overhead
+    wrapper_tokens = count_message_tokens_batch(
+        ["<DOCUMENT_CONTENT>\n\n\n\n</DOCUMENT_CONTENT>"], model_name
+    )[0]
 
-    optimized_content = (
-        content[:optimal_length] if optimal_length > 0 else content[:500]
+    optimized_content = truncate_to_token_limit(
+        content, available_tokens - wrapper_tokens, model_name
     )
+    if not optimized_content:
+        optimized_content = content[:500]
 
-    if optimal_length < len(content):
+    if len(optimized_content) < len(content):
         print(
-            f"Content optimized: {len(content)} -> {optimal_length} chars "
+            f"Content optimized: {len(content)} -> {len(optimized_content)} chars "
             f"to fit in {available_tokens} available tokens"
         )
 
@@ -140,28 +129,73 @@ async def generate_document_summary(
     else:
         enhanced_summary_content = summary_content
 
-    summary_embedding = config.embedding_model_instance.embed(enhanced_summary_content)
+    summary_embedding = await embed_text(enhanced_summary_content)
 
     return enhanced_summary_content, summary_embedding
 
 
-async def create_document_chunks(content: str) -> list[Chunk]:
+def generate_chunk_hash(content: str) -> str:
+    """Generate SHA-256 hash of a chunk's content (matches the migration backfill)."""
+    return hashlib.sha256(content.encode("utf-8")).hexdigest()
+
+
+async def create_document_chunks(
+    content: str, chunker=None, existing_chunks: list[Chunk] | None = None
+) -> list[Chunk]:
     """
     Create chunks from document content.
 
+    All chunk texts are embedded together through batched `embed_batch` calls
+    instead of one model or API call per chunk. When the document is updated,
+    pass its current chunks: chunks whose content hash is unchanged are kept
+    (with their rows and embeddings) and only new or modified chunks are
+    embedded, so re-syncing an edited document costs the size of the edit.
+
     Args:
         content: Document content to chunk
+        chunker: Optional chunker to use instead of the default text chunker
+            (e.g. config.code_chunker_instance for source files)
+        existing_chunks: Current chunks of the document being updated (must be
+            loaded); the ones not reused are deleted when the returned list is
+            assigned to document.chunks
 
     Returns:
-        List of Chunk objects with embeddings
+        List of Chunk objects with embeddings, in document order
     """
-    return [
-        Chunk(
-            content=chunk.text,
-            embedding=config.embedding_model_instance.embed(chunk.text),
+    chunker = chunker or config.chunker_instance
+    chunk_texts = [chunk.text for chunk in chunker.chunk(content)]
+    chunk_hashes = [generate_chunk_hash(chunk_text) for chunk_text in chunk_texts]
+
+    reusable_chunks: dict[str, list[Chunk]] = {}
+    for existing_chunk in existing_chunks or []:
+        existing_hash = existing_chunk.content_hash or generate_chunk_hash(
+            existing_chunk.content
         )
-        for chunk in config.chunker_instance.chunk(content)
-    ]
+        reusable_chunks.setdefault(existing_hash, []).append(existing_chunk)
+
+    chunks: list[Chunk | None] = []
+    missing: list[int] = []
+    for position, chunk_hash in enumerate(chunk_hashes):
+        matches = reusable_chunks.get(chunk_hash)
+        if matches:
+            chunk = matches.pop(0)
+            chunk.content_hash = chunk_hash
+            chunk.position = position
+            chunks.append(chunk)
+        else:
+            chunks.append(None)
+            missing.append(position)
+
+    chunk_embeddings = await embed_documents([chunk_texts[i] for i in missing])
+    for position, chunk_embedding in zip(missing, chunk_embeddings, strict=True):
+        chunks[position] = Chunk(
+            content=chunk_texts[position],
+            content_hash=chunk_hashes[position],
+            position=position,
+            embedding=chunk_embedding,
+        )
+
+    return chunks
 
 
 async def convert_element_to_markdown(element) -> str:
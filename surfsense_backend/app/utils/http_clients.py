@@ -0,0 +1,75 @@
+"""
+Shared async HTTP clients for outbound API calls (web search providers).
+
+Creating an httpx.AsyncClient per request pays a new TCP/TLS handshake every
+time. The clients below are shared per event loop, keep connections alive, use
+HTTP/2 (httpx[http2]) and limit how many requests run at once per provider so a
+slow provider cannot take every connection.
+"""
+
+import asyncio
+import importlib.util
+import logging
+from contextlib import asynccontextmanager
+
+import httpx
+
+from app.config import config
+from app.utils.per_loop import PerLoop
+
+logger = logging.getLogger(__name__)
+
+HTTP2_AVAILABLE = importlib.util.find_spec("h2") is not None
+if not HTTP2_AVAILABLE:
+    logger.warning(
+        "The h2 package is not installed (install httpx[http2]); "
+        "web search clients fall back to HTTP/1.1"
+    )
+
+
+def _create_http_client(verify: bool) -> httpx.AsyncClient:
+    return httpx.AsyncClient(
+        http2=HTTP2_AVAILABLE,
+        verify=verify,
+        timeout=config.HTTP_CLIENT_TIMEOUT,
+        limits=httpx.Limits(
+            max_connections=config.HTTP_CLIENT_MAX_CONNECTIONS,
+            max_keepalive_connections=config.HTTP_CLIENT_MAX_KEEPALIVE,
+        ),
+    )
+
+
+# One client per (event loop, verify) pair and one semaphore per (event loop,
+# provider) pair
+_clients: PerLoop[httpx.AsyncClient] = PerLoop(
+    _create_http_client, close=lambda client: client.aclose()
+)
+_semaphores: PerLoop[asyncio.Semaphore] = PerLoop(
+    lambda _provider: asyncio.Semaphore(max(1, config.WEB_SEARCH_PROVIDER_CONCURRENCY))
+)
+
+
+def get_http_client(verify: bool = True) -> httpx.AsyncClient:
+    """
+    Get the shared HTTP client of the running event loop, creating it if needed.
+
+    Args:
+        verify: Whether TLS certificates are verified (self-hosted services such
+            as SearxNG may use self-signed certificates)
+
+    Returns:
+        httpx.AsyncClient: The pooled client; do not close it
+    """
+    return _clients.get(verify)
+
+
+@asynccontextmanager
+async def provider_limit(provider: str):
+    """
+    Limit the concurrent requests sent to a provider.
+
+    Args:
+        provider: The provider name (e.g. "TAVILY_API")
+    """
+    async with _semaphores.get(provider):
+        yield
@@ -0,0 +1,110 @@
+"""
+Thread-safe in-memory LRU cache with an optional TTL.
+
+The process-local caches (query embeddings, token counts, rerank scores, chat
+answers, LLM instances, web search responses, document embeddings) are built on
+it. They are shared by the event loop and the embedding, reranker and
+tokenization worker threads, hence the lock.
+"""
+
+import threading
+import time
+from collections import OrderedDict
+from collections.abc import Callable, Hashable
+
+
+class LRUCache[K: Hashable, V]:
+    """Thread-safe LRU cache whose entries optionally expire after ttl seconds."""
+
+    def __init__(self, max_size: int, ttl: float = 0):
+        """
+        Initialize the cache
+
+        Args:
+            max_size: Maximum number of entries kept before evicting the least
+                recently used one (0 disables the cache)
+            ttl: Seconds an entry stays valid (0 = no expiry)
+        """
+        self.max_size = max_size
+        self.ttl = ttl
+        # Values are stored with the monotonic time they were put
+        self._entries: OrderedDict[K, tuple[float, V]] = OrderedDict()
+        self._lock = threading.Lock()
+
+    def _is_expired(self, stored_at: float) -> bool:
+        return self.ttl > 0 and time.monotonic() - stored_at > self.ttl
+
+    def get(self, key: K) -> V | None:
+        """
+        Get a cached value, marking it as recently used.
+
+        Args:
+            key: The cache key
+
+        Returns:
+            The cached value or None if missing or expired
+        """
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return None
+            stored_at, value = entry
+            if self._is_expired(stored_at):
+                del self._entries[key]
+                return None
+            self._entries.move_to_end(key)
+            return value
+
+    def put(self, key: K, value: V) -> None:
+        """
+        Store a value, evicting the least recently used entries if needed.
+
+        Args:
+            key: The cache key
+            value: The value to cache
+        """
+        if self.max_size <= 0:
+            return
+
+        with self._lock:
+            self._entries[key] = (time.monotonic(), value)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_size:
+                self._entries.popitem(last=False)
+
+    def items(self) -> list[tuple[K, V]]:
+        """Get a snapshot of the unexpired entries, least recently used first."""
+        with self._lock:
+            return [
+                (key, value)
+                for key, (stored_at, value) in self._entries.items()
+                if not self._is_expired(stored_at)
+            ]
+
+    def discard_where(self, predicate: Callable[[K, V], bool]) -> int:
+        """
+        Remove the entries matching a predicate, and the expired ones.
+
+        Args:
+            predicate: Called with the key and value of every entry
+
+        Returns:
+            int: Number of removed entries
+        """
+        with self._lock:
+            stale_keys = [
+                key
+                for key, (stored_at, value) in self._entries.items()
+                if self._is_expired(stored_at) or predicate(key, value)
+            ]
+            for key in stale_keys:
+                del self._entries[key]
+            return len(stale_keys)
+
+    def clear(self) -> None:
+        """Remove every entry."""
+        with self._lock:
+            self._entries.clear()
+
+    def __len__(self) -> int:
+        return len(self._entries)
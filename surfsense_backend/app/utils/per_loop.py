@@ -0,0 +1,84 @@
+"""
+Objects bound to an event loop (HTTP and Redis clients, engines, semaphores...).
+
+The API server runs a single event loop, while Celery tasks create a fresh loop
+for every task run, so such objects cannot be plain module-level singletons.
+A PerLoop registry creates one object per running loop (and optional key) on
+first use. close_loop_objects() closes the objects of the running loop and must
+be awaited before the loop is closed; objects of loops closed without it are
+only forgotten.
+"""
+
+import asyncio
+import logging
+import weakref
+from collections.abc import Awaitable, Callable, Hashable
+from typing import Any
+
+logger = logging.getLogger(__name__)
+
+_registries: "weakref.WeakSet[PerLoop]" = weakref.WeakSet()
+
+
+class PerLoop[T]:
+    """One object per (running event loop, key), created by a factory."""
+
+    def __init__(
+        self,
+        factory: Callable[..., T],
+        close: Callable[[T], Awaitable[Any]] | None = None,
+    ):
+        """
+        Initialize the registry
+
+        Args:
+            factory: Creates the object of a loop, called with the key arguments
+                passed to get()
+            close: Coroutine function closing an object before its loop closes
+        """
+        self.factory = factory
+        self.close = close
+        self._objects: dict[tuple[asyncio.AbstractEventLoop, tuple], T] = {}
+        _registries.add(self)
+
+    def get(self, *key: Hashable) -> T:
+        """
+        Get the object of the running event loop, creating it if needed.
+
+        Args:
+            *key: Extra key arguments, passed to the factory
+
+        Returns:
+            The object bound to the running loop and key
+        """
+        loop = asyncio.get_running_loop()
+        obj = self._objects.get((loop, key))
+        if obj is None:
+            for closed_key in [
+                existing_key
+                for existing_key in self._objects
+                if existing_key[0].is_closed()
+            ]:
+                del self._objects[closed_key]
+
+            obj = self.factory(*key)
+            self._objects[(loop, key)] = obj
+        return obj
+
+    async def close_loop(self) -> None:
+        """Close and forget the objects of the running event loop."""
+        loop = asyncio.get_running_loop()
+        for object_key in [key for key in self._objects if key[0] is loop]:
+            obj = self._objects.pop(object_key)
+            if self.close is None:
+                continue
+            try:
+                await self.close(obj)
+            except Exception as e:
+                logger.warning(f"Failed to close {obj!r}: {e!s}")
+
+
+async def close_loop_objects() -> None:
+    """Close the objects of every PerLoop registry bound to the running loop."""
+    for registry in list(_registries):
+        await registry.close_loop()
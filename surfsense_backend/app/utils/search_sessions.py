@@ -0,0 +1,34 @@
+"""
+Database sessions for research connector searches.
+
+Every chat turn searches its connectors concurrently, each on its own session.
+The sessions below are limited process-wide (per event loop) to
+CONNECTOR_SEARCH_CONCURRENCY, which is kept below the engine pool size, so
+concurrent chats queue for a search slot instead of exhausting the pool.
+"""
+
+import asyncio
+from collections.abc import AsyncIterator
+from contextlib import asynccontextmanager
+
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.config import config
+from app.db import async_session_maker
+from app.utils.per_loop import PerLoop
+
+_semaphores: PerLoop[asyncio.Semaphore] = PerLoop(
+    lambda: asyncio.Semaphore(max(1, config.CONNECTOR_SEARCH_CONCURRENCY))
+)
+
+
+@asynccontextmanager
+async def search_session() -> AsyncIterator[AsyncSession]:
+    """
+    Open a database session for a connector search, waiting for a free slot.
+
+    Yields:
+        AsyncSession: A new session, closed (and its slot released) on exit
+    """
+    async with _semaphores.get(), async_session_maker() as session:
+        yield session
@@ -0,0 +1,209 @@
+"""
+Fast token counting helpers built on the tokenizers litellm selects per model.
+
+litellm's token_counter re-selects the tokenizer and builds a message payload
+on every call. The helpers below keep one tokenizer per model, encode many texts
+in a single batch call and memoize counts, while staying consistent with
+token_counter (including its per-message overhead).
+"""
+
+import hashlib
+from functools import lru_cache
+from typing import Any
+
+from litellm import token_counter
+
+from app.config import config
+from app.utils.lru_cache import LRUCache
+
+
+@lru_cache(maxsize=32)
+def get_tokenizer(model: str) -> dict[str, Any] | None:
+    """
+    Get the tokenizer litellm uses for a model, loading it once per process.
+
+    Args:
+        model: The model name
+
+    Returns:
+        The litellm tokenizer dict ({"type": ..., "tokenizer": ...}) or None if
+        it cannot be resolved (callers then fall back to token_counter)
+    """
+    try:
+        from litellm.utils import _select_tokenizer
+
+        return _select_tokenizer(model=model)
+    except Exception as e:
+        print(
+            f"Warning: Could not load tokenizer for {model}, using token_counter: {e}"
+        )
+        return None
+
+
+@lru_cache(maxsize=32)
+def get_message_token_overhead(model: str) -> int:
+    """
+    Get the tokens token_counter adds around the content of a single user message.
+
+    Args:
+        model: The model name
+
+    Returns:
+        int: Number of overhead tokens
+    """
+    return token_counter(messages=[{"role": "user", "content": ""}], model=model)
+
+
+def encode_texts(texts: list[str], model: str) -> list[list[int]] | None:
+    """
+    Encode several texts with the model's tokenizer in one batch call.
+
+    Args:
+        texts: Texts to encode
+        model: The model name
+
+    Returns:
+        The token IDs of every text, or None if no tokenizer is available
+    """
+    tokenizer_json = get_tokenizer(model)
+    if tokenizer_json is None:
+        return None
+
+    tokenizer = tokenizer_json["tokenizer"]
+    if tokenizer_json["type"] == "openai_tokenizer":
+        return tokenizer.encode_batch(texts, disallowed_special=())
+
+    if hasattr(tokenizer, "encode_batch"):
+        encodings = tokenizer.encode_batch(texts)
+    else:
+        encodings = [tokenizer.encode(text) for text in texts]
+    return [
+        encoding.ids if hasattr(encoding, "ids") else encoding for encoding in encodings
+    ]
+
+
+def count_message_tokens_batch(texts: list[str], model: str) -> list[int]:
+    """
+    Count tokens of texts as if each one was sent as a single user message.
+
+    Equivalent to calling token_counter(messages=[{"role": "user", "content": text}])
+    for every text, but with one tokenizer lookup and one batch encode.
+
+    Args:
+        texts: Message contents
+        model: The model name
+
+    Returns:
+        List of token counts in the same order as texts
+    """
+    if not texts:
+        return []
+
+    encoded_texts = encode_texts(texts, model)
+    if encoded_texts is None:
+        return [
+            token_counter(messages=[{"role": "user", "content": text}], model=model)
+            for text in texts
+        ]
+
+    overhead = get_message_token_overhead(model)
+    return [len(token_ids) + overhead for token_ids in encoded_texts]
+
+
+def truncate_to_token_limit(text: str, max_tokens: int, model: str) -> str:
+    """
+    Cut text to at most max_tokens tokens of the model with a single tokenization.
+
+    The text is encoded once, cut at the token budget and mapped back to text
+    (through character offsets when the tokenizer provides them, otherwise by
+    decoding the kept tokens).
+
+    Args:
+        text: The text to truncate
+        max_tokens: Maximum number of tokens to keep
+        model: The model name
+
+    Returns:
+        The longest prefix of text that fits in max_tokens tokens
+    """
+    if not text or max_tokens <= 0:
+        return ""
+
+    tokenizer_json = get_tokenizer(model)
+    if tokenizer_json is None:
+        # No tokenizer available: estimate the cut from one token count
+        token_count = token_counter(text=text, model=model)
+        if token_count <= max_tokens:
+            return text
+        return text[: int(len(text) * max_tokens / token_count)]
+
+    tokenizer = tokenizer_json["tokenizer"]
+    if tokenizer_json["type"] == "openai_tokenizer":
+        token_ids = tokenizer.encode(text, disallowed_special=())
+        if len(token_ids) <= max_tokens:
+            return text
+        # A cut inside a multi-byte character decodes to a replacement character
+        return tokenizer.decode(token_ids[:max_tokens]).rstrip("\ufffd")
+
+    encoding = tokenizer.encode(text)
+    token_ids = encoding.ids if hasattr(encoding, "ids") else encoding
+    if len(token_ids) <= max_tokens:
+        return text
+    offsets = getattr(encoding, "offsets", None)
+    if offsets:
+        return text[: offsets[max_tokens - 1][1]]
+    return tokenizer.decode(token_ids[:max_tokens])
+
+
+class TokenCountCache(LRUCache[tuple, int]):
+    """
+    LRU cache of token counts keyed by (model, key, content hash).
+
+    Chunks are retrieved again on follow-up turns of a chat, so their token
+    counts are reused instead of re-tokenizing the same content.
+    """
+
+    @staticmethod
+    def make_key(model: str, key: Any, content: str) -> tuple:
+        """Build the cache key; the content hash guards against edited chunks."""
+        content_hash = hashlib.blake2b(content.encode(), digest_size=16).hexdigest()
+        return (model, key, content_hash)
+
+
+token_count_cache = TokenCountCache(max_size=config.TOKEN_COUNT_CACHE_SIZE)
+
+
+def count_message_tokens_cached(
+    texts: list[str], keys: list[Any], model: str
+) -> list[int]:
+    """
+    Count message tokens of texts, reusing memoized counts.
+
+    Args:
+        texts: Message contents
+        keys: Stable identifier of each text (e.g. its chunk_id); None disables
+            memoization for that text
+        model: The model name
+
+    Returns:
+        List of token counts in the same order as texts
+    """
+    counts: list[int | None] = [None] * len(texts)
+    cache_keys: list[tuple | None] = [None] * len(texts)
+    missing: list[int] = []
+
+    for i, (text, key) in enumerate(zip(texts, keys, strict=True)):
+        if key is not None and key != "":
+            cache_keys[i] = token_count_cache.make_key(model, key, text)
+            counts[i] = token_count_cache.get(cache_keys[i])
+        if counts[i] is None:
+            missing.append(i)
+
+    if missing:
+        new_counts = count_message_tokens_batch([texts[i] for i in missing], model)
+        for i, count in zip(missing, new_counts, strict=True):
+            counts[i] = count
+            if cache_keys[i] is not None:
+                token_count_cache.put(cache_keys[i], count)
+
+    return counts
@@ -0,0 +1,299 @@
+"""
+Vector index configuration, query-time search parameters and online rebuilds.
+
+Index parameters come from Config (VECTOR_INDEX_TYPE, HNSW_M,
+HNSW_EF_CONSTRUCTION, IVFFLAT_LISTS, EMBEDDING_STORAGE_MODE) and are used both by
+setup_indexes and by the rebuild command below. Changing them only affects new
+indexes, so existing ones are rebuilt without downtime with:
+
+    python -m app.utils.vector_indexes reindex
+    python -m app.utils.vector_indexes reindex --table chunks
+
+The new index is built with CREATE INDEX CONCURRENTLY next to the old one and
+swapped in by name, so searches keep using the old index until the new one is
+ready, and the old index is dropped concurrently. Partitioned tables are rebuilt
+one partition at a time; only dropping their old parent index locks the table.
+"""
+
+import argparse
+import asyncio
+
+from sqlalchemy import text
+
+from app.config import config
+
+# Vector index name of every table with an embedding column
+VECTOR_INDEXES = {
+    "documents": "document_vector_index",
+    "chunks": "chucks_vector_index",
+}
+
+# Storage modes whose index is re-ranked against the full-precision embeddings
+QUANTIZED_STORAGE_MODES = ("halfvec", "binary")
+# Highest hnsw.ef_search accepted by pgvector
+HNSW_MAX_EF_SEARCH = 1000
+
+
+def _indexed_expression() -> str:
+    """Get the indexed embedding expression and operator class for the storage mode."""
+    dimension = config.embedding_model_instance.dimension
+    if config.EMBEDDING_STORAGE_MODE == "halfvec":
+        return f"((embedding::halfvec({dimension})) public.halfvec_cosine_ops)"
+    if config.EMBEDDING_STORAGE_MODE == "binary":
+        return (
+            f"((binary_quantize(embedding)::bit({dimension})) public.bit_hamming_ops)"
+        )
+    return "(embedding public.vector_cosine_ops)"
+
+
+def vector_index_definition() -> str:
+    """
+    Build the USING ... WITH ... clause of a vector index from the configuration.
+
+    With EMBEDDING_STORAGE_MODE set to halfvec or binary, the index is built on a
+    half-precision or binary-quantized expression of the embedding column.
+
+    Returns:
+        str: The index method, indexed expression and storage parameters
+    """
+    if config.VECTOR_INDEX_TYPE == "ivfflat":
+        return (
+            f"USING ivfflat {_indexed_expression()} "
+            f"WITH (lists = {int(config.IVFFLAT_LISTS)})"
+        )
+    return (
+        f"USING hnsw {_indexed_expression()} "
+        f"WITH (m = {int(config.HNSW_M)}, "
+        f"ef_construction = {int(config.HNSW_EF_CONSTRUCTION)})"
+    )
+
+
+def ann_distance(embedding_column, query_embedding):
+    """
+    Build the distance expression matching the vector index for the storage mode.
+
+    Args:
+        embedding_column: The embedding column (e.g. Chunk.embedding)
+        query_embedding: The query embedding
+
+    Returns:
+        The SQL expression to order by for the ANN first pass
+    """
+    from pgvector.sqlalchemy import BIT, HALFVEC, Vector
+    from sqlalchemy import cast, func, literal
+
+    dimension = config.embedding_model_instance.dimension
+    query_vector = literal(query_embedding, type_=Vector(dimension))
+
+    if config.EMBEDDING_STORAGE_MODE == "halfvec":
+        return cast(embedding_column, HALFVEC(dimension)).op("<=>")(
+            cast(query_vector, HALFVEC(dimension))
+        )
+    if config.EMBEDDING_STORAGE_MODE == "binary":
+        return cast(func.binary_quantize(embedding_column), BIT(dimension)).op("<~>")(
+            cast(func.binary_quantize(query_vector), BIT(dimension))
+        )
+    return embedding_column.op("<=>")(query_embedding)
+
+
+def _rescore_candidates(limit: int) -> int:
+    """Get the number of candidates fetched through a quantized index for limit rows."""
+    return limit * max(1, config.EMBEDDING_RESCORE_FACTOR)
+
+
+def semantic_rank_query(model, query_embedding, conditions: list, limit: int, *columns):
+    """
+    Select the `limit` rows nearest to the query, ranked by cosine distance.
+
+    In full storage mode this is a plain index scan. With a quantized index, a
+    candidate set widened by EMBEDDING_RESCORE_FACTOR is fetched through the
+    quantized index and re-ranked against the full-precision embeddings.
+
+    Args:
+        model: The mapped class with id and embedding columns (Chunk or Document)
+        query_embedding: The query embedding
+        conditions: Filters applied to the rows
+        limit: Number of rows to return
+        *columns: Extra columns of the model to select
+
+    Returns:
+        A select of (id, *columns, rank)
+    """
+    from sqlalchemy import func, select
+
+    if config.EMBEDDING_STORAGE_MODE not in QUANTIZED_STORAGE_MODES:
+        distance = model.embedding.op("<=>")(query_embedding)
+        return (
+            select(
+                model.id, *columns, func.rank().over(order_by=distance).label("rank")
+            )
+            .where(*conditions)
+            .order_by(distance)
+            .limit(limit)
+        )
+
+    candidates = (
+        select(model.id, model.embedding, *columns)
+        .where(*conditions)
+        .order_by(ann_distance(model.embedding, query_embedding))
+        .limit(_rescore_candidates(limit))
+        .subquery()
+    )
+    distance = candidates.c.embedding.op("<=>")(query_embedding)
+    return (
+        select(
+            candidates.c.id,
+            *[candidates.c[column.key] for column in columns],
+            func.rank().over(order_by=distance).label("rank"),
+        )
+        .order_by(distance)
+        .limit(limit)
+    )
+
+
+async def configure_vector_search(
+    session, ef_search: int | None = None, limit: int | None = None
+) -> None:
+    """
+    Set the vector index search parameters for the current transaction.
+
+    With a quantized HNSW index, ef_search is raised to the candidate count of
+    semantic_rank_query, since the index scan returns at most ef_search rows.
+
+    Args:
+        session: The AsyncSession running the search
+        ef_search: HNSW candidate list size (higher is more accurate but slower).
+            Defaults to HNSW_EF_SEARCH; IVFFlat uses IVFFLAT_PROBES instead.
+        limit: Number of rows requested from semantic_rank_query
+    """
+    settings = []
+    if config.VECTOR_INDEX_TYPE == "ivfflat":
+        if config.IVFFLAT_PROBES:
+            settings.append(f"SET LOCAL ivfflat.probes = {int(config.IVFFLAT_PROBES)}")
+    else:
+        ef_search = ef_search or config.HNSW_EF_SEARCH
+        if limit and config.EMBEDDING_STORAGE_MODE in QUANTIZED_STORAGE_MODES:
+            ef_search = max(
+                ef_search, min(_rescore_candidates(limit), HNSW_MAX_EF_SEARCH)
+            )
+        if ef_search:
+            settings.append(f"SET LOCAL hnsw.ef_search = {int(ef_search)}")
+
+    # pgvector >= 0.8 keeps scanning until enough rows pass the filters
+    if config.HNSW_ITERATIVE_SCAN in ("relaxed_order", "strict_order"):
+        index_type = "ivfflat" if config.VECTOR_INDEX_TYPE == "ivfflat" else "hnsw"
+        iterative_scan = config.HNSW_ITERATIVE_SCAN
+        if index_type == "ivfflat":
+            # IVFFlat only supports relaxed ordering
+            iterative_scan = "relaxed_order"
+        settings.append(f"SET LOCAL {index_type}.iterative_scan = {iterative_scan}")
+
+    for setting in settings:
+        await session.execute(text(setting))
+
+
+async def _partitions(conn, table: str) -> list[str]:
+    """Get the partitions of a table (empty if it is not partitioned)."""
+    result = await conn.execute(
+        text(
+            "SELECT c.relname FROM pg_inherits i "
+            "JOIN pg_class c ON c.oid = i.inhrelid "
+            "JOIN pg_partitioned_table pt ON pt.partrelid = i.inhparent "
+            "WHERE i.inhparent = CAST(:table AS regclass) ORDER BY c.relname"
+        ),
+        {"table": table},
+    )
+    return [row[0] for row in result.all()]
+
+
+async def _replace_index(conn, table: str, index_name: str) -> None:
+    """Build a new index next to index_name and swap it in by name."""
+    new_index_name = f"{index_name}_rebuild"
+    definition = vector_index_definition()
+
+    partitions = await _partitions(conn, table)
+    # DROP INDEX CONCURRENTLY is not supported on partitioned indexes
+    drop_index = (
+        "DROP INDEX IF EXISTS" if partitions else "DROP INDEX CONCURRENTLY IF EXISTS"
+    )
+
+    # Leftover of an interrupted rebuild
+    await conn.execute(text(f"{drop_index} {new_index_name}"))
+
+    if not partitions:
+        await conn.execute(
+            text(f"CREATE INDEX CONCURRENTLY {new_index_name} ON {table} {definition}")
+        )
+    else:
+        # CONCURRENTLY is not supported on a partitioned parent: create an
+        # invalid parent index, then build and attach one index per partition
+        await conn.execute(
+            text(f"CREATE INDEX {new_index_name} ON ONLY {table} {definition}")
+        )
+        for partition in partitions:
+            partition_index_name = f"{partition}_{index_name}_rebuild"
+            print(f"Building {partition_index_name}...")
+            await conn.execute(
+                text(f"DROP INDEX CONCURRENTLY IF EXISTS {partition_index_name}")
+            )
+            await conn.execute(
+                text(
+                    f"CREATE INDEX CONCURRENTLY {partition_index_name} "
+                    f"ON {partition} {definition}"
+                )
+            )
+            await conn.execute(
+                text(
+                    f"ALTER INDEX {new_index_name} "
+                    f"ATTACH PARTITION {partition_index_name}"
+                )
+            )
+
+    # Drop the old index and take over its name. On a partitioned table this
+    # briefly takes an ACCESS EXCLUSIVE lock on the table and its partitions,
+    # so it waits for (and blocks queries behind) running long queries
+    await conn.execute(text(f"{drop_index} {index_name}"))
+    await conn.execute(text(f"ALTER INDEX {new_index_name} RENAME TO {index_name}"))
+
+
+async def reindex_vector_indexes(tables: list[str] | None = None) -> None:
+    """
+    Rebuild vector indexes with the configured parameters without blocking writes.
+
+    Args:
+        tables: Tables whose vector index should be rebuilt (defaults to all)
+    """
+    from app.db import engine
+
+    async with engine.connect() as conn:
+        # CREATE INDEX CONCURRENTLY cannot run inside a transaction
+        conn = await conn.execution_options(isolation_level="AUTOCOMMIT")
+        for table in tables or list(VECTOR_INDEXES):
+            index_name = VECTOR_INDEXES[table]
+            print(f"Rebuilding {index_name} on {table} {vector_index_definition()}...")
+            await _replace_index(conn, table, index_name)
+            print(f"Rebuilt {index_name}")
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Manage pgvector indexes")
+    subparsers = parser.add_subparsers(dest="command", required=True)
+
+    reindex_parser = subparsers.add_parser(
+        "reindex", help="Rebuild vector indexes concurrently with the current config"
+    )
+    reindex_parser.add_argument(
+        "--table",
+        action="append",
+        choices=list(VECTOR_INDEXES),
+        help="Table to rebuild (can be repeated, defaults to all)",
+    )
+
+    args = parser.parse_args()
+
+    if args.command == "reindex":
+        asyncio.run(reindex_vector_indexes(args.table))
+
+
+if __name__ == "__main__":
+    main()